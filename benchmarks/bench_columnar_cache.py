@@ -0,0 +1,73 @@
+"""Cold vs. warm "All Gameweeks" load with the Arrow sidecar cache.
+
+Run from the project root:
+
+    python benchmarks/bench_columnar_cache.py
+
+"cold" parses every weekly CSV (no sidecars), "warm" reads the sidecars
+written by the cold pass. Sidecars go to a temporary directory so the
+project cache is left untouched.
+"""
+
+import glob
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_loader  # noqa: E402
+from config import WEEKLY_PREDICTIONS_DIR  # noqa: E402
+
+
+def time_all_weeks(load_fn, files, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for f_path in files:
+            load_fn(f_path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    files = sorted(glob.glob(os.path.join(WEEKLY_PREDICTIONS_DIR, "[0-9]*.csv")))
+    if not files:
+        print(f"No weekly files found in {WEEKLY_PREDICTIONS_DIR}")
+        return
+
+    total_mb = sum(os.path.getsize(f) for f in files) / 1e6
+    print(f"{len(files)} weekly files, {total_mb:.1f} MB of CSV")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        data_loader.COLUMNAR_CACHE_DIR = Path(cache_dir)
+        data_loader.GRADE_STORE_DIR = Path(cache_dir) / "grades"
+
+        cold_parse = time_all_weeks(data_loader._parse_weekly_file, files)
+        start = time.perf_counter()
+        for f_path in files:
+            data_loader.read_weekly_frame(f_path)
+        first_load = time.perf_counter() - start
+        warm_read = time_all_weeks(data_loader.read_weekly_frame, files)
+
+        # Bypass st.cache_data so every call really loads the week
+        def load_uncached(f_path):
+            return data_loader._load_data_from_csv.__wrapped__(f_path, None, True)
+
+        warm_full = time_all_weeks(load_uncached, files)
+        data_loader.PYARROW_AVAILABLE = False
+        cold_full = time_all_weeks(load_uncached, files)
+        data_loader.PYARROW_AVAILABLE = True
+
+    print(f"CSV parse + coercion (cold):      {cold_parse * 1000:8.1f} ms")
+    print(f"first load (parse + write cache): {first_load * 1000:8.1f} ms")
+    print(f"sidecar read (warm):              {warm_read * 1000:8.1f} ms")
+    print(f"  -> speed-up {cold_parse / warm_read:.1f}x")
+    print(f"load_data_from_csv, cold:         {cold_full * 1000:8.1f} ms")
+    print(f"load_data_from_csv, warm:         {warm_full * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Cost of refreshing the incremental combined store.
+
+Run from the project root:
+
+    python benchmarks/bench_combined_store.py
+
+Works on a temporary copy of the weekly CSVs and a temporary store, and
+times: a full build, a refresh with nothing changed, a refresh after a file
+is only touched, a refresh after a new week is added, publishing that
+snapshot and mapping it into a frame, whose weeks are graded into an
+empty grade store.
+"""
+
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_loader  # noqa: E402
+from config import WEEKLY_PREDICTIONS_DIR  # noqa: E402
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"{label:<34} {(time.perf_counter() - start) * 1000:8.1f} ms")
+    return result
+
+
+def main():
+    sources = sorted(glob.glob(os.path.join(WEEKLY_PREDICTIONS_DIR, "[0-9]*.csv")))
+    if not sources:
+        print(f"No weekly files found in {WEEKLY_PREDICTIONS_DIR}")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        week_dir = Path(tmp_dir) / "pre_match"
+        week_dir.mkdir()
+        for f_path in sources:
+            shutil.copy2(f_path, week_dir)
+        store_dir = Path(tmp_dir) / "combined"
+        data_loader.COLUMNAR_CACHE_DIR = Path(tmp_dir) / "sidecars"
+        data_loader.GRADE_STORE_DIR = Path(tmp_dir) / "grades"
+
+        def refresh():
+            return data_loader._refresh_combined_store(week_dir, store_dir)
+
+        timed(f"full build ({len(sources)} weeks)", refresh)
+        timed("refresh, nothing changed", refresh)
+
+        latest = week_dir / os.path.basename(sources[-1])
+        os.utime(latest)
+        timed("refresh, latest week touched", refresh)
+
+        next_week = int(latest.stem) + 1
+        shutil.copyfile(latest, week_dir / f"{next_week}.csv")
+        entries = timed(f"refresh, week {next_week} added", refresh)
+
+        snapshot_path = timed(
+            "publish snapshot",
+            lambda: data_loader.publish_combined_snapshot(store_dir, entries),
+        )
+        combined = timed(
+            "map snapshot",
+            lambda: data_loader.read_combined_store.__wrapped__(
+                str(snapshot_path), str(week_dir), entries
+            ),
+        )
+        print(f"{len(entries)} partitions, {len(combined)} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Disk footprint and parse time of the weekly files in each stored form.
+
+Run from the project root:
+
+    python benchmarks/bench_compressed_weeks.py
+
+The weeks are copied into a temporary directory and converted with
+compress_week_file. For each form it prints the total size and the time to
+parse every week into its typed frame (no Arrow sidecars involved). The OS
+page cache is not dropped, so the times show decompression and parsing
+cost rather than disk reads.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_loader  # noqa: E402
+from config import WEEKLY_PREDICTIONS_DIR  # noqa: E402
+
+
+def main():
+    weeks = data_loader.list_week_files(WEEKLY_PREDICTIONS_DIR)
+    sources = [f_path for _, f_path in weeks]
+    if not sources:
+        print(f"No weekly files found in {WEEKLY_PREDICTIONS_DIR}")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for suffix in (".csv", ".csv.gz", ".csv.zst", ".parquet"):
+            week_dir = Path(tmp_dir) / suffix.strip(".")
+            week_dir.mkdir()
+            files = []
+            for f_path in sources:
+                copy = week_dir / os.path.basename(f_path)
+                shutil.copyfile(f_path, copy)
+                if suffix != data_loader.week_file_suffix(copy):
+                    converted = data_loader.compress_week_file(copy, suffix)
+                    copy.unlink()
+                    copy = converted
+                files.append(copy)
+
+            size_mb = sum(os.path.getsize(f_path) for f_path in files) / 1024 / 1024
+            timings = []
+            for _ in range(3):
+                start = time.perf_counter()
+                for f_path in files:
+                    data_loader._parse_weekly_file(f_path)
+                timings.append(time.perf_counter() - start)
+            print(
+                f"{suffix:>9}: {size_mb:5.2f} MB on disk, "
+                f"parse all weeks {min(timings) * 1000:7.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
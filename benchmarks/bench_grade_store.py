@@ -0,0 +1,108 @@
+"""Grading every week on a cold start: from scratch vs. the grade store.
+
+Run from the project root:
+
+    python benchmarks/bench_grade_store.py [--backfilled 5]
+
+Prepares every week, then grades all of them three ways, clearing grading's
+in-memory caches first each time as a restart would:
+
+- "no store": grading.add_grade_columns grades every prediction;
+- "first run": data_loader.add_stored_grades with an empty store grades
+  everything and writes the stores;
+- "restart": the same call reuses every stored grade.
+
+Last, --backfilled matches per week get a changed HomeGoals, as when a week
+is rewritten with results, and only those are graded again. Grades must
+equal add_grade_columns' every time. Stores go to a temporary directory so
+the project cache is left untouched.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import data_loader  # noqa: E402
+import grading  # noqa: E402
+from bench_grading import clear_caches  # noqa: E402
+from config import WEEKLY_PREDICTIONS_DIR  # noqa: E402
+
+
+def grade_all(grade, files, frames):
+    """Seconds to grade every week with ``grade``, after a cache clear."""
+    clear_caches()
+    start = time.perf_counter()
+    graded = [grade(df, f_path) for f_path, df in zip(files, frames)]
+    return time.perf_counter() - start, graded
+
+
+def assert_same_grades(graded, expected):
+    for df, expected_df in zip(graded, expected):
+        for grade_column in grading.GRADE_COLUMNS:
+            if grade_column in expected_df.columns:
+                assert df[grade_column].equals(expected_df[grade_column]), (
+                    f"{grade_column}: stored grades differ"
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backfilled", type=int, default=5)
+    args = parser.parse_args()
+
+    files = sorted(glob.glob(os.path.join(WEEKLY_PREDICTIONS_DIR, "[0-9]*.csv")))
+    frames = [
+        data_loader.prepare_week_frame(data_loader.read_weekly_frame(f_path))
+        for f_path in files
+    ]
+    print(f"{len(files)} weeks, {sum(map(len, frames))} matches")
+
+    with tempfile.TemporaryDirectory() as store_dir:
+        data_loader.GRADE_STORE_DIR = Path(store_dir)
+
+        def stored(df, f_path):
+            return data_loader.add_stored_grades(df, f_path)
+
+        def from_scratch(df, f_path):
+            return grading.add_grade_columns(df)
+
+        plain_s, expected = grade_all(from_scratch, files, frames)
+        print(f"no store:   {plain_s * 1000:8.1f} ms")
+        for run in ("first run", "restart"):
+            before = data_loader.grade_store_stats()
+            run_s, graded = grade_all(stored, files, frames)
+            assert_same_grades(graded, expected)
+            after = data_loader.grade_store_stats()
+            print(
+                f"{run + ':':11s}{run_s * 1000:8.1f} ms "
+                f"({after['graded'] - before['graded']} graded, "
+                f"{after['reused'] - before['reused']} reused)"
+            )
+
+        backfilled = []
+        for df in frames:
+            df = df.copy()
+            rows = df.index[: args.backfilled]
+            df.loc[rows, "HomeGoals"] = df.loc[rows, "HomeGoals"].fillna(0) + 1
+            backfilled.append(df)
+        _, expected = grade_all(from_scratch, files, backfilled)
+        before = data_loader.grade_store_stats()
+        run_s, graded = grade_all(stored, files, backfilled)
+        assert_same_grades(graded, expected)
+        after = data_loader.grade_store_stats()
+        print(
+            f"backfilled: {run_s * 1000:7.1f} ms "
+            f"({after['graded'] - before['graded']} graded, "
+            f"{after['reused'] - before['reused']} reused)"
+        )
+
+
+if __name__ == "__main__":
+    main()
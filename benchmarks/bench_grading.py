@@ -0,0 +1,131 @@
+"""Grading throughput: the legacy grader vs. grading, per call and in batch.
+
+Run from the project root:
+
+    python benchmarks/bench_grading.py [--columns rec_prediction value_bets]
+        [--repeat 3]
+
+Loads every week, then grades each column over all rows three ways: row by
+row with legacy_grading.check_prediction_success (as the pages did over
+iterrows), row by row with grading.grade_prediction, and in one call to
+grading.grade_frame. All three must agree row for row; the best of --repeat
+runs is printed in predictions per second. grade_prediction and grade_frame
+run with their caches cleared first, so each measures a cold start. The hit
+rate of the parse_prediction cache is printed at the end. See
+diff_grading.py for the full differential check.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import pandas as pd  # noqa: E402
+
+import data_loader  # noqa: E402
+import grading  # noqa: E402
+import legacy_grading  # noqa: E402
+from config import WEEKLY_PREDICTIONS_DIR  # noqa: E402
+
+COLUMNS = list(grading.GRADED_COLUMNS)
+
+
+def legacy_rows(df, column):
+    grades = []
+    for _, match in df.iterrows():
+        prediction = match.get(column)
+        grades.append(
+            legacy_grading.check_prediction_success(
+                None if pd.isna(prediction) else prediction,
+                match.get("HomeGoals"),
+                match.get("AwayGoals"),
+                match.get("Corners"),
+                match.get("YellowCards"),
+                match.get("home_team"),
+                match.get("away_team"),
+                match.get("HomeYellowsResults"),
+                match.get("AwayYellowsResults"),
+                match.get("HomeRedsResults"),
+                match.get("AwayRedsResults"),
+            )
+            or "PENDING"
+        )
+    return grades
+
+
+def scalar_rows(records, column):
+    return [
+        grading.grade_prediction(
+            None if pd.isna(match[column]) else match[column],
+            *(match.get(name) for name in grading.RESULT_COLUMNS.values()),
+        )
+        for match in records
+    ]
+
+
+def clear_caches():
+    for cached in (
+        grading.parse_prediction,
+        grading._lowered,
+        grading._cleaned_name,
+        grading._team_name,
+        grading._grade_match,
+        grading.bet_text,
+    ):
+        cached.cache_clear()
+
+
+def best_of(repeat, run):
+    """Fastest of ``repeat`` timed runs, and the last run's result."""
+    best = float("inf")
+    for _ in range(repeat):
+        clear_caches()
+        start = time.perf_counter()
+        result = run()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--columns", nargs="+", default=COLUMNS)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    files = sorted(glob.glob(os.path.join(WEEKLY_PREDICTIONS_DIR, "[0-9]*.csv")))
+    df = pd.concat(
+        [data_loader.load_data_from_csv(f_path) for f_path in files],
+        ignore_index=True,
+    )
+    records = df.to_dict("records")
+    print(f"{len(files)} weeks, {len(df)} rows, predictions per second:")
+    print("         column      legacy  grade_prediction  grade_frame")
+
+    for column in args.columns:
+        if column not in df.columns:
+            continue
+        legacy_s, expected = best_of(1, lambda: legacy_rows(df, column))
+        scalar_s, scalar = best_of(args.repeat, lambda: scalar_rows(records, column))
+        batch_s, batch = best_of(
+            args.repeat, lambda: grading.grade_frame(df, column).tolist()
+        )
+        assert scalar == expected, f"{column}: grade_prediction differs"
+        assert batch == expected, f"{column}: grade_frame differs"
+        print(
+            f"{column:>15}: {len(df) / legacy_s:10.0f}  "
+            f"{len(df) / scalar_s:16.0f}  {len(df) / batch_s:11.0f} "
+            f"({legacy_s / batch_s:5.1f}x)"
+        )
+    stats = grading.parse_cache_stats()
+    print(
+        f"parse cache: {stats['size']} specs, {stats['hits']} hits, "
+        f"{stats['misses']} misses ({stats['hit_rate']:.1%})"
+    )
+
+
+if __name__ == "__main__":
+    main()
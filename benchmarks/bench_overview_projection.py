@@ -0,0 +1,75 @@
+"""Match Analysis week load: full frame vs. the overview projection.
+
+Run from the project root:
+
+    python benchmarks/bench_overview_projection.py
+
+Sidecars are built first, so both variants read warm Arrow files. For the
+largest week it times the frame load plus the records conversion the page
+does, and the on-demand load of one match's full row for the detail view.
+"""
+
+import glob
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd  # noqa: E402
+
+import data_loader  # noqa: E402
+from config import WEEKLY_PREDICTIONS_DIR  # noqa: E402
+from schema import OVERVIEW_COLUMNS  # noqa: E402
+
+
+def best_of(fn, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000, result
+
+
+def to_records(df):
+    return df.astype(object).where(pd.notnull(df), None).to_dict("records")
+
+
+def main():
+    files = glob.glob(os.path.join(WEEKLY_PREDICTIONS_DIR, "[0-9]*.csv"))
+    if not files:
+        print(f"No weekly files found in {WEEKLY_PREDICTIONS_DIR}")
+        return
+    f_path = max(files, key=os.path.getsize)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        data_loader.COLUMNAR_CACHE_DIR = Path(cache_dir)
+        data_loader.GRADE_STORE_DIR = Path(cache_dir) / "grades"
+        data_loader.read_weekly_frame(f_path)
+
+        for label, columns in (("full", None), ("overview", OVERVIEW_COLUMNS)):
+            def load():
+                df = data_loader._load_data_from_csv.__wrapped__(
+                    f_path, None, True, columns
+                )
+                return df, to_records(df)
+
+            ms, (df, _) = best_of(load)
+            frame_mb = df.memory_usage(deep=True).sum() / 1e6
+            print(
+                f"{label:>8}: {df.shape[1]:3d} columns, frame {frame_mb:5.1f} MB, "
+                f"load + records {ms:7.1f} ms"
+            )
+
+        match_id = df["match_id"].iloc[len(df) // 2]
+        ms, details = best_of(
+            lambda: data_loader._load_match_details.__wrapped__(f_path, None, match_id)
+        )
+        print(f"  detail: {len(details)} columns for one match, {ms:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Serial vs. threaded ingest of a season's worth of weekly CSVs.
+
+Run from the project root:
+
+    python benchmarks/bench_parallel_ingest.py [--weeks 50]
+
+The existing weeks are copied into a temporary directory (repeating them
+until there are --weeks files) so the run does not depend on how much of
+the season has been exported yet. Each run builds the combined store from
+scratch with data_loader._refresh_combined_store into an empty store
+directory, with INGEST_WORKERS set to the worker count: "cold" parses every
+CSV, "warm" reads the Arrow sidecars written by the cold pass, as a rebuild
+after a COMBINED_STORE_VERSION bump does.
+"""
+
+import argparse
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_loader  # noqa: E402
+from config import WEEKLY_PREDICTIONS_DIR  # noqa: E402
+
+
+def time_load(week_dir, workers, cold, tmp_dir):
+    if cold:
+        shutil.rmtree(data_loader.COLUMNAR_CACHE_DIR, ignore_errors=True)
+    store_dir = Path(tmp_dir) / "combined"
+    shutil.rmtree(store_dir, ignore_errors=True)
+    data_loader.INGEST_WORKERS = workers
+    start = time.perf_counter()
+    entries = data_loader._refresh_combined_store(week_dir, store_dir)
+    return time.perf_counter() - start, sum(entry["rows"] for entry in entries)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--weeks", type=int, default=50)
+    args = parser.parse_args()
+
+    sources = sorted(glob.glob(os.path.join(WEEKLY_PREDICTIONS_DIR, "[0-9]*.csv")))
+    if not sources:
+        print(f"No weekly files found in {WEEKLY_PREDICTIONS_DIR}")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        week_dir = Path(tmp_dir) / "pre_match"
+        week_dir.mkdir()
+        for week in range(1, args.weeks + 1):
+            f_path = week_dir / f"{week}.csv"
+            shutil.copyfile(sources[(week - 1) % len(sources)], f_path)
+        data_loader.COLUMNAR_CACHE_DIR = Path(tmp_dir) / "cache"
+        data_loader.GRADE_STORE_DIR = Path(tmp_dir) / "grades"
+
+        print(f"{args.weeks} weeks, {os.cpu_count()} CPUs")
+        for workers in sorted({1, 2, 4, 8, os.cpu_count() or 1}):
+            cold, rows = time_load(week_dir, workers, True, tmp_dir)
+            warm, _ = time_load(week_dir, workers, False, tmp_dir)
+            print(
+                f"workers={workers:<2}  cold {cold * 1000:8.1f} ms  "
+                f"warm {warm * 1000:7.1f} ms  ({rows} rows)"
+            )
+
+
+if __name__ == "__main__":
+    main()
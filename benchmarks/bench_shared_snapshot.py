@@ -0,0 +1,92 @@
+"""Memory per concurrent session for the combined Results Analysis frame.
+
+Run from the project root:
+
+    python benchmarks/bench_shared_snapshot.py [--sessions 8] [--processes 3]
+
+Works on a temporary copy of the store. A first process builds and
+publishes the snapshot. Then each of --processes worker processes loads the
+combined frame once, as the first session, and again for each further
+session, keeping every frame alive the way concurrent sessions would. The
+workers print their RSS growth and, where /proc is available, their
+proportional set size (PSS): pages mapped by several processes are split
+between them.
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+
+def memory_mb():
+    """Current RSS and PSS in MB; peak RSS and no PSS without /proc."""
+    try:
+        with open("/proc/self/smaps_rollup", encoding="ascii") as f:
+            fields = dict(line.split(":", 1) for line in f if ":" in line)
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, None
+    rss_kb, pss_kb = (int(fields[name].split()[0]) for name in ("Rss", "Pss"))
+    return rss_kb / 1024, pss_kb / 1024
+
+
+def run_worker(cache_dir, sessions):
+    import data_loader
+    from config import WEEKLY_PREDICTIONS_DIR
+
+    data_loader.COLUMNAR_CACHE_DIR = Path(cache_dir) / "sidecars"
+    data_loader.COMBINED_STORE_DIR = Path(cache_dir) / "combined"
+    data_loader.GRADE_STORE_DIR = Path(cache_dir) / "grades"
+
+    start_rss, _ = memory_mb()
+    frames = [data_loader.load_combined_data(WEEKLY_PREDICTIONS_DIR)]
+    first_rss, _ = memory_mb()
+    for _ in range(sessions - 1):
+        frames.append(data_loader.load_combined_data(WEEKLY_PREDICTIONS_DIR))
+    last_rss, last_pss = memory_mb()
+
+    per_session = (last_rss - first_rss) / max(1, sessions - 1)
+    pss = f", PSS {last_pss:6.1f} MB" if last_pss is not None else ""
+    print(
+        f"pid {os.getpid()}: first session +{first_rss - start_rss:5.1f} MB, "
+        f"each further session +{per_session:4.1f} MB RSS{pss}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--processes", type=int, default=3)
+    args = parser.parse_args()
+
+    import data_loader
+    from config import WEEKLY_PREDICTIONS_DIR
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        data_loader.COLUMNAR_CACHE_DIR = Path(cache_dir) / "sidecars"
+        data_loader.COMBINED_STORE_DIR = Path(cache_dir) / "combined"
+        data_loader.GRADE_STORE_DIR = Path(cache_dir) / "grades"
+        data_loader.load_combined_data(WEEKLY_PREDICTIONS_DIR)
+
+        workers = [
+            subprocess.Popen(
+                [sys.executable, __file__, "--worker", cache_dir, str(args.sessions)],
+                stderr=subprocess.DEVNULL,
+            )
+            for _ in range(args.processes)
+        ]
+        for worker in workers:
+            worker.wait()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--worker":
+        run_worker(sys.argv[2], int(sys.argv[3]))
+    else:
+        main()
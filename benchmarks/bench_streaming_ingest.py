@@ -0,0 +1,100 @@
+"""Peak RSS while ingesting one very large weekly CSV: whole file vs. streamed.
+
+Run from the project root:
+
+    python benchmarks/bench_streaming_ingest.py [--sizes 10 40]
+
+Builds synthetic weeks of roughly --sizes MB by repeating the largest real
+week under fresh match_ids (a tenth of the rows are repeated as
+duplicates). Each file and mode runs in its own subprocess so ru_maxrss
+reflects that ingest alone: "whole" parses the file into a frame,
+deduplicates it and writes the Arrow partition, "streamed" goes through
+stream_weekly_csv.
+"""
+
+import argparse
+import csv
+import glob
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+
+def build_week(source, target, size_mb):
+    with open(source, newline="", encoding="utf-8") as f:
+        header, *rows = csv.reader(f)
+    id_index = header.index("match_id")
+    with open(target, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        copy = 0
+        while f.tell() < size_mb * 1024 * 1024:
+            for i, row in enumerate(rows):
+                row = list(row)
+                row[id_index] = str(copy * 100_000 + i)
+                writer.writerow(row)
+                if i % 10 == 0:
+                    writer.writerow(row)
+            copy += 1
+
+
+def run_mode(mode, f_path, out_dir):
+    import data_loader
+
+    out_path = Path(out_dir) / f"{mode}.arrow"
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if mode == "whole":
+        df = data_loader.prepare_week_frame(data_loader._parse_weekly_file(f_path))
+        df.to_feather(out_path, compression="uncompressed")
+        rows = len(df)
+    else:
+        rows = data_loader.stream_weekly_csv(f_path, out_path, clean_predictions=True)[
+            "rows"
+        ]
+    elapsed = time.perf_counter() - start
+    peak_mb = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_kb) / 1024
+    size_mb = os.path.getsize(f_path) / 1024 / 1024
+    print(
+        f"{size_mb:6.1f} MB {mode:>8}: {elapsed * 1000:8.1f} ms, "
+        f"peak RSS +{peak_mb:6.1f} MB ({rows} rows)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 40])
+    args = parser.parse_args()
+
+    from config import WEEKLY_PREDICTIONS_DIR
+
+    files = glob.glob(os.path.join(WEEKLY_PREDICTIONS_DIR, "[0-9]*.csv"))
+    if not files:
+        print(f"No weekly files found in {WEEKLY_PREDICTIONS_DIR}")
+        return
+    source = max(files, key=os.path.getsize)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size_mb in args.sizes:
+            f_path = os.path.join(tmp_dir, f"{size_mb}.csv")
+            build_week(source, f_path, size_mb)
+            for mode in ("whole", "streamed"):
+                subprocess.run(
+                    [sys.executable, __file__, "--mode", mode, f_path, tmp_dir],
+                    check=True,
+                    stderr=subprocess.DEVNULL,
+                )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 5 and sys.argv[1] == "--mode":
+        run_mode(sys.argv[2], sys.argv[3], sys.argv[4])
+    else:
+        main()
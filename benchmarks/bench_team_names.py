@@ -0,0 +1,180 @@
+"""Team-name predictions through the grader: latency and literal matching.
+
+Run from the project root:
+
+    python benchmarks/bench_team_names.py [--groups 8]
+
+Grades predictions that name a team ("<team> or Draw", "<team> Over 1.5",
+"<team> +1.5 Handicap", ...) for every match of every week, with the
+match's own teams, through grading.grade_prediction and through
+the legacy check_prediction_success, which builds patterns from team names.
+Teams are split into --groups in order of first appearance and the median
+per-call latency of each group is printed: it should stay flat as more
+distinct names go through the grader.
+
+Every name, plus made-up names full of regex metacharacters, is then
+fuzzed: a prediction must grade the same with the real name as with a
+plain placeholder name in its place. Names containing a market word are
+skipped. How many names check_prediction_success misgrades, or fails on
+with a pattern error, is printed for comparison.
+"""
+
+import argparse
+import glob
+import os
+import re
+import statistics
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import pandas as pd  # noqa: E402
+
+import data_loader  # noqa: E402
+import grading  # noqa: E402
+import legacy_grading  # noqa: E402
+from config import WEEKLY_PREDICTIONS_DIR  # noqa: E402
+
+TEMPLATES = [
+    "{team}",
+    "{team} Win",
+    "{team} or Draw",
+    "Draw or {team}",
+    "{team} Over 1.5",
+    "{team} Under 0.5 Goals",
+    "{team} +1.5 Handicap",
+    "{team} Clean Sheet",
+    "{team} to Win to Nil",
+    "{team} & Over 1.5 Goals",
+    "{team} or {other}",
+]
+MATCH_COLUMNS = ["match_id", "home_team", "away_team"]
+SCORES = [(2, 0), (1, 1), (0, 2), (0, 0), (3, 1)]
+METACHARACTER_NAMES = [
+    "Atl. Madrid",
+    "Brighton & Hove",
+    "C++ Rovers",
+    "(a+)+b",
+    "Team [B]",
+    "a|b",
+    "St.* Pauli",
+    "Real $ociedad ^",
+    "\\d United",
+    "?",
+]
+PLACEHOLDER = "placeholder"
+OPPONENT = "opponent"
+# Names containing a market word legitimately change what a prediction says
+# ("Home United or Draw", "DC United"), so the fuzz skips them
+MARKET_WORDS = re.compile(
+    r"\b(home|away|draw|or|and|win|nil|yes|no|dc|btts|gg|ng|o|u|over|under|x|1|2)\b"
+)
+
+
+def timed_calls(grader, matches):
+    latencies = []
+    for prediction, home, away, hg, ag in matches:
+        start = time.perf_counter()
+        grader(prediction, home, away, hg, ag)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def grade_new(prediction, home, away, hg, ag):
+    return grading.grade_prediction(prediction, hg, ag, None, home, away)
+
+
+def grade_old(prediction, home, away, hg, ag):
+    try:
+        return legacy_grading.check_prediction_success(
+            prediction, hg, ag, None, None, home, away, None, None, None, None
+        )
+    except re.error:
+        return "ERROR"  # The team name is not a valid pattern
+
+
+def team_predictions(team, other):
+    return [template.format(team=team, other=other) for template in TEMPLATES]
+
+
+def fuzz(grader, names):
+    """Names for which some prediction grades unlike with PLACEHOLDER."""
+    misgraded = []
+    for name in names:
+        cases = [
+            ((name, OPPONENT), (PLACEHOLDER, OPPONENT)),
+            ((OPPONENT, name), (OPPONENT, PLACEHOLDER)),
+        ]
+        if any(
+            grader(prediction, *teams, hg, ag)
+            != grader(expected, *expected_teams, hg, ag)
+            for teams, expected_teams in cases
+            for hg, ag in SCORES
+            for prediction, expected in zip(
+                team_predictions(name, OPPONENT),
+                team_predictions(PLACEHOLDER, OPPONENT),
+            )
+        ):
+            misgraded.append(name)
+    return misgraded
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--groups", type=int, default=8)
+    args = parser.parse_args()
+
+    files = sorted(glob.glob(os.path.join(WEEKLY_PREDICTIONS_DIR, "[0-9]*.csv")))
+    df = pd.concat(
+        [
+            data_loader.load_data_from_csv(f_path, columns=MATCH_COLUMNS)
+            for f_path in files
+        ],
+        ignore_index=True,
+    ).dropna(subset=["home_team", "away_team"])
+
+    # Calls grouped by the first appearance of the team they name
+    first_seen = {}
+    calls = []
+    for i, (home, away) in enumerate(zip(df["home_team"], df["away_team"])):
+        hg, ag = SCORES[i % len(SCORES)]
+        for team, other in ((home, away), (away, home)):
+            first_seen.setdefault(team, len(first_seen))
+            for prediction in team_predictions(team, other):
+                calls.append((first_seen[team], (prediction, home, away, hg, ag)))
+    group_size = -(-len(first_seen) // args.groups)
+    groups = [[] for _ in range(args.groups)]
+    for team_index, call in calls:
+        groups[team_index // group_size].append(call)
+
+    print(
+        f"{len(files)} weeks, {len(df)} matches, {len(first_seen)} teams, "
+        f"{len(calls)} calls"
+    )
+    print("      teams   calls  grade_prediction  check_prediction_success")
+    for n, matches in enumerate(groups):
+        new_us = statistics.median(timed_calls(grade_new, matches)) * 1e6
+        old_us = statistics.median(timed_calls(grade_old, matches)) * 1e6
+        first = n * group_size
+        last = min(first + group_size, len(first_seen))
+        print(
+            f"{first:5d}-{last:<5d}  {len(matches):6d}  "
+            f"{new_us:13.1f} us  {old_us:21.1f} us"
+        )
+
+    names = [
+        name
+        for name in [*first_seen, *METACHARACTER_NAMES]
+        if not MARKET_WORDS.search(name.lower())
+    ]
+    misgraded = fuzz(grade_new, names)
+    assert not misgraded, f"grade_prediction misgrades {misgraded[:5]}"
+    print(f"fuzz: {len(names)} names grade like a placeholder name")
+    old_misgraded = fuzz(grade_old, names)
+    print(f"check_prediction_success misgrades {len(old_misgraded)} of them")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Parsing a large text feed serially vs. on a process pool.
+
+Run from the project root:
+
+    python benchmarks/bench_text_parallel.py [--blocks 40000] [--workers 2 4]
+
+Writes a synthetic feed of --blocks match blocks (see bench_text_parser),
+then times text_feed.iter_feed and text_feed.parse_feed_parallel with each
+worker count, checking that the parallel result is identical, match_ids
+and order included. Pool start-up is part of the parallel timings.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import text_feed  # noqa: E402
+from bench_text_parser import synthetic_feed  # noqa: E402
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--blocks", type=int, default=40_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4])
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        f_path = os.path.join(tmp_dir, "feed.txt")
+        with open(f_path, "w", encoding="utf-8") as f:
+            f.write(synthetic_feed(args.blocks))
+        size_mb = os.path.getsize(f_path) / 1024 / 1024
+
+        serial_s, expected = timed(lambda: list(text_feed.iter_feed(f_path)))
+        print(f"{size_mb:6.1f} MB   serial: {serial_s * 1000:8.1f} ms")
+        for workers in args.workers:
+            elapsed, matches = timed(
+                lambda: text_feed.parse_feed_parallel(f_path, workers)
+            )
+            assert matches == expected, "parallel parse differs from serial"
+            print(
+                f"{size_mb:6.1f} MB {workers:2d} procs: {elapsed * 1000:8.1f} ms "
+                f"({serial_s / elapsed:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
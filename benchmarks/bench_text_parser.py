@@ -0,0 +1,133 @@
+"""Parsing a Confidence text feed: the if/elif chain vs. text_feed.
+
+Run from the project root:
+
+    python benchmarks/bench_text_parser.py [--blocks 10000]
+
+Builds a synthetic feed of --blocks match blocks (varied teams, leagues and
+numbers) and times a full parse with the original line-by-line chain, the
+Match Analysis page's load_data_from_text frozen in legacy_text_parser.py,
+and with text_feed.parse_feed. The chain's Streamlit messages are discarded.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import types
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import legacy_text_parser  # noqa: E402
+import text_feed  # noqa: E402
+
+TEAMS = [
+    "Arsenal", "Chelsea", "Liverpool", "Everton", "Boca Juniors", "River Plate",
+    "Atletico Nacional", "Millonarios", "Real Sociedad", "Sevilla", "FC Porto",
+    "Benfica", "Ajax", "PSV Eindhoven", "Celtic", "Rangers",
+]  # fmt: skip
+LEAGUES = [
+    "England, Premier League ( 38 )",
+    "Argentina, Liga Profesional ( 27 )",
+    "Colombia, Primera A ( 19 )",
+    "Spain, La Liga ( 38 )",
+    "Portugal, Primeira Liga",
+    "World, Friendlies",
+]
+
+
+def synthetic_block(rng):
+    home, away = rng.sample(TEAMS, 2)
+    day = rng.randint(1, 28)
+    pct = lambda: f"{rng.uniform(0, 100):.1f}%"  # noqa: E731
+    num = lambda: f"{rng.uniform(0, 3):.2f}"  # noqa: E731
+    form = lambda: "".join(rng.choice("WDL") for _ in range(5))  # noqa: E731
+    return "\n".join(
+        [
+            f"📅 {day:02d}/04/2025, 🕛 {rng.randint(12, 22)}:00",
+            f"{rng.choice('🌍🌎🌏')} {rng.choice(LEAGUES)}",
+            f"⚡ *{home} ({rng.randint(1, 20)}) v {away} ({rng.randint(1, 20)})*",
+            f"✨ *Expected Value*: *H*: {pct()} | *D*: {pct()} | *A*: {pct()}",
+            f"✨ *Advice*: Double chance : {home} or draw",
+            f"🎯 *Value Bets*: {rng.choice(['Home Win', 'Away Win', 'None'])}",
+            f"📊 *H/All Form*: {form()} ║ {form()} // {form()} ║ {form()}",
+            f"📈 *PPG: H*: {num()} | All: {num()} ║ *A*: {num()} | All: {num()}",
+            f"⚽ *Goals/g: H*: {num()} (xG: {num()}) | *A*: {num()} (xG: {num()})",
+            f"⚽ *Conceded/g: H*: {num()} (xGA: {num()}) | *A*: {num()} (xGA: {num()})",
+            f"🥅 *Halves Over 0.5: {pct()} ║ {pct()}",
+            f"⚽ *Team Goals: O1.5 {pct()} ║ O1.5 {pct()}",
+            f"🥅 *Match Goals: O2.5 {pct()} ║ O2.5 {pct()}",
+            f"🧼 *Clean Sheets*: {pct()} | *A* {pct()}",
+            f"🏆 *Win Rates*: FT {pct()} | *A*: FT {pct()}",
+            f"📉 *HvA H2H Record*: {rng.randint(0, 5)}-1-1/{rng.randint(2, 9)}",
+            f"📉 *All H2H Record*: {rng.randint(0, 9)}-3-2/{rng.randint(5, 19)}",
+            f"📈 *H2H PPG: {num()} ║ {num()}",
+            f"⚽ *H2H Goals Scored: {num()} ║ {num()}",
+            f"🥅 *H2H HvA Over/Under*: O2.5 {pct()}",
+            f"✨ *Home Insights*: {home} are unbeaten in {rng.randint(2, 9)}",
+            f"   - Won {rng.randint(1, 6)} of the last 6 at home",
+            f"✨ *Away Insights*: {away} have lost {rng.randint(1, 6)} away",
+            "   - Conceded first in most away games",
+            "✨ *Total Match Insights*:",
+            f"⚡*{home} ({rng.randint(1, 20)}): Scored in {rng.randint(5, 10)} of 10",
+            "   - Over 1.5 goals in most games",
+            f"⚡*{away} ({rng.randint(1, 20)}): Kept {rng.randint(0, 5)} clean sheets",
+            f"🎲 Confidence Score: {rng.randint(40, 95)}",
+            f"Match Outcome: {rng.choice(['Home Win', 'Draw', 'Away Win'])} "
+            f"({rng.randint(1, 10)}/10)",
+            f"Over/Under Goals: Over 2.5 Goals ({rng.randint(1, 10)}/10)",
+            f"Over/Under Corners: Under 9.5 Corners ({rng.randint(1, 10)}/10)",
+            f"Recommended Prediction: {rng.choice(['Home Win', 'Over 2.5 Goals'])}",
+        ]
+    )
+
+
+def synthetic_feed(blocks, seed=0):
+    rng = random.Random(seed)
+    return "\n\n".join(synthetic_block(rng) for _ in range(blocks)) + "\n"
+
+
+def load_chain_parser():
+    """The frozen load_data_from_text, with its Streamlit messages discarded."""
+    legacy_text_parser.st = types.SimpleNamespace(
+        info=lambda *a: None,
+        error=lambda *a: None,
+        warning=lambda *a: None,
+        success=lambda *a: None,
+    )
+    return legacy_text_parser.load_data_from_text
+
+
+def best_of(fn, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--blocks", type=int, default=10_000)
+    args = parser.parse_args()
+
+    content = synthetic_feed(args.blocks)
+    chain = load_chain_parser()
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", encoding="utf-8") as f:
+        f.write(content)
+        f.flush()
+        chain_s, chain_matches = best_of(lambda: chain(f.name))
+    feed_s, (matches, _) = best_of(lambda: text_feed.parse_feed(content))
+
+    print(f"{args.blocks} blocks, {len(content.encode()) / 1e6:.1f} MB")
+    print(f"   if/elif chain: {chain_s * 1000:8.1f} ms ({len(chain_matches)} matches)")
+    print(f"  text_feed     : {feed_s * 1000:8.1f} ms ({len(matches)} matches)")
+    print(f"  speed-up      : {chain_s / feed_s:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
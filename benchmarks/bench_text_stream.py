@@ -0,0 +1,68 @@
+"""Peak RSS while parsing a large text feed: whole file vs. streamed.
+
+Run from the project root:
+
+    python benchmarks/bench_text_stream.py [--blocks 10000 40000]
+
+Writes synthetic feeds of --blocks match blocks (see bench_text_parser) and
+parses each in its own subprocess so ru_maxrss reflects that parse alone.
+"whole" reads the file and keeps every match from text_feed.parse_feed;
+"streamed" walks text_feed.iter_feed and drops each match once counted, as
+a consumer writing rows straight into a store would.
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import text_feed  # noqa: E402
+
+
+def run_mode(mode, f_path):
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if mode == "whole":
+        with open(f_path, encoding="utf-8") as f:
+            matches, _ = text_feed.parse_feed(f.read())
+        count = len(matches)
+    else:
+        count = sum(1 for _ in text_feed.iter_feed(f_path))
+    elapsed = time.perf_counter() - start
+    peak_mb = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_kb) / 1024
+    size_mb = os.path.getsize(f_path) / 1024 / 1024
+    print(
+        f"{size_mb:6.1f} MB {mode:>8}: {elapsed * 1000:8.1f} ms, "
+        f"peak RSS +{peak_mb:6.1f} MB ({count} matches)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--blocks", type=int, nargs="+", default=[10_000, 40_000])
+    args = parser.parse_args()
+
+    from bench_text_parser import synthetic_feed
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for blocks in args.blocks:
+            f_path = os.path.join(tmp_dir, f"{blocks}.txt")
+            with open(f_path, "w", encoding="utf-8") as f:
+                f.write(synthetic_feed(blocks))
+            for mode in ("whole", "streamed"):
+                subprocess.run(
+                    [sys.executable, __file__, "--mode", mode, f_path], check=True
+                )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--mode":
+        run_mode(sys.argv[2], sys.argv[3])
+    else:
+        main()
@@ -0,0 +1,66 @@
+"""Refreshing a growing text feed: full reparse vs. data_loader.follow_text_feed.
+
+Run from the project root:
+
+    python benchmarks/bench_text_tail.py [--blocks 10000] [--appended 20]
+
+Writes a synthetic feed of --blocks match blocks (see bench_text_parser),
+follows it once, then appends --appended blocks at a time, as the bot does
+on a matchday, and times a refresh each way. Streamlit messages are
+discarded.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import data_loader  # noqa: E402
+import text_feed  # noqa: E402
+from bench_text_parser import synthetic_feed  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--blocks", type=int, default=10_000)
+    parser.add_argument("--appended", type=int, default=20)
+    args = parser.parse_args()
+
+    content = synthetic_feed(args.blocks + 3 * args.appended)
+    blocks = text_feed.split_blocks(content)
+    initial = "".join(block for _, block in blocks[: args.blocks])
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        f_path = os.path.join(tmp_dir, "feed.txt")
+        with open(f_path, "w", encoding="utf-8") as f:
+            f.write(initial)
+        start = time.perf_counter()
+        data_loader.follow_text_feed(f_path)
+        print(
+            f"{args.blocks} blocks, first follow: "
+            f"{(time.perf_counter() - start) * 1000:8.1f} ms"
+        )
+
+        for round_start in range(args.blocks, len(blocks), args.appended):
+            appended = blocks[round_start : round_start + args.appended]
+            with open(f_path, "a", encoding="utf-8") as f:
+                f.write("".join(block for _, block in appended))
+            start = time.perf_counter()
+            followed = data_loader.follow_text_feed(f_path)
+            tail_s = time.perf_counter() - start
+            start = time.perf_counter()
+            full = list(text_feed.iter_feed(f_path))
+            full_s = time.perf_counter() - start
+            assert followed == full, "followed matches differ from a full parse"
+            print(
+                f"+{args.appended} blocks: full reparse {full_s * 1000:8.1f} ms, "
+                f"follow {tail_s * 1000:6.1f} ms ({len(followed)} matches)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Peak RSS and load time: typed frames vs. the object/records round-trip.
+
+Run from the project root:
+
+    python benchmarks/bench_typed_frames.py
+
+Each mode runs in its own subprocess so that ru_maxrss reflects that mode
+alone. It loads the largest week (peak RSS growth for a single load), then
+every week followed by a concat. Sidecars are built first, so both modes
+start from the same warm Arrow cache.
+"""
+
+import glob
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+
+def run_mode(mode, cache_dir):
+    import pandas as pd
+
+    import data_loader
+    from config import WEEKLY_PREDICTIONS_DIR
+
+    data_loader.COLUMNAR_CACHE_DIR = Path(cache_dir)
+    # A grade store per mode, so neither reuses the other's grades
+    data_loader.GRADE_STORE_DIR = Path(cache_dir) / f"grades-{mode}"
+    files = sorted(glob.glob(os.path.join(WEEKLY_PREDICTIONS_DIR, "[0-9]*.csv")))
+    typed = mode == "typed"
+
+    def load_uncached(f_path, typed):
+        return data_loader._load_data_from_csv.__wrapped__(f_path, None, typed)
+
+    # Load the smallest week first so lazily imported library code is not counted
+    files_by_size = sorted(files, key=os.path.getsize)
+    load_uncached(files_by_size[0], typed=typed)
+
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    largest_week = load_uncached(files_by_size[-1], typed=typed)
+    week_ms = (time.perf_counter() - start) * 1000
+    week_peak_mb = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline_kb) / 1024
+    week_mb = largest_week.memory_usage(deep=True).sum() / 1e6
+
+    start = time.perf_counter()
+    frames = [load_uncached(f_path, typed=typed) for f_path in files]
+    combined = pd.concat(frames, ignore_index=True)
+    all_ms = (time.perf_counter() - start) * 1000
+    total_peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    combined_mb = combined.memory_usage(deep=True).sum() / 1e6
+
+    print(
+        f"{mode:>7}: largest week {week_ms:7.1f} ms, peak RSS +{week_peak_mb:5.1f} MB, "
+        f"frame {week_mb:4.1f} MB | all weeks {all_ms:7.1f} ms, "
+        f"peak RSS {total_peak_mb:6.1f} MB, combined frame {combined_mb:5.1f} MB"
+    )
+
+
+def main():
+    import data_loader
+    from config import WEEKLY_PREDICTIONS_DIR
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        data_loader.COLUMNAR_CACHE_DIR = Path(cache_dir)
+        for f_path in glob.glob(os.path.join(WEEKLY_PREDICTIONS_DIR, "[0-9]*.csv")):
+            data_loader.read_weekly_frame(f_path)
+
+        for mode in ("records", "typed"):
+            subprocess.run(
+                [sys.executable, __file__, "--mode", mode, cache_dir],
+                check=True,
+                stderr=subprocess.DEVNULL,
+            )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--mode":
+        run_mode(sys.argv[2], sys.argv[3])
+    else:
+        main()
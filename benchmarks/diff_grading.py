@@ -0,0 +1,143 @@
+"""Replays every stored prediction through the legacy grader and grading.
+
+Run from the project root:
+
+    python benchmarks/diff_grading.py [--show 20]
+
+Reads every week in WEEKLY_PREDICTIONS_DIR and grades each column of
+grading.GRADED_COLUMNS, row by row, twice: as stored and as the bet Match
+Analysis shows (grading.bet_text). Each is graded by
+legacy_grading.check_prediction_success, by grading.grade_prediction and by
+one grading.grade_predictions call per week, with the result columns the
+pages pass. Every distinct prediction string also goes through both
+clean_prediction_string. Differences are counted per column and the first
+--show are printed; the exit status is 1 if there are any.
+"""
+
+import argparse
+import glob
+import os
+import sys
+from collections import Counter
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import data_loader  # noqa: E402
+import grading  # noqa: E402
+import legacy_grading  # noqa: E402
+from config import WEEKLY_PREDICTIONS_DIR  # noqa: E402
+
+
+def legacy_grade(prediction, match):
+    return (
+        legacy_grading.check_prediction_success(
+            prediction,
+            match["HomeGoals"],
+            match["AwayGoals"],
+            match["Corners"],
+            match["YellowCards"],
+            match["home_team"],
+            match["away_team"],
+            match["HomeYellowsResults"],
+            match["AwayYellowsResults"],
+            match["HomeRedsResults"],
+            match["AwayRedsResults"],
+        )
+        or "PENDING"
+    )
+
+
+def scalar_grade(prediction, match):
+    return grading.grade_prediction(
+        prediction,
+        *(match[name] for name in grading.RESULT_COLUMNS.values()),
+    )
+
+
+def week_records(df):
+    """Rows as the pages see them: plain Python values, None when missing."""
+    columns = {*grading.RESULT_COLUMNS.values(), "YellowCards"}
+    df = df.reindex(columns=[*df.columns, *columns.difference(df.columns)])
+    return df.astype(object).where(df.notna(), None).to_dict("records")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--show", type=int, default=20)
+    args = parser.parse_args()
+
+    files = sorted(glob.glob(os.path.join(WEEKLY_PREDICTIONS_DIR, "[0-9]*.csv")))
+    counts = Counter()
+    differences = []
+    strings = set()
+    for f_path in files:
+        df = data_loader.read_weekly_frame(f_path)
+        records = week_records(df)
+        for column in grading.GRADED_COLUMNS:
+            if column not in df.columns:
+                continue
+            for reading in ("stored", "bet"):
+                predictions = [match[column] for match in records]
+                if reading == "bet":
+                    predictions = [
+                        grading.bet_text(prediction, column)
+                        for prediction in predictions
+                    ]
+                strings.update(p for p in predictions if isinstance(p, str))
+                batch = grading.grade_predictions(
+                    predictions,
+                    **{
+                        arg: [match[name] for match in records]
+                        for arg, name in grading.RESULT_COLUMNS.items()
+                    },
+                )
+                key = f"{column} ({reading})"
+                for prediction, match, batch_grade in zip(
+                    predictions, records, batch
+                ):
+                    expected = legacy_grade(prediction, match)
+                    grades = (scalar_grade(prediction, match), batch_grade)
+                    counts[key, "rows"] += 1
+                    if any(grade != expected for grade in grades):
+                        counts[key, "differences"] += 1
+                        differences.append(
+                            (
+                                os.path.basename(f_path),
+                                key,
+                                prediction,
+                                match,
+                                expected,
+                                grades,
+                            )
+                        )
+
+    cleaned_differences = [
+        s
+        for s in sorted(strings)
+        if grading.clean_prediction_string(s)
+        != legacy_grading.clean_prediction_string(s)
+    ]
+
+    print(f"{len(files)} weeks, {len(strings)} distinct prediction strings")
+    for key in sorted({key for key, _ in counts}):
+        print(
+            f"{key:>26}: {counts[key, 'rows']:6d} rows, "
+            f"{counts[key, 'differences']:4d} differences"
+        )
+    print(f"clean_prediction_string: {len(cleaned_differences)} differences")
+    for week, key, prediction, match, expected, grades in differences[: args.show]:
+        print(
+            f"{week} {key} {prediction!r} {match['home_team']} "
+            f"{match['HomeGoals']}-{match['AwayGoals']} {match['away_team']}: "
+            f"legacy {expected}, grade_prediction {grades[0]}, "
+            f"grade_predictions {grades[1]}"
+        )
+    for s in cleaned_differences[: args.show]:
+        print(f"clean_prediction_string {s!r}")
+    if differences or cleaned_differences:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,459 @@
+"""The text-feed parser the Match Analysis page carried, kept as a reference.
+
+pages/1_Match_Analysis.py had its own load_data_from_text, a line-by-line
+if/elif chain over the feed, which nothing called once data_loader took
+over. It is frozen here so bench_text_parser.py can time it against
+text_feed. One change: its league-flag pattern was missing the "]" that
+closes its character class, which made every line after 📅 raise; it is
+closed here so the chain does its real work.
+"""
+
+import re
+
+import streamlit as st
+
+
+def load_data_from_text(filepath):
+    """Loads and parses match data from the text file."""
+    st.info(f"Loading data from Text file: {filepath}")
+    # --- Paste the complex text parsing logic from the previous response here ---
+    # This function should return a list of match dictionaries
+    all_matches = []
+    try:
+        with open(filepath, "r", encoding="utf-8") as f:
+            content = f.read()
+    except FileNotFoundError:
+        st.error(f"Error: Data file '{filepath}' not found.")
+        return []
+    except Exception as e:
+        st.error(f"Error reading file '{filepath}': {e}")
+        return []
+
+    # Split into match blocks - assumes '📅' starts a new match
+    # Use positive lookahead (?=...) to keep the delimiter
+    match_blocks = re.split(r"(?=📅)", content)
+
+    for i, block in enumerate(match_blocks):
+        block = block.strip()
+        if not block or not block.startswith("📅"):
+            continue  # Skip empty blocks or fragments
+
+        match = {"raw_block": block}  # Store raw block for debugging if needed
+        lines = block.strip().split("\n")
+        current_insight_type = None
+        insight_buffer = ""
+
+        # Initialize with defaults (important!)
+        match.update(
+            {
+                "date": None,
+                "time": None,
+                "country": None,
+                "league": None,
+                "league_name": None,
+                "home_team": None,
+                "home_rank": "",
+                "away_team": None,
+                "away_rank": "",
+                "exp_val_h": None,
+                "exp_val_d": None,
+                "exp_val_a": None,
+                "advice": None,
+                "value_bets": None,
+                "form_home": None,
+                "form_away": None,
+                "ppg_h": None,
+                "ppg_h_all": None,
+                "ppg_a": None,
+                "ppg_a_all": None,
+                "goals_h": None,
+                "xg_h": None,
+                "goals_a": None,
+                "xg_a": None,
+                "conceded_h": None,
+                "xga_h": None,
+                "conceded_a": None,
+                "xga_a": None,
+                "halves_o05_h": None,
+                "halves_o05_a": None,
+                "team_goals_h": None,
+                "team_goals_a": None,
+                "match_goals_h": None,
+                "match_goals_a": None,
+                "clean_sheet_h": None,
+                "clean_sheet_a": None,
+                "win_rates_h": None,
+                "win_rates_a": None,
+                "h2h_hva_record": None,
+                "h2h_hva_games": None,
+                "h2h_all_record": None,
+                "h2h_all_games": None,
+                "h2h_hva_ppg_str": None,
+                "h2h_hva_goals_str": None,
+                "h2h_hva_ou": None,
+                "insights_home": "",
+                "insights_away": "",
+                "insights_total_h": "",
+                "insights_total_a": "",
+                "confidence_score": None,
+                "pred_outcome": None,
+                "pred_outcome_conf": None,
+                "pred_goals": None,
+                "pred_goals_conf": None,
+                "pred_corners": None,
+                "pred_corners_conf": None,
+                "rec_prediction": None,
+                "match_id": None,  # Will be generated at the end
+            }
+        )
+
+        home_team_buffer = None  # Buffer to identify total insights block
+
+        for line_num, line in enumerate(lines):
+            line = line.strip()
+            if not line:
+                continue
+
+            try:  # Wrap line parsing in try-except
+                # --- Parse Core Info ---
+                if line.startswith("📅"):
+                    m = re.search(r"📅\s*([\d/]+),\s*🕛\s*([\d:]+)", line)
+                    if m:
+                        match["date"], match["time"] = m.groups()
+                elif re.match(
+                    r"^[🌍🌎🌏🗺️⚽🏀🏈⚾🥎🎾🏐🏉🎱🔮🎮👾🏆🥇🥈🥉🏅🎖️🏵️🎗️🎀🎁🎂🎃🎄🎅🎆🎇✨🎈🎉🎊🎋🎍🎎🎏🎐🎑🧧🎀🎁🎗️🎟️🎫]",
+                    line,
+                ):  # Match most common flags/emojis used for league
+                    parts = line.split(" ", 1)
+                    if len(parts) == 2:
+                        match["league"] = parts[1]
+                        country_parts = parts[1].split(",", 1)
+                        match["country"] = country_parts[0].strip()
+                        if len(country_parts) > 1:
+                            # Remove parentheses and content inside like ( 24 )
+                            league_part = re.sub(
+                                r"\s*\(\s*\d+\s*\)\s*$", "", country_parts[1]
+                            ).strip()
+                            match["league_name"] = league_part
+                        else:
+                            match["league_name"] = match[
+                                "country"
+                            ]  # Fallback if no comma
+                elif line.startswith("⚡"):
+                    # Make rank optional with (?:...)?
+                    m = re.search(
+                        r"\*(.*?)(?:\s*\((.*?)\))?\s*v\s*(.*?)(?:\s*\((.*?)\))?\*", line
+                    )
+                    if m:
+                        (
+                            match["home_team"],
+                            match["home_rank"],
+                            match["away_team"],
+                            match["away_rank"],
+                        ) = [g.strip() if g else "" for g in m.groups()]
+                        home_team_buffer = match["home_team"]  # Store home team name
+
+                # --- Parse Predictions & Values ---
+                elif line.startswith("✨ *Expected Value*:"):
+                    match["exp_val_h"] = (
+                        re.search(r"H\*:\s*([\d.]+%)", line).group(1)
+                        if re.search(r"H\*:\s*([\d.]+%)", line)
+                        else None
+                    )
+                    match["exp_val_d"] = (
+                        re.search(r"D\*:\s*([\d.]+%)", line).group(1)
+                        if re.search(r"D\*:\s*([\d.]+%)", line)
+                        else None
+                    )
+                    match["exp_val_a"] = (
+                        re.search(r"A\*:\s*([\d.]+%)", line).group(1)
+                        if re.search(r"A\*:\s*([\d.]+%)", line)
+                        else None
+                    )
+                elif line.startswith("✨ *Advice*:"):
+                    match["advice"] = line.split(":", 1)[1].strip()
+                elif line.startswith("🎯"):
+                    match["value_bets"] = line.split(":", 1)[1].strip()
+
+                # --- Parse Stats ---
+                elif line.startswith("📊 *H/All Form*:"):
+                    form_line = line.split(": ", 1)[1]
+                    parts = form_line.split("//")  # Split current form and all form
+                    home_parts = (
+                        parts[0].split("║") if "║" in parts[0] else [parts[0], ""]
+                    )
+                    away_parts = (
+                        parts[1].split("║")
+                        if len(parts) > 1 and "║" in parts[1]
+                        else [parts[1] if len(parts) > 1 else "", ""]
+                    )
+                    match["form_home"] = home_parts[0].strip()
+                    match["form_away"] = away_parts[
+                        0
+                    ].strip()  # Adjusted splitting needed if format changes
+                elif line.startswith("📈 *PPG:"):
+                    m_ppg = re.search(
+                        r"H\*:\s*([\d.]+)\s*\|\s*All:\s*([\d.]+)\s*║\s*\*A\*:\s*([\d.]+)\s*\|\s*All:\s*([\d.]+)",
+                        line,
+                    )
+                    if m_ppg:
+                        try:
+                            match["ppg_h"] = float(m_ppg.group(1))
+                        except:
+                            pass
+                        try:
+                            match["ppg_h_all"] = float(m_ppg.group(2))
+                        except:
+                            pass
+                        try:
+                            match["ppg_a"] = float(m_ppg.group(3))
+                        except:
+                            pass
+                        try:
+                            match["ppg_a_all"] = float(m_ppg.group(4))
+                        except:
+                            pass
+                elif line.startswith("⚽ *Goals/g:"):
+                    m_goals = re.search(
+                        r"H\*:\s*([\d.]+)\s*\(xG:\s*(.*?)\)\s*\|\s*\*A\*:\s*([\d.]+)\s*\(xG:\s*(.*?)\)",
+                        line,
+                    )
+                    if m_goals:
+                        try:
+                            match["goals_h"] = float(m_goals.group(1))
+                        except:
+                            pass
+                        xg_h_val = m_goals.group(2).strip()
+                        match["xg_h"] = (
+                            float(xg_h_val) if xg_h_val and xg_h_val != "" else None
+                        )
+                        try:
+                            match["goals_a"] = float(m_goals.group(3))
+                        except:
+                            pass
+                        xg_a_val = (
+                            m_goals.group(4).strip().rstrip(")")
+                        )  # Strip trailing ')'
+                        match["xg_a"] = (
+                            float(xg_a_val) if xg_a_val and xg_a_val != "" else None
+                        )
+                elif line.startswith("⚽ *Conceded/g:"):
+                    m_conc = re.search(
+                        r"H\*:\s*([\d.]+)\s*\(xGA:\s*(.*?)\)\s*\|\s*\*A\*:\s*([\d.]+)\s*\(xGA:\s*(.*?)\)",
+                        line,
+                    )
+                    if m_conc:
+                        try:
+                            match["conceded_h"] = float(m_conc.group(1))
+                        except:
+                            pass
+                        xga_h_val = m_conc.group(2).strip()
+                        match["xga_h"] = (
+                            float(xga_h_val) if xga_h_val and xga_h_val != "" else None
+                        )
+                        try:
+                            match["conceded_a"] = float(m_conc.group(3))
+                        except:
+                            pass
+                        xga_a_val = (
+                            m_conc.group(4).strip().rstrip(")")
+                        )  # Strip trailing ')'
+                        match["xga_a"] = (
+                            float(xga_a_val) if xga_a_val and xga_a_val != "" else None
+                        )
+                elif line.startswith("🥅 *Halves Over 0.5:"):
+                    parts = line.split(": ", 1)[1].split(" ║ ")
+                    match["halves_o05_h"] = parts[0].strip()
+                    match["halves_o05_a"] = parts[1].strip()
+                elif line.startswith("⚽ *Team Goals:"):
+                    parts = line.split(": ", 1)[1].split(" ║ ")
+                    match["team_goals_h"] = parts[0].strip()
+                    match["team_goals_a"] = parts[1].strip()
+                elif line.startswith("🥅 *Match Goals:"):
+                    parts = line.split(": ", 1)[1].split(" ║ ")
+                    match["match_goals_h"] = parts[0].strip()
+                    match["match_goals_a"] = parts[1].strip()
+                elif line.startswith("🧼"):
+                    parts = line.split(": ", 1)[1].split(" | ")
+                    cs_h = parts[0].replace("*A*", "").strip()
+                    cs_a = (
+                        parts[1].replace("*A*", "").strip() if len(parts) > 1 else None
+                    )
+                    match["clean_sheet_h"] = cs_h if cs_h != "nan" else None
+                    match["clean_sheet_a"] = cs_a if cs_a and cs_a != "nan" else None
+                elif line.startswith("🏆"):
+                    parts = line.split(": ", 1)[1].split(" | *A*: ")
+                    match["win_rates_h"] = parts[0].strip()
+                    match["win_rates_a"] = parts[1].strip() if len(parts) > 1 else None
+
+                # --- Parse H2H ---
+                elif line.startswith("📉 *HvA H2H Record*:"):
+                    m_h2h_hva = re.search(r":\s*([\d\-]+)\/(\d+)", line)
+                    if m_h2h_hva:
+                        match["h2h_hva_record"] = m_h2h_hva.group(1)
+                        try:
+                            match["h2h_hva_games"] = int(m_h2h_hva.group(2))
+                        except:
+                            pass
+                elif line.startswith("📉 *All H2H Record*:"):
+                    m_h2h_all = re.search(r":\s*([\d\-]+)\/(\d+)", line)
+                    if m_h2h_all:
+                        match["h2h_all_record"] = m_h2h_all.group(1)
+                        try:
+                            match["h2h_all_games"] = int(m_h2h_all.group(2))
+                        except:
+                            pass
+                elif line.startswith("📈 *H2H PPG:"):
+                    match["h2h_hva_ppg_str"] = line.split(": ", 1)[1]
+                elif line.startswith("⚽ *H2H Goals Scored:"):
+                    match["h2h_hva_goals_str"] = line.split(": ", 1)[1]
+                elif line.startswith("🥅 *H2H HvA Over/Under*:"):
+                    match["h2h_hva_ou"] = line.split(": ", 1)[1]
+
+                # --- Parse Insights (Improved Buffering) ---
+                elif line.startswith("✨ *Home Insights*:"):
+                    if current_insight_type:
+                        match[f"insights_{current_insight_type}"] = (
+                            insight_buffer.strip()
+                        )
+                    current_insight_type = "home"
+                    insight_buffer = (
+                        line.split(":", 1)[1].strip() + "\n" if ":" in line else "\n"
+                    )
+                elif line.startswith("✨ *Away Insights*:"):
+                    if current_insight_type:
+                        match[f"insights_{current_insight_type}"] = (
+                            insight_buffer.strip()
+                        )
+                    current_insight_type = "away"
+                    insight_buffer = (
+                        line.split(":", 1)[1].strip() + "\n" if ":" in line else "\n"
+                    )
+                elif line.startswith("✨ *Total Match Insights*:"):
+                    if current_insight_type:
+                        match[f"insights_{current_insight_type}"] = (
+                            insight_buffer.strip()
+                        )
+                    current_insight_type = None  # Stop basic insight capture
+                    insight_buffer = ""
+                elif line.startswith("⚡*"):  # Start of Total Match Insights block
+                    if insight_buffer and current_insight_type in [
+                        "home",
+                        "away",
+                    ]:  # Save previous basic block
+                        match[f"insights_{current_insight_type}"] = (
+                            insight_buffer.strip()
+                        )
+                    insight_buffer = ""  # Reset buffer for total insights
+                    team_name_match = re.match(r"⚡\*(.*?)\s*\(.*?\):", line)
+                    if team_name_match:
+                        team_name_in_line = team_name_match.group(1).strip()
+                        # Assign to total_h or total_a based on home_team_buffer
+                        if home_team_buffer and team_name_in_line == home_team_buffer:
+                            current_insight_type = "total_h"
+                        else:
+                            current_insight_type = "total_a"
+                        # Start buffer with content after the team name part
+                        insight_buffer = (
+                            line.split("):", 1)[1].strip() + "\n"
+                            if "):" in line
+                            else ""
+                        )
+                    else:  # If pattern fails, assume it's a continuation
+                        if current_insight_type:
+                            insight_buffer += line + "\n"
+
+                elif current_insight_type and line.startswith(
+                    "   -"
+                ):  # Indented lines belong to current block
+                    insight_buffer += line.strip() + "\n"
+                elif current_insight_type and not re.match(
+                    r"^(?:🎲|Match Outcome:|Over/Under Goals:|Over/Under Corners:|Recommended Prediction:)",
+                    line,
+                ):
+                    # Capture non-indented lines if we are inside an insight block, before confidence section starts
+                    insight_buffer += line.strip() + "\n"
+
+                # --- Parse Confidence & Final Predictions ---
+                elif line.startswith("🎲"):
+                    if (
+                        insight_buffer and current_insight_type
+                    ):  # Store last insight block
+                        match[f"insights_{current_insight_type}"] = (
+                            insight_buffer.strip()
+                        )
+                        insight_buffer = ""
+                        current_insight_type = None  # Reset type after storing
+                    m_conf = re.search(r"Score:\s*(\d+)", line)
+                    if m_conf:
+                        try:
+                            match["confidence_score"] = int(m_conf.group(1))
+                        except:
+                            pass
+                elif line.startswith("Match Outcome:"):
+                    m_pred = re.search(
+                        r":\s*(.*?)(?:\s*\((\d+)/10\))?$", line
+                    )  # Make confidence optional
+                    if m_pred:
+                        match["pred_outcome"] = m_pred.group(1).strip()
+                        if m_pred.group(2):
+                            try:
+                                match["pred_outcome_conf"] = int(m_pred.group(2))
+                            except:
+                                pass
+                elif line.startswith("Over/Under Goals:"):
+                    m_pred = re.search(r":\s*(.*?)(?:\s*\((\d+)/10\))?$", line)
+                    if m_pred:
+                        match["pred_goals"] = m_pred.group(1).strip()
+                        if m_pred.group(2):
+                            try:
+                                match["pred_goals_conf"] = int(m_pred.group(2))
+                            except:
+                                pass
+                elif line.startswith("Over/Under Corners:"):
+                    m_pred = re.search(r":\s*(.*?)(?:\s*\((\d+)/10\))?$", line)
+                    if m_pred:
+                        match["pred_corners"] = m_pred.group(1).strip()
+                        if m_pred.group(2):
+                            try:
+                                match["pred_corners_conf"] = int(m_pred.group(2))
+                            except:
+                                pass
+                elif line.startswith("Recommended Prediction:"):
+                    match["rec_prediction"] = line.split(":", 1)[1].strip()
+
+                # --- Fallback/End of block ---
+                elif line_num == len(lines) - 1:  # Last line check
+                    if insight_buffer and current_insight_type:
+                        match[f"insights_{current_insight_type}"] = (
+                            insight_buffer.strip()
+                        )
+
+            except Exception as e_line:
+                st.warning(
+                    f"Error parsing line {line_num + 1} in block {i + 1}: '{line}' - {e_line}"
+                )
+                continue  # Skip to next line on error
+
+        # --- Post-processing & ID ---
+        if match.get("home_team") and match.get(
+            "date"
+        ):  # Only add if core info was parsed
+            # Ensure all insight keys exist even if empty
+            for k in [
+                "insights_home",
+                "insights_away",
+                "insights_total_h",
+                "insights_total_a",
+            ]:
+                if k not in match:
+                    match[k] = ""
+            match["match_id"] = (
+                f"{match['home_team']}_{match['away_team']}_{match['date']}_{i}"
+            )
+            all_matches.append(match)
+        else:
+            st.warning(f"Skipped block {i + 1} due to missing core info (team/date).")
+
+    st.success(f"Successfully parsed {len(all_matches)} matches from '{filepath}'.")
+    return all_matches
@@ -0,0 +1,62 @@
+"""Rewrites the weekly prediction files in compressed form.
+
+Run from the project root:
+
+    python compress_weeks.py [--format csv.zst] [--remove-sources] [week_dir]
+
+Every week in week_dir (WEEKLY_PREDICTIONS_DIR by default) is converted with
+data_loader.compress_week_file, which checks that the new file reads back as
+the same frame. The pages pick up the compressed files without any change.
+--remove-sources deletes each original once its copy has been verified.
+
+On the current archive zstd-compressed CSV is the smallest form: a week is
+a few hundred rows by ~370 columns, so Parquet's per-column pages and footer
+cost more than compressing the repeated logo URLs and team names row-wise
+saves. The typed Arrow sidecars in data/.cache remain the columnar form the
+app reads from.
+"""
+
+import argparse
+import os
+import sys
+
+import data_loader
+from config import WEEKLY_PREDICTIONS_DIR
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("week_dir", nargs="?", default=str(WEEKLY_PREDICTIONS_DIR))
+    parser.add_argument(
+        "--format", choices=("csv.zst", "csv.gz", "parquet"), default="csv.zst"
+    )
+    parser.add_argument("--remove-sources", action="store_true")
+    args = parser.parse_args()
+
+    suffix = f".{args.format}"
+    total_before = total_after = 0
+    for week, f_path in data_loader.list_week_files(args.week_dir):
+        if data_loader.week_file_suffix(f_path) == suffix:
+            continue
+        try:
+            target = data_loader.compress_week_file(f_path, suffix)
+        except ValueError as e:
+            print(f"week {week}: skipped, {e}", file=sys.stderr)
+            continue
+        before, after = os.path.getsize(f_path), os.path.getsize(target)
+        total_before += before
+        total_after += after
+        print(f"week {week}: {before / 1024:7.1f} KB -> {after / 1024:7.1f} KB")
+        if args.remove_sources:
+            os.remove(f_path)
+
+    if total_before:
+        print(
+            f"total: {total_before / 1024 / 1024:.2f} MB -> "
+            f"{total_after / 1024 / 1024:.2f} MB "
+            f"({total_before / total_after:.1f}x smaller)"
+        )
+
+
+if __name__ == "__main__":
+    main()
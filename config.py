@@ -2,9 +2,35 @@ import os
 from pathlib import Path
 
 # --- Configuration ---
-PROJECT_ROOT = Path(__file__).parent.parent
+PROJECT_ROOT = Path(__file__).parent
 WEEKLY_PREDICTIONS_DIR = PROJECT_ROOT / "data" / "pre_match"
 COMBINED_RESULTS_FILE = PROJECT_ROOT / "data" / "combined_results.csv"
+# Typed Arrow IPC sidecars written by data_loader (one per weekly CSV)
+COLUMNAR_CACHE_DIR = PROJECT_ROOT / "data" / ".cache"
+# Per-week partitions and manifest behind the Results Analysis combined data
+COMBINED_STORE_DIR = COLUMNAR_CACHE_DIR / "combined"
+# Grades of every week's predictions, kept between runs (see data_loader)
+GRADE_STORE_DIR = COLUMNAR_CACHE_DIR / "grades"
+# Background thread that reloads a weekly file as soon as it changes on disk
+WATCH_WEEKLY_FILES = os.environ.get("FPP_WATCH_WEEKLY_FILES") == "1"
+WEEK_WATCH_INTERVAL_SECONDS = 30
+# Threads used to load several weekly files at once (Results Analysis)
+INGEST_WORKERS = int(os.environ.get("FPP_INGEST_WORKERS", min(8, os.cpu_count() or 1)))
+# Weekly CSVs at least this large are parsed block by block straight into
+# their Arrow file, so ingest memory does not grow with the file
+STREAMING_INGEST_BYTES = int(
+    os.environ.get("FPP_STREAMING_INGEST_BYTES", 8 * 1024 * 1024)
+)
+STREAMING_BLOCK_BYTES = 1024 * 1024
+# Text feeds at least this large are parsed on a process pool, batches of
+# match blocks at a time (text_feed.parse_feed_parallel)
+TEXT_PARSE_WORKERS = int(os.environ.get("FPP_TEXT_PARSE_WORKERS", os.cpu_count() or 1))
+PARALLEL_TEXT_PARSE_BYTES = int(
+    os.environ.get("FPP_PARALLEL_TEXT_PARSE_BYTES", 32 * 1024 * 1024)
+)
+# Distinct (prediction, home team, away team) bet specs kept by
+# grading.parse_prediction; a season has a few hundred prediction strings
+PREDICTION_CACHE_SIZE = int(os.environ.get("FPP_PREDICTION_CACHE_SIZE", 4096))
 
 DATA_SOURCE = "csv"
 DB_PARAMS = {
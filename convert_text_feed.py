@@ -0,0 +1,40 @@
+"""Converts a Confidence text feed into a Parquet week file.
+
+Run from the project root:
+
+    python convert_text_feed.py [--feed Confidence-7.txt] target.parquet
+
+The feed (TEXT_FILE_PATH by default) is parsed with text_feed and written by
+data_loader.convert_text_feed in the schema of the weekly CSVs: h2h_h_ppg and
+h2h_a_ppg instead of h2h_hva_ppg_str, percentages as fractions, an integer
+match_id, and so on. Name the target after its week (e.g. "37.parquet") and
+keep it out of WEEKLY_PREDICTIONS_DIR unless it is meant to replace that
+week, since the newest file of a week is the one that gets loaded.
+"""
+
+import argparse
+import sys
+
+import data_loader
+from config import TEXT_FILE_PATH
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("target")
+    parser.add_argument("--feed", default=TEXT_FILE_PATH)
+    args = parser.parse_args()
+
+    try:
+        counts = data_loader.convert_text_feed(args.feed, args.target)
+    except (OSError, ValueError) as e:
+        print(f"{args.feed}: not converted, {e}", file=sys.stderr)
+        sys.exit(1)
+    print(
+        f"{args.feed} -> {args.target}: {counts['matches']} matches "
+        f"({counts['skipped']} blocks skipped)"
+    )
+
+
+if __name__ == "__main__":
+    main()
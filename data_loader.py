@@ -1,20 +1,117 @@
+import contextlib
+import csv
+import glob
+import gzip
+import hashlib
+import io
+import itertools
+import json
 import math
+import mmap
 import os
 import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import streamlit as st
+from streamlit.logger import get_logger
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
-from config import CSV_FILE_PATH, DB_PARAMS, TEXT_FILE_PATH
-from utils import add_transient_message, clean_prediction_string
+import grading
+import schema
+import text_feed
+from config import (
+    COLUMNAR_CACHE_DIR,
+    COMBINED_STORE_DIR,
+    CSV_FILE_PATH,
+    DB_PARAMS,
+    GRADE_STORE_DIR,
+    INGEST_WORKERS,
+    PARALLEL_TEXT_PARSE_BYTES,
+    STREAMING_BLOCK_BYTES,
+    STREAMING_INGEST_BYTES,
+    TEXT_FILE_PATH,
+    TEXT_PARSE_WORKERS,
+    WATCH_WEEKLY_FILES,
+    WEEK_WATCH_INTERVAL_SECONDS,
+)
+from utils import add_transient_message
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# For threads outside any session, where st messages would reach no one
+_LOGGER = get_logger(__name__)
+
+STRING_DTYPE = pd.StringDtype("pyarrow" if PYARROW_AVAILABLE else "python")
+
+# pandas' default na_values, so both CSV readers treat the same cells as missing
+CSV_NA_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
+# Part of every sidecar key; bump it whenever _parse_weekly_file changes the
+# frame it produces so sidecars written by older code are never served.
+COLUMNAR_CACHE_VERSION = 3
+# Bump when the combined store's manifest entries change shape or
+# prepare_week_frame changes what its partitions hold
+COMBINED_STORE_VERSION = 4
+# Part of every grade store's name; bump it whenever grading changes the grade
+# of any bet, so grades stored by older code are recomputed
+GRADE_STORE_VERSION = 2
+# Prediction columns shown with their labels cleaned by prepare_week_frame.
+# The other bets keep the exported label: clean_prediction_string also
+# collapses repeated words inside team names ("Colo Colo" -> "Colo"), and
+# the grader cleans each distinct label itself.
+CLEANED_PREDICTION_COLUMNS = ("rec_prediction",)
+# Forms a weekly file may be stored in; zstd and Parquet are read with pyarrow
+WEEK_FILE_SUFFIXES = (".csv", ".csv.gz")
+if PYARROW_AVAILABLE:
+    WEEK_FILE_SUFFIXES += (".csv.zst", ".parquet")
 
 
 # --- Data Loading Functions ---
-def load_weekly_data(file_path):
+def load_weekly_data(file_path, columns=None):
     try:
         if os.path.exists(file_path):
-            return load_data_from_csv(file_path)
+            return load_data_from_csv(file_path, columns=columns)
         else:
             st.error(f"File not found: {file_path}")
             return pd.DataFrame()
@@ -23,21 +120,16 @@ def load_weekly_data(file_path):
         return pd.DataFrame()
 
 
-def remove_duplicate_records(df) -> pd.DataFrame:
-    df_deduplicated = df.drop_duplicates(subset=["match_id"], keep="first")
-    cleaned_data = df_deduplicated.astype(object).where(
-        pd.notnull(df_deduplicated), None
-    )
-    return cleaned_data
-
-
-@st.cache_data
 def load_data_from_text(filepath):
+    """Parsed matches of a text feed, kept up to date as the bot appends to it.
+
+    Goes through follow_text_feed, so a rerun parses only the blocks
+    appended since the previous one instead of serving a stale parse or
+    reparsing the whole feed.
+    """
     st.info(f"Loading data from Text file: {filepath}")
-    all_matches = []
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            content = f.read()
+        all_matches = follow_text_feed(filepath)
     except FileNotFoundError:
         st.error(f"Error: Data file '{filepath}' not found.")
         return []
@@ -45,621 +137,878 @@ def load_data_from_text(filepath):
         st.error(f"Error reading file '{filepath}': {e}")
         return []
 
-    match_blocks = re.split(r"(?=📅)", content)
+    st.success(f"Successfully parsed {len(all_matches)} matches from '{filepath}'.")
+    return all_matches
 
-    for i, block in enumerate(match_blocks):
-        block = block.strip()
-        if not block or not block.startswith("📅"):
-            continue
 
-        match = {"raw_block": block}
-        lines = block.strip().split("\n")
-        current_insight_type = None
-        insight_buffer = ""
+# --- Text Feed Tail ---
+# The upstream bot appends 📅 blocks to the feed through the day. Each feed
+# followed here remembers where its last block starts, so a refresh reads
+# and parses only from there: the last block (which may have been
+# incomplete) plus whatever was appended after it.
+# abs path -> {"size", "head", "offset", "index", "tail_match", "matches"}
+_text_feed_tails = {}
+_text_feed_tails_lock = threading.Lock()
+# Bytes at the start of a feed hashed to notice it being replaced
+TEXT_FEED_HEAD_BYTES = 4096
+_BLOCK_MARKER_BYTES = text_feed.BLOCK_MARKER.encode("utf-8")
 
-        match.update(
-            {
-                "date": None,
-                "time": None,
-                "country": None,
-                "league": None,
-                "league_name": None,
-                "home_team": None,
-                "home_rank": "",
-                "away_team": None,
-                "away_rank": "",
-                "exp_val_h": None,
-                "exp_val_d": None,
-                "exp_val_a": None,
-                "advice": None,
-                "value_bets": None,
-                "form_home": None,
-                "form_away": None,
-                "ppg_h": None,
-                "ppg_h_all": None,
-                "ppg_a": None,
-                "ppg_a_all": None,
-                "goals_h": None,
-                "xg_h": None,
-                "goals_a": None,
-                "xg_a": None,
-                "conceded_h": None,
-                "xga_h": None,
-                "conceded_a": None,
-                "xga_a": None,
-                "halves_o05_h": None,
-                "halves_o05_a": None,
-                "team_goals_h": None,
-                "team_goals_a": None,
-                "match_goals_h": None,
-                "match_goals_a": None,
-                "clean_sheet_h": None,
-                "clean_sheet_a": None,
-                "win_rates_h": None,
-                "win_rates_a": None,
-                "h2h_hva_record": None,
-                "h2h_hva_games": None,
-                "h2h_all_record": None,
-                "h2h_all_games": None,
-                "h2h_hva_ppg_str": None,
-                "h2h_hva_goals_str": None,
-                "h2h_hva_ou": None,
-                "insights_home": "",
-                "insights_away": "",
-                "insights_total_h": "",
-                "insights_total_a": "",
-                "confidence_score": None,
-                "pred_outcome": None,
-                "pred_outcome_conf": None,
-                "pred_goals": None,
-                "pred_goals_conf": None,
-                "pred_corners": None,
-                "pred_corners_conf": None,
-                "rec_prediction": None,
-                "match_id": None,
-            }
+
+def _feed_head(f) -> str:
+    f.seek(0)
+    return hashlib.sha1(f.read(TEXT_FEED_HEAD_BYTES)).hexdigest()
+
+
+def follow_text_feed(filepath) -> list[dict]:
+    """Parsed matches of a text feed that only ever grows at the end.
+
+    The first call parses the whole file, on a process pool when it is at
+    least PARALLEL_TEXT_PARSE_BYTES; later calls parse only the blocks
+    appended since, so refreshing costs the new content, not the file.
+    Indexes and match_ids are those a full parse would give. A feed that
+    shrank or whose first bytes changed was replaced, and is parsed again
+    from the start. Returns a new list each call; the match dicts are
+    shared with later calls and must not be modified.
+    """
+    path = os.path.abspath(filepath)
+    errors = []
+    skipped = []
+    with _text_feed_tails_lock, open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        head = _feed_head(f)
+        state = _text_feed_tails.get(path)
+        if state and (size < state["size"] or head != state["head"]):
+            state = None
+        if state and size == state["size"]:
+            return list(state["matches"])
+
+        if (
+            state is None
+            and TEXT_PARSE_WORKERS > 1
+            and size >= PARALLEL_TEXT_PARSE_BYTES
+        ):
+            state = _parse_feed_in_parallel(path, f, size, errors, skipped)
+            if state is None:
+                errors.clear()
+                skipped.clear()
+                state = _parse_appended_blocks(f, None, errors, skipped)
+        else:
+            state = _parse_appended_blocks(f, state, errors, skipped)
+        state.update(size=size, head=head)
+        _text_feed_tails[path] = state
+        result = list(state["matches"])
+
+    for message in errors:
+        st.warning(message)
+    for index in skipped:
+        st.warning(f"Skipped block {index} due to missing core info (team/date).")
+    return result
+
+
+def _parse_appended_blocks(f, state, errors, skipped) -> dict:
+    """``state`` advanced over the blocks of ``f`` from its last block on.
+
+    Without a ``state``, or when the last block no longer starts where it
+    did (not an append), the file is parsed from the start.
+    """
+    offset = state["offset"] if state else 0
+    f.seek(offset)
+    pieces = f.read().split(_BLOCK_MARKER_BYTES)
+    if state and pieces[0]:
+        state = None
+        offset = 0
+        f.seek(0)
+        pieces = f.read().split(_BLOCK_MARKER_BYTES)
+    if state is None:
+        state = {"offset": 0, "index": 1, "tail_match": False, "matches": []}
+
+    matches = state["matches"]
+    if state["tail_match"]:
+        matches.pop()  # Parsed again below, with whatever was added to it
+    index = state["index"]
+    block_offset = offset + len(pieces[0])
+    match = None
+    for index, piece in enumerate(pieces[1:], start=state["index"]):
+        state["offset"] = block_offset
+        block_offset += len(_BLOCK_MARKER_BYTES) + len(piece)
+        block = (_BLOCK_MARKER_BYTES + piece).decode("utf-8", errors="replace")
+        match = text_feed.parse_block(block, index, errors)
+        if match is None:
+            skipped.append(index)
+        else:
+            matches.append(match)
+    state.update(index=index, tail_match=match is not None)
+    return state
+
+
+def _parse_feed_in_parallel(path, f, size, errors, skipped):
+    """follow_text_feed's state for a large feed parsed on a process pool.
+
+    None when the feed grew during the parse, since the blocks parsed then
+    no longer match ``size``.
+    """
+    matches = text_feed.parse_feed_parallel(path, TEXT_PARSE_WORKERS, errors, skipped)
+    if os.fstat(f.fileno()).st_size != size:
+        return None
+    blocks = len(matches) + len(skipped)
+    with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as data:
+        offset = max(data.rfind(_BLOCK_MARKER_BYTES), 0)
+    return {
+        "offset": offset,
+        "index": max(blocks, 1),
+        # Blocks are merged in feed order, so a skipped last block is last
+        "tail_match": blocks > 0 and (not skipped or skipped[-1] != blocks),
+        "matches": matches,
+    }
+
+
+# --- File Identity ---
+# abs path -> (size, mtime_ns, sha1) of the last version hashed
+_file_fingerprints = {}
+
+
+def _file_sha1(filepath) -> str:
+    with open(filepath, "rb") as f:
+        return hashlib.file_digest(f, "sha1").hexdigest()
+
+
+def file_fingerprint(filepath) -> str:
+    """SHA-1 of a file's content, re-hashed only when its size or mtime change."""
+    path = os.path.abspath(filepath)
+    stat = os.stat(path)
+    known = _file_fingerprints.get(path)
+    if known and known[:2] == (stat.st_size, stat.st_mtime_ns):
+        return known[2]
+    digest = _file_sha1(path)
+    _file_fingerprints[path] = (stat.st_size, stat.st_mtime_ns, digest)
+    return digest
+
+
+# --- Columnar Cache ---
+def _columnar_cache_path(filepath) -> Path:
+    """Sidecar location for a weekly CSV, keyed by its path, size and mtime."""
+    source = os.path.abspath(filepath)
+    stat = os.stat(source)
+    source_key = hashlib.sha1(source.encode("utf-8")).hexdigest()[:8]
+    version_key = hashlib.sha1(
+        f"{COLUMNAR_CACHE_VERSION}|{stat.st_size}|{stat.st_mtime_ns}".encode("utf-8")
+    ).hexdigest()[:12]
+    stem = os.path.basename(source).split(".", 1)[0]
+    return COLUMNAR_CACHE_DIR / f"{stem}-{source_key}-{version_key}.arrow"
+
+
+def _drop_stale_sidecars(cache_path) -> None:
+    """Drops sidecars written for older versions of the same source file."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    source_prefix = cache_path.name.rsplit("-", 1)[0]
+    for stale_path in cache_path.parent.glob(f"{source_prefix}-*.arrow"):
+        if stale_path != cache_path:
+            try:
+                stale_path.unlink(missing_ok=True)
+            except OSError:
+                pass  # Still memory-mapped by a reader (Windows)
+
+
+def _temp_path(path) -> Path:
+    """Name to write ``path`` under before replacing it, unique per writer.
+
+    Sessions run on threads of one process, so the pid alone would let two
+    loads of the same week write into each other's file.
+    """
+    path = Path(path)
+    return path.with_name(f"{path.name}.{os.getpid()}-{uuid.uuid4().hex[:8]}.tmp")
+
+
+def _write_columnar_cache(df, cache_path) -> None:
+    _drop_stale_sidecars(cache_path)
+    tmp_path = _temp_path(cache_path)
+    try:
+        # Uncompressed Arrow IPC: wide, short week tables read far faster than Parquet
+        df.reset_index(drop=True).to_feather(tmp_path, compression="uncompressed")
+        os.replace(tmp_path, cache_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def week_file_suffix(filepath) -> str:
+    """The WEEK_FILE_SUFFIXES entry ``filepath`` ends with, or ""."""
+    name = os.path.basename(str(filepath))
+    # Longest first, so "36.csv.gz" is not taken for a plain CSV
+    for suffix in sorted(WEEK_FILE_SUFFIXES, key=len, reverse=True):
+        if name.endswith(suffix):
+            return suffix
+    return ""
+
+
+def _open_week_file(filepath):
+    """Binary file object over a weekly CSV's decompressed bytes."""
+    suffix = week_file_suffix(filepath)
+    if suffix == ".csv.gz":
+        return gzip.open(filepath, "rb")
+    if suffix == ".csv.zst":
+        return pa.input_stream(str(filepath), compression="zstd")
+    return open(filepath, "rb")
+
+
+def _read_week_header(filepath) -> list[str]:
+    """Column names of a weekly file, with repeats suffixed ".1", ".2" like pandas."""
+    if week_file_suffix(filepath) == ".parquet":
+        names = pq.read_schema(filepath).names
+    else:
+        with io.TextIOWrapper(
+            _open_week_file(filepath), encoding="utf-8", newline=""
+        ) as f:
+            names = next(csv.reader(f), [])
+    header = []
+    seen = set()
+    for name in names:
+        unique_name = name
+        suffix = 0
+        while unique_name in seen:
+            suffix += 1
+            unique_name = f"{name}.{suffix}"
+        seen.add(unique_name)
+        header.append(unique_name)
+    return header
+
+
+def _read_csv_arrow(filepath, header, usecols, declared) -> pd.DataFrame:
+    arrow_types = {schema.FLOAT: pa.float64(), schema.INT: pa.float64()}
+    table = pa_csv.read_csv(
+        filepath,
+        read_options=pa_csv.ReadOptions(column_names=header, skip_rows=1),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={
+                col: arrow_types.get(dtype, pa.string())
+                for col, dtype in declared.items()
+            },
+            include_columns=usecols,
+            null_values=CSV_NA_VALUES,
+            strings_can_be_null=True,
+        ),
+    )
+    # Finish the casts on the Arrow table, before any pandas column exists
+    columns = []
+    for name, column in zip(table.column_names, table.columns):
+        if pa.types.is_string(column.type):
+            column = column.fill_null("")
+        elif declared.get(name) == schema.INT:
+            try:
+                column = column.cast(pa.int64())
+            except pa.ArrowInvalid:
+                pass  # Fractional values: keep the float column
+        columns.append(column)
+    table = pa.table(columns, names=table.column_names)
+    return table.to_pandas(
+        types_mapper={pa.string(): STRING_DTYPE, pa.int64(): pd.Int64Dtype()}.get
+    )
+
+
+def _read_csv_pandas(filepath, header, usecols, declared) -> pd.DataFrame:
+    pandas_types = {schema.FLOAT: "float64", schema.INT: "float64"}
+    dtype = {col: pandas_types.get(t, STRING_DTYPE) for col, t in declared.items()}
+    try:
+        with _open_week_file(filepath) as f:
+            df = pd.read_csv(f, header=0, names=header, usecols=usecols, dtype=dtype)
+    except ValueError:
+        # A value that does not fit its declared dtype: coerce column by column
+        with _open_week_file(filepath) as f:
+            df = pd.read_csv(f, header=0, names=header, usecols=usecols)
+        for col, col_dtype in declared.items():
+            if col_dtype == schema.STRING:
+                df[col] = df[col].astype(STRING_DTYPE)
+            else:
+                df[col] = pd.to_numeric(df[col], errors="coerce").astype("float64")
+
+    for col, col_dtype in declared.items():
+        if col_dtype == schema.INT:
+            try:
+                df[col] = df[col].astype("Int64")
+            except (TypeError, ValueError):
+                pass  # Fractional values: keep the float column
+
+    string_cols = df.select_dtypes(include=["object", "string"]).columns
+    df[string_cols] = df[string_cols].fillna("")
+    return to_nullable_dtypes(df)
+
+
+def _parse_weekly_file(filepath, groups=None, columns=None) -> pd.DataFrame:
+    """Typed frame for one weekly file, as declared by the schema registry.
+
+    The file may be any of WEEK_FILE_SUFFIXES; Parquet files written by
+    compress_week_file already carry these types. ``groups`` restricts the
+    parse to those schema groups and ``columns`` to those columns; by
+    default every column is loaded, including ones the registry does not
+    know yet. Missing and unknown columns are reported by full parses only.
+    """
+    header = _read_week_header(filepath)
+    usecols = header if groups is None else schema.columns_in_groups(header, groups)
+    if columns is not None:
+        usecols = [col for col in usecols if col in columns]
+    report = groups is None and columns is None
+    if report:
+        _report_unknown_columns(filepath, header)
+    declared = {
+        col: schema.COLUMNS[col].dtype for col in schema.columns_in_groups(usecols)
+    }
+
+    df = None
+    if week_file_suffix(filepath) == ".parquet":
+        table = pq.read_table(filepath, columns=usecols)
+        df = to_nullable_dtypes(_arrow_to_frame(table))
+    elif PYARROW_AVAILABLE:
+        try:
+            df = to_nullable_dtypes(
+                _read_csv_arrow(filepath, header, usecols, declared)
+            )
+        except pa.ArrowInvalid:
+            pass  # Let pandas coerce the values Arrow rejected
+    if df is None:
+        df = _read_csv_pandas(filepath, header, usecols, declared)
+
+    for col in schema.non_nullable_columns(df.columns) if report else []:
+        _report_missing_values(filepath, col, (df[col].isna() | (df[col] == "")).sum())
+    return df
+
+
+def _report_unknown_columns(filepath, header) -> None:
+    unknown = schema.unknown_columns(header)
+    if unknown:
+        add_transient_message(
+            "warning",
+            f"'{filepath}' has columns missing from the schema, loaded with "
+            f"inferred types: {', '.join(unknown)}",
         )
 
-        home_team_buffer = None
 
-        for line_num, line in enumerate(lines):
-            line = line.strip()
-            if not line:
-                continue
+def _report_missing_values(filepath, col, missing_count) -> None:
+    if missing_count > 0:
+        add_transient_message(
+            "warning",
+            f"'{filepath}' has {missing_count} rows without a value for '{col}'.",
+        )
 
+
+# --- Streaming Ingest ---
+def _coerce_block(batch, declared, fractional):
+    """_read_csv_arrow's casts for one block; text is written as large_string.
+
+    An INT column that cannot be cast is added to ``fractional`` before the
+    ArrowInvalid propagates, so the next pass keeps it as float64.
+    """
+    columns = []
+    for name, column in zip(batch.schema.names, batch.columns):
+        if pa.types.is_string(column.type):
+            column = column.fill_null("").cast(pa.large_string())
+        elif pa.types.is_null(column.type):
+            column = column.cast(pa.large_string())
+        elif declared.get(name) == schema.INT and name not in fractional:
             try:
-                if line.startswith("📅"):
-                    m = re.search(r"📅\s*([\d/]+),\s*🕛\s*([\d:]+)", line)
-                    if m:
-                        match["date"], match["time"] = m.groups()
-                elif re.match(
-                    r"^[🌍🌎🌏🗺️⚽🏀🏈⚾🥎🎾🏐🏉🎱🔮🎮👾🏆🥇🥈🥉🏅🎖️🏵️🎗️🎀🎁🎂🎃🎄🎅🎆🎇✨🎈🎉🎊🎋🎍🎎🎏🎐🎑🧧🎀🎁🎗️🎟️🎫",
-                    line,
-                ):
-                    parts = line.split(" ", 1)
-                    if len(parts) == 2:
-                        match["league"] = parts
-                        country_parts = parts.split(",", 1)
-                        match["country"] = country_parts.strip()
-                        if len(country_parts) > 1:
-                            league_part = re.sub(
-                                r"\s*\(\s*\d+\s*\)\s*$", "", country_parts
-                            ).strip()
-                            match["league_name"] = league_part
-                        else:
-                            match["league_name"] = match["country"]
-                elif line.startswith("⚡"):
-                    m = re.search(
-                        r"\*(.*?)(?:\s*\((.*?)\))?\s*v\s*(.*?)(?:\s*\((.*?)\))?\*", line
-                    )
-                    if m:
-                        (
-                            match["home_team"],
-                            match["home_rank"],
-                            match["away_team"],
-                            match["away_rank"],
-                        ) = [g.strip() if g else "" for g in m.groups()]
-                        home_team_buffer = match["home_team"]
-
-                elif line.startswith("✨ *Expected Value*:"):
-                    match["exp_val_h"] = (
-                        re.search(r"H\*:\s*([\d.]+%)", line).group(1)
-                        if re.search(r"H\*:\s*([\d.]+%)", line)
-                        else None
-                    )
-                    match["exp_val_d"] = (
-                        re.search(r"D\*:\s*([\d.]+%)", line).group(1)
-                        if re.search(r"D\*:\s*([\d.]+%)", line)
-                        else None
-                    )
-                    match["exp_val_a"] = (
-                        re.search(r"A\*:\s*([\d.]+%)", line).group(1)
-                        if re.search(r"A\*:\s*([\d.]+%)", line)
-                        else None
-                    )
-                elif line.startswith("✨ *Advice*:"):
-                    match["advice"] = line.split(":", 1).strip()
-                elif line.startswith("🎯"):
-                    match["value_bets"] = line.split(":", 1).strip()
-
-                elif line.startswith("📊 *H/All Form*:"):
-                    form_line = line.split(": ", 1)
-                    parts = form_line.split("//")
-                    home_parts = parts.split("║") if "║" in parts else [parts, ""]
-                    away_parts = (
-                        parts.split("║")
-                        if len(parts) > 1 and "║" in parts
-                        else [parts if len(parts) > 1 else "", ""]
-                    )
-                    match["form_home"] = home_parts.strip()
-                    match["form_away"] = away_parts[0].strip()
-                elif line.startswith("📈 *PPG:"):
-                    m_ppg = re.search(
-                        r"H\*:\s*([\d.]+)\s*\|\s*All:\s*([\d.]+)\s*║\s*\*A\*:\s*([\d.]+)\s*\|\s*All:\s*([\d.]+)",
-                        line,
-                    )
-                    if m_ppg:
-                        try:
-                            match["ppg_h"] = float(m_ppg.group(1))
-                        except:
-                            pass
-                        try:
-                            match["ppg_h_all"] = float(m_ppg.group(2))
-                        except:
-                            pass
-                        try:
-                            match["ppg_a"] = float(m_ppg.group(3))
-                        except:
-                            pass
-                        try:
-                            match["ppg_a_all"] = float(m_ppg.group(4))
-                        except:
-                            pass
-                elif line.startswith("⚽ *Goals/g:"):
-                    m_goals = re.search(
-                        r"H\*:\s*([\d.]+)\s*\(xG:\s*(.*?)\)\s*\|\s*\*A\*:\s*([\d.]+)\s*\(xG:\s*(.*?)\)",
-                        line,
-                    )
-                    if m_goals:
-                        try:
-                            match["goals_h"] = float(m_goals.group(1))
-                        except:
-                            pass
-                        xg_h_val = m_goals.group(2).strip()
-                        match["xg_h"] = (
-                            float(xg_h_val) if xg_h_val and xg_h_val != "" else None
-                        )
-                        try:
-                            match["goals_a"] = float(m_goals.group(3))
-                        except:
-                            pass
-                        xg_a_val = m_goals.group(4).strip().rstrip(")")
-                        match["xg_a"] = (
-                            float(xg_a_val) if xg_a_val and xg_a_val != "" else None
-                        )
-                elif line.startswith("⚽ *Conceded/g:"):
-                    m_conc = re.search(
-                        r"H\*:\s*([\d.]+)\s*\(xGA:\s*(.*?)\)\s*\|\s*\*A\*:\s*([\d.]+)\s*\(xGA:\s*(.*?)\)",
-                        line,
-                    )
-                    if m_conc:
-                        try:
-                            match["conceded_h"] = float(m_conc.group(1))
-                        except:
-                            pass
-                        xga_h_val = m_conc.group(2).strip()
-                        match["xga_h"] = (
-                            float(xga_h_val) if xga_h_val and xga_h_val != "" else None
-                        )
-                        try:
-                            match["conceded_a"] = float(m_conc.group(3))
-                        except:
-                            pass
-                        xga_a_val = m_conc.group(4).strip().rstrip(")")
-                        match["xga_a"] = (
-                            float(xga_a_val) if xga_a_val and xga_a_val != "" else None
-                        )
-                elif line.startswith("🥅 *Halves Over 0.5:"):
-                    parts = line.split(": ", 1).split(" ║ ")
-                    match["halves_o05_h"] = parts.strip()
-                    match["halves_o05_a"] = parts.strip()
-                elif line.startswith("⚽ *Team Goals:"):
-                    parts = line.split(": ", 1).split(" ║ ")
-                    match["team_goals_h"] = parts.strip()
-                    match["team_goals_a"] = parts.strip()
-                elif line.startswith("🥅 *Match Goals:"):
-                    parts = line.split(": ", 1).split(" ║ ")
-                    match["match_goals_h"] = parts.strip()
-                    match["match_goals_a"] = parts.strip()
-                elif line.startswith("🧼"):
-                    parts = line.split(": ", 1).split(" | ")
-                    cs_h = parts.replace("*A*", "").strip()
-                    cs_a = parts.replace("*A*", "").strip() if len(parts) > 1 else None
-                    match["clean_sheet_h"] = cs_h if cs_h != "nan" else None
-                    match["clean_sheet_a"] = cs_a if cs_a and cs_a != "nan" else None
-                elif line.startswith("🏆"):
-                    parts = line.split(": ", 1).split(" | *A*: ")
-                    match["win_rates_h"] = parts.strip()
-                    match["win_rates_a"] = parts.strip() if len(parts) > 1 else None
-
-                elif line.startswith("📉 *HvA H2H Record*:"):
-                    m_h2h_hva = re.search(r":\s*([\d\-]+)\/(\d+)", line)
-                    if m_h2h_hva:
-                        match["h2h_hva_record"] = m_h2h_hva.group(1)
-                        try:
-                            match["h2h_hva_games"] = int(m_h2h_hva.group(2))
-                        except:
-                            pass
-                elif line.startswith("📉 *All H2H Record*:"):
-                    m_h2h_all = re.search(r":\s*([\d\-]+)\/(\d+)", line)
-                    if m_h2h_all:
-                        match["h2h_all_record"] = m_h2h_all.group(1)
-                        try:
-                            match["h2h_all_games"] = int(m_h2h_all.group(2))
-                        except:
-                            pass
-                elif line.startswith("📈 *H2H PPG:"):
-                    match["h2h_hva_ppg_str"] = line.split(": ", 1)
-                elif line.startswith("⚽ *H2H Goals Scored:"):
-                    match["h2h_hva_goals_str"] = line.split(": ", 1)
-                elif line.startswith("🥅 *H2H HvA Over/Under*:"):
-                    match["h2h_hva_ou"] = line.split(": ", 1)
-
-                elif line.startswith("✨ *Home Insights*:"):
-                    if current_insight_type:
-                        match[f"insights_{current_insight_type}"] = (
-                            insight_buffer.strip()
-                        )
-                    current_insight_type = "home"
-                    insight_buffer = (
-                        line.split(":", 1).strip() + "\n" if ":" in line else "\n"
-                    )
-                elif line.startswith("✨ *Away Insights*:"):
-                    if current_insight_type:
-                        match[f"insights_{current_insight_type}"] = (
-                            insight_buffer.strip()
-                        )
-                    current_insight_type = "away"
-                    insight_buffer = (
-                        line.split(":", 1).strip() + "\n" if ":" in line else "\n"
-                    )
-                elif line.startswith("✨ *Total Match Insights*:"):
-                    if current_insight_type:
-                        match[f"insights_{current_insight_type}"] = (
-                            insight_buffer.strip()
-                        )
-                    current_insight_type = None
-                    insight_buffer = ""
-                elif line.startswith("⚡*"):
-                    if insight_buffer and current_insight_type in [
-                        "home",
-                        "away",
-                    ]:
-                        match[f"insights_{current_insight_type}"] = (
-                            insight_buffer.strip()
-                        )
-                    insight_buffer = ""
-                    team_name_match = re.match(r"⚡\*(.*?)\s*\(.*?\):", line)
-                    if team_name_match:
-                        team_name_in_line = team_name_match.group(1).strip()
-                        if home_team_buffer and team_name_in_line == home_team_buffer:
-                            current_insight_type = "total_h"
-                        else:
-                            current_insight_type = "total_a"
-                        insight_buffer = (
-                            line.split("):", 1).strip() + "\n" if "):" in line else ""
-                        )
-                    else:
-                        if current_insight_type:
-                            insight_buffer += line + "\n"
-
-                elif current_insight_type and line.startswith("   -"):
-                    insight_buffer += line.strip() + "\n"
-                elif current_insight_type and not re.match(
-                    r"^(?:🎲|Match Outcome:|Over/Under Goals:|Over/Under Corners:|Recommended Prediction:)",
-                    line,
-                ):
-                    insight_buffer += line.strip() + "\n"
-
-                elif line.startswith("🎲"):
-                    if insight_buffer and current_insight_type:
-                        match[f"insights_{current_insight_type}"] = (
-                            insight_buffer.strip()
-                        )
-                        insight_buffer = ""
-                        current_insight_type = None
-                    m_conf = re.search(r"Score:\s*(\d+)", line)
-                    if m_conf:
-                        try:
-                            match["confidence_score"] = int(m_conf.group(1))
-                        except:
-                            pass
-                elif line.startswith("Match Outcome:"):
-                    m_pred = re.search(r":\s*(.*?)(?:\s*\((\d+)/10\))?$", line)
-                    if m_pred:
-                        match["pred_outcome"] = m_pred.group(1).strip()
-                        if m_pred.group(2):
-                            try:
-                                match["pred_outcome_conf"] = int(m_pred.group(2))
-                            except:
-                                pass
-                elif line.startswith("Over/Under Goals:"):
-                    m_pred = re.search(r":\s*(.*?)(?:\s*\((\d+)/10\))?$", line)
-                    if m_pred:
-                        match["pred_goals"] = m_pred.group(1).strip()
-                        if m_pred.group(2):
-                            try:
-                                match["pred_goals_conf"] = int(m_pred.group(2))
-                            except:
-                                pass
-                elif line.startswith("Over/Under Corners:"):
-                    m_pred = re.search(r":\s*(.*?)(?:\s*\((\d+)/10\))?$", line)
-                    if m_pred:
-                        match["pred_corners"] = m_pred.group(1).strip()
-                        if m_pred.group(2):
-                            try:
-                                match["pred_corners_conf"] = int(m_pred.group(2))
-                            except:
-                                pass
-                elif line.startswith("Recommended Prediction:"):
-                    match["rec_prediction"] = line.split(":", 1).strip()
-
-                elif line_num == len(lines) - 1:
-                    if insight_buffer and current_insight_type:
-                        match[f"insights_{current_insight_type}"] = (
-                            insight_buffer.strip()
-                        )
-
-            except Exception as e_line:
-                st.warning(
-                    f"Error parsing line {line_num + 1} in block {i + 1}: '{line}' - {e_line}"
+                column = column.cast(pa.int64())
+            except pa.ArrowInvalid:
+                fractional.add(name)
+                raise
+        columns.append(column)
+    return pa.RecordBatch.from_arrays(columns, names=batch.schema.names)
+
+
+def _normalise_prediction_block(batch):
+    """prepare_week_frame's prediction normalisation for one block.
+
+    Each of CLEANED_PREDICTION_COLUMNS is dictionary-encoded, so
+    clean_prediction_string runs once per distinct value in the block.
+    """
+    for name in CLEANED_PREDICTION_COLUMNS:
+        index = batch.schema.get_field_index(name)
+        if index < 0:
+            continue
+        encoded = pc.dictionary_encode(batch.column(index))
+        cleaned = pa.array(
+            [
+                grading.clean_prediction_string(value)
+                for value in encoded.dictionary.to_pylist()
+            ],
+            pa.large_string(),
+        )
+        batch = batch.set_column(index, name, pc.take(cleaned, encoded.indices))
+    return batch
+
+
+def _stream_blocks(
+    filepath, out_path, header, column_types, declared, fractional, clean
+) -> dict:
+    non_nullable = schema.non_nullable_columns(header)
+    missing = dict.fromkeys(non_nullable, 0)
+    seen_ids = set()
+    rows = duplicates = 0
+    tmp_path = _temp_path(out_path)
+    writer = None
+    # A file object: given a path, Arrow reads far ahead of the parser and
+    # holds tens of MB of the file in memory
+    source = _open_week_file(filepath)
+    try:
+        reader = pa_csv.open_csv(
+            source,
+            read_options=pa_csv.ReadOptions(
+                column_names=header, skip_rows=1, block_size=STREAMING_BLOCK_BYTES
+            ),
+            # Quoted cells span lines, so block boundaries must respect quoting
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=column_types,
+                null_values=CSV_NA_VALUES,
+                strings_can_be_null=True,
+            ),
+        )
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            for batch in reader:
+                batch = _coerce_block(batch, declared, fractional)
+                for col in non_nullable:
+                    column = batch.column(col)
+                    missing[col] += column.null_count
+                    if pa.types.is_large_string(column.type):
+                        missing[col] += pc.sum(pc.equal(column, "")).as_py() or 0
+
+                if "match_id" in header:
+                    # First row per match_id across the whole file
+                    keep = []
+                    match_ids = batch.column("match_id").to_pylist()
+                    for i, match_id in enumerate(match_ids):
+                        if match_id not in seen_ids:
+                            seen_ids.add(match_id)
+                            keep.append(i)
+                    if len(keep) < batch.num_rows:
+                        duplicates += batch.num_rows - len(keep)
+                        batch = batch.take(pa.array(keep, pa.int64()))
+                if clean:
+                    batch = _normalise_prediction_block(batch)
+
+                if writer is None:
+                    writer = pa.ipc.new_file(sink, batch.schema)
+                writer.write_batch(batch)
+                rows += batch.num_rows
+            if writer is None:
+                empty = pa.RecordBatch.from_pylist([], schema=reader.schema)
+                batch = _coerce_block(empty, declared, fractional)
+                writer = pa.ipc.new_file(sink, batch.schema)
+            writer.close()
+        os.replace(tmp_path, out_path)
+    finally:
+        source.close()
+        tmp_path.unlink(missing_ok=True)
+
+    for col in non_nullable:
+        _report_missing_values(filepath, col, missing[col])
+    return {"rows": rows, "duplicates": duplicates}
+
+
+def _streams_into_arrow(filepath) -> bool:
+    """Whether a weekly file is ingested through stream_weekly_csv.
+
+    Compressed CSVs always are: their size on disk says little about how
+    large the parse would get.
+    """
+    suffix = week_file_suffix(filepath)
+    if suffix in (".csv.gz", ".csv.zst"):
+        return True
+    return suffix != ".parquet" and os.path.getsize(filepath) >= STREAMING_INGEST_BYTES
+
+
+def stream_weekly_csv(filepath, out_path, clean_predictions=False) -> dict:
+    """Parses a weekly CSV, plain or compressed, straight into an Arrow file.
+
+    Each block of STREAMING_BLOCK_BYTES is type-coerced like
+    _parse_weekly_file, stripped of match_ids already seen earlier in the
+    file and appended to ``out_path``, so memory is bounded by the block size
+    and the set of match_ids rather than the file. ``clean_predictions`` also
+    normalises CLEANED_PREDICTION_COLUMNS, giving the prepare_week_frame
+    result.
+    Returns the rows written and duplicates dropped.
+
+    Column types are fixed by the first block. When a later block disagrees
+    (an INT column with fractional values, an inferred column changing type)
+    the file is streamed again keeping that INT column float64, or reading
+    the columns missing from the schema as text. Values Arrow cannot convert
+    at all raise ArrowInvalid; read_weekly_frame then parses the whole file.
+    """
+    header = _read_week_header(filepath)
+    _report_unknown_columns(filepath, header)
+    declared = {
+        col: schema.COLUMNS[col].dtype for col in schema.columns_in_groups(header)
+    }
+    arrow_types = {schema.FLOAT: pa.float64(), schema.INT: pa.float64()}
+    column_types = {
+        col: arrow_types.get(dtype, pa.string()) for col, dtype in declared.items()
+    }
+    out_path = Path(out_path)
+    fractional = set()
+    while True:
+        known_fractional = len(fractional)
+        try:
+            result = _stream_blocks(
+                filepath,
+                out_path,
+                header,
+                column_types,
+                declared,
+                fractional,
+                clean_predictions,
+            )
+        except pa.ArrowInvalid:
+            if len(fractional) > known_fractional:
+                continue
+            if len(column_types) < len(header):
+                column_types.update(
+                    {col: pa.string() for col in header if col not in column_types}
                 )
                 continue
+            raise
+        if result["duplicates"]:
+            add_transient_message(
+                "warning",
+                f"Found {result['duplicates']} duplicate match_id entries in "
+                f"'{filepath}'. Keeping the first occurrence of each.",
+            )
+        return result
+
+
+def to_nullable_dtypes(df) -> pd.DataFrame:
+    """Swaps numpy int/bool and object columns for pandas' nullable dtypes.
+
+    Integers become Int64, booleans boolean and text string (Arrow-backed when
+    pyarrow is installed), so missing values stay pd.NA inside typed columns
+    instead of being boxed into object columns; display code turns them into
+    None. Float columns keep numpy float64 with NaN: pandas stores them as one
+    consolidated block, whereas ~300 separate Float64 arrays made every load
+    several times slower.
+    """
+    nullable_dtypes = {}
+    for col, dtype in df.dtypes.items():
+        if isinstance(dtype, pd.api.extensions.ExtensionDtype):
+            continue
+        if pd.api.types.is_bool_dtype(dtype):
+            nullable_dtypes[col] = "boolean"
+        elif pd.api.types.is_integer_dtype(dtype):
+            nullable_dtypes[col] = "Int64"
+        elif pd.api.types.is_object_dtype(dtype):
+            nullable_dtypes[col] = STRING_DTYPE
+    if not nullable_dtypes:
+        return df
+    return df.astype(nullable_dtypes)
+
+
+def _arrow_to_frame(table) -> pd.DataFrame:
+    # Pandas metadata only records "string", which would come back as
+    # Python-object storage; keep text columns Arrow-backed instead.
+    return table.to_pandas(
+        types_mapper={
+            pa.string(): STRING_DTYPE,
+            pa.large_string(): STRING_DTYPE,
+            pa.int64(): pd.Int64Dtype(),
+        }.get
+    )
+
+
+def _select_columns(df, columns) -> pd.DataFrame:
+    if columns is None:
+        return df
+    return df[[col for col in columns if col in df.columns]]
+
+
+def _read_columnar_cache(cache_path, columns=None) -> pd.DataFrame:
+    if columns is not None:
+        # Only the requested columns' buffers are read from the file
+        with pa.OSFile(str(cache_path)) as source:
+            present = set(pa.ipc.open_file(source).schema.names)
+        columns = [col for col in columns if col in present]
+    # Memory-mapped: text columns stay views of the file's pages
+    return _arrow_to_frame(
+        feather.read_table(cache_path, columns=columns, memory_map=True)
+    )
+
+
+def read_weekly_frame(filepath, columns=None) -> pd.DataFrame:
+    """Typed frame for one weekly CSV, read from its Arrow sidecar when fresh.
+
+    A cache miss parses the CSV once and writes the sidecar; failing to write
+    it is not fatal, the parsed frame is returned either way. CSVs of
+    STREAMING_INGEST_BYTES or more, and compressed CSVs, are streamed into
+    the sidecar instead (see stream_weekly_csv), so their sidecar is already
+    deduplicated on match_id. ``columns``
+    limits the frame to those columns, skipping any the week does not have.
+    """
+    if not PYARROW_AVAILABLE:
+        return _select_columns(_parse_weekly_file(filepath), columns)
+
+    cache_path = _columnar_cache_path(filepath)
+    if cache_path.exists():
+        try:
+            return _read_columnar_cache(cache_path, columns)
+        except Exception:
+            cache_path.unlink(missing_ok=True)
+
+    if _streams_into_arrow(filepath):
+        try:
+            _drop_stale_sidecars(cache_path)
+            stream_weekly_csv(filepath, cache_path)
+            return _read_columnar_cache(cache_path, columns)
+        except (pa.ArrowInvalid, OSError):
+            pass  # Parse the whole file below
+
+    df = _parse_weekly_file(filepath)
+    try:
+        _write_columnar_cache(df, cache_path)
+    except Exception as e:
+        add_transient_message(
+            "warning", f"Could not write columnar cache for '{filepath}': {e}"
+        )
+    return _select_columns(df, columns)
+
+
+def read_week_columns(filepath, columns) -> pd.DataFrame:
+    """``columns`` of one weekly file, without parsing the rest of it.
+
+    Read from the Arrow sidecar when it is fresh. Otherwise only those
+    columns are parsed and no sidecar is written, so summarising every week
+    (week_summary, season_categories) never costs a full parse of each.
+    """
+    if PYARROW_AVAILABLE:
+        cache_path = _columnar_cache_path(filepath)
+        if cache_path.exists():
+            try:
+                return _read_columnar_cache(cache_path, columns)
+            except Exception:
+                pass  # read_weekly_frame replaces it on the next full load
+    return _parse_weekly_file(filepath, columns=columns)
+
+
+def read_match_row(filepath, match_id) -> pd.DataFrame:
+    """Every column of the first row in a weekly CSV with ``match_id``.
+
+    With the sidecar memory-mapped only the match_id column is scanned and
+    the one matching row copied out, instead of converting the whole week.
+    """
+    if PYARROW_AVAILABLE:
+        cache_path = _columnar_cache_path(filepath)
+        if not cache_path.exists():
+            read_weekly_frame(filepath)  # Parses the CSV and writes the sidecar
+        if cache_path.exists():
+            table = feather.read_table(cache_path, memory_map=True)
+            rows = table.filter(pc.equal(table["match_id"], match_id))
+            return _arrow_to_frame(rows.slice(0, 1))
+
+    df = read_weekly_frame(filepath)
+    return df[df["match_id"] == match_id].head(1)
+
+
+def prepare_week_frame(df) -> pd.DataFrame:
+    """Keeps the first row per match_id and normalises rec_prediction.
+
+    Each of CLEANED_PREDICTION_COLUMNS is normalised once per distinct value
+    (grading.normalise_predictions).
+    """
+    df = df.drop_duplicates(subset=["match_id"], keep="first").reset_index(drop=True)
+    for col in CLEANED_PREDICTION_COLUMNS:
+        if col in df.columns:
+            df[col] = grading.normalise_predictions(df[col])
+    if "rec_prediction" in df.columns:
+        # The pages split rec_prediction without checking for a missing value
+        df["rec_prediction"] = df["rec_prediction"].fillna("")
+    return df
+
+
+# --- Grade Store ---
+# One Arrow file per weekly file, named after its path rather than its
+# content, so a week rewritten with new results keeps its store. For every
+# match_id it holds, per prediction column, the grade and a fingerprint of
+# the prediction and the result columns it was graded against; only the
+# (match_id, column) pairs whose fingerprint changed are graded again.
+# A fingerprint of 0 marks a grade that is not stored.
+_grade_store_counts = {"reused": 0, "graded": 0}
+
 
-        if match.get("home_team") and match.get("date"):
-            for k in [
-                "insights_home",
-                "insights_away",
-                "insights_total_h",
-                "insights_total_a",
-            ]:
-                if k not in match:
-                    match[k] = ""
-            match["match_id"] = (
-                f"{match['home_team']}_{match['away_team']}_{match['date']}_{i}"
+def _grade_store_path(filepath) -> Path:
+    source = os.path.abspath(filepath)
+    source_key = hashlib.sha1(source.encode("utf-8")).hexdigest()[:8]
+    stem = os.path.basename(source).split(".", 1)[0]
+    return GRADE_STORE_DIR / f"{stem}-{source_key}-v{GRADE_STORE_VERSION}.arrow"
+
+
+def _read_grade_store(store_path) -> pd.DataFrame:
+    try:
+        return feather.read_table(store_path).to_pandas()
+    except (OSError, pa.ArrowInvalid):
+        return pd.DataFrame({"match_id": pd.Series(dtype=object)})
+
+
+def _write_grade_store(store, store_path) -> None:
+    _drop_stale_sidecars(store_path)
+    tmp_path = _temp_path(store_path)
+    try:
+        store.to_feather(tmp_path, compression="uncompressed")
+        os.replace(tmp_path, store_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _value_hashes(values) -> np.ndarray:
+    """uint64 hash of each value; text is hashed once per distinct value."""
+    if pd.api.types.is_numeric_dtype(values):
+        return pd.util.hash_array(values.to_numpy(dtype="float64", na_value=np.nan))
+    codes, uniques = pd.factorize(values)
+    hashes = pd.util.hash_array(np.asarray(uniques, dtype=object))
+    # Code -1 (missing) picks the trailing 0
+    return np.append(hashes, np.uint64(0))[codes]
+
+
+def _mix_hashes(hashes, more) -> np.ndarray:
+    return hashes * np.uint64(0x100000001B3) ^ more
+
+
+def _results_fingerprints(df) -> np.ndarray:
+    """Hash per row of the result columns the grades depend on."""
+    fingerprints = np.zeros(len(df), dtype=np.uint64)
+    for name in grading.RESULT_COLUMNS.values():
+        if name in df.columns:
+            fingerprints = _mix_hashes(fingerprints, _value_hashes(df[name]))
+    return fingerprints
+
+
+def _stored(store, name, positions, missing) -> np.ndarray:
+    """Column ``name`` of the store for each row's ``positions`` (-1: ``missing``)."""
+    if name not in store.columns:
+        return np.full(len(positions), missing)
+    values = store[name].to_numpy(dtype=type(missing))
+    return np.append(values, missing)[positions]
+
+
+def add_stored_grades(df, filepath, columns=None) -> pd.DataFrame:
+    """grading.add_grade_columns, reusing grades stored for ``filepath``.
+
+    A (match_id, prediction column) is graded again only when its prediction
+    or result columns differ from the stored ones, e.g. after results were
+    backfilled or corrected; the store is then rewritten. Without pyarrow,
+    or without a match_id column, every row is graded.
+    """
+    if not PYARROW_AVAILABLE or "match_id" not in df.columns:
+        return grading.add_grade_columns(df, columns)
+
+    store_path = _grade_store_path(filepath)
+    store = _read_grade_store(store_path)
+    match_ids = df["match_id"].astype(str).to_numpy()
+    positions = pd.Index(store["match_id"]).get_indexer(match_ids)
+    updated = {"match_id": match_ids}
+    # Grades of the columns not graded here are kept as they are
+    for name in store.columns.drop("match_id"):
+        missing = (
+            np.uint64(0)
+            if name.endswith("_fingerprint")
+            else np.int8(grading.PENDING)
+        )
+        updated[name] = _stored(store, name, positions, missing)
+
+    graded = grading.available_grade_columns(df, columns)
+    # Only what grading reads, so taking the stale rows copies little
+    sources = [*graded.values(), *grading.RESULT_COLUMNS.values()]
+    inputs = df[[col for col in sources if col in df.columns]]
+    results = _results_fingerprints(inputs)
+    stale = {}
+    for grade_column, column in graded.items():
+        # Bet texts derive from the prediction alone, so hashing the prediction
+        # covers them (GRADE_STORE_VERSION covers bet_text itself)
+        fingerprints = _mix_hashes(results, _value_hashes(inputs[column]))
+        stored = _stored(store, f"{column}_fingerprint", positions, np.uint64(0))
+        updated[f"{column}_fingerprint"] = fingerprints
+        updated[grade_column] = _stored(
+            store, grade_column, positions, np.int8(grading.PENDING)
+        )
+        stale[column] = np.flatnonzero(stored != fingerprints)
+    stale = {column: rows for column, rows in stale.items() if len(rows)}
+    if stale:
+        for column, codes in grading.grade_bet_rows(inputs, stale).items():
+            updated[f"{column}{grading.GRADE_SUFFIX}"][stale[column]] = codes
+    graded_count = sum(map(len, stale.values()))
+    _grade_store_counts["graded"] += graded_count
+    _grade_store_counts["reused"] += len(df) * len(graded) - graded_count
+
+    grades = {
+        grade_column: pd.Series(
+            pd.Categorical.from_codes(updated[grade_column], categories=grading.GRADES),
+            index=df.index,
+        )
+        for grade_column in graded
+    }
+    if stale or len(store) != len(df):
+        try:
+            _write_grade_store(pd.DataFrame(updated), store_path)
+        except Exception as e:
+            add_transient_message(
+                "warning", f"Could not write grade store for '{filepath}': {e}"
             )
-            all_matches.append(match)
-        else:
-            st.warning(f"Skipped block {i + 1} due to missing core info (team/date).")
+    return df.assign(**grades)
 
-    st.success(f"Successfully parsed {len(all_matches)} matches from '{filepath}'.")
-    return all_matches
 
+def grade_store_stats() -> dict:
+    """Rows whose grade was reused from the grade store or graded again."""
+    return dict(_grade_store_counts)
 
-@st.cache_data
-def load_data_from_csv(filepath) -> pd.DataFrame:
-    add_transient_message("info", f"Loading data from CSV file: {filepath}")
 
+def load_data_from_csv(filepath, typed=True, columns=None) -> pd.DataFrame:
+    """Deduplicated match frame for one weekly CSV.
+
+    With ``typed`` (the default) columns keep the dtypes given by
+    to_nullable_dtypes; ``typed=False`` returns the older all-object frame
+    with None for missing values. ``columns`` loads only that projection
+    (e.g. schema.OVERVIEW_COLUMNS). Typed frames hold the
+    schema.CATEGORICAL_COLUMNS as categoricals coded against the season
+    dictionary of the file's directory. Results are cached on the file's
+    content hash, so a week rewritten with final scores is reloaded on the
+    next call.
+    """
     try:
-        df = pd.read_csv(filepath)
-
-        float_cols = [
-            "exp_val_h",
-            "exp_val_d",
-            "exp_val_a",
-            "ppg_h",
-            "ppg_h_all",
-            "ppg_a",
-            "ppg_a_all",
-            "goals_h",
-            "xg_h",
-            "goals_a",
-            "xg_a",
-            "conceded_h",
-            "xga_h",
-            "conceded_a",
-            "xga_a",
-            "1h_o05_h",
-            "1h_o05_a",
-            "2h_o05_h",
-            "2h_o05_a",
-            "team_goals_0_5_h",
-            "team_goals_1_5_h",
-            "team_goals_0_5_a",
-            "team_goals_1_5_a",
-            "match_goals_1_5_a",
-            "match_goals_2_5_h",
-            "match_goals_1_5_h",
-            "match_goals_2_5_a",
-            "clean_sheet_h",
-            "clean_sheet_a",
-            "ht_win_rates_h",
-            "ft_win_rates_h",
-            "ht_win_rates_a",
-            "ft_win_rates_a",
-            "h2h_hva_ppg_str",
-            "h2h_hva_ppg_str",
-            "h2h_h_goals_str",
-            "HeadToHeadHomeXG",
-            "h2h_a_goals_str",
-            "HeadToHeadAwayXG",
-            "h2h_hva_o1_5",
-            "h2h_hva_o2_5",
-            "pred_outcome_conf",
-            "pred_goals_conf",
-            "pred_corners_conf",
-            "pred_cards_conf",
-            "pred_alt_conf",
-            "model_success_rate",
-            "Last5_HomeBothTeamsToScore",
-            "Last5HomeAvergeTotalShots",
-            "Last5HomeAvergeTotalShotsOnGoal",
-            "Last5HomeAvergeTotalFouls",
-            "Last5HomeAvergeTotalcorners",
-            "Last5HomeAvergeTotalYellowCards",
-            "Last5HomeAvergeTotalRedCards",
-            "Last5_AwayBothTeamsToScore",
-            "Last5AwayAvergeTotalShots",
-            "Last5AwayAvergeTotalShotsOnGoal",
-            "Last5AwayAvergeTotalFouls",
-            "Last5AwayAvergeTotalcorners",
-            "Last5AwayAvergeTotalYellowCards",
-            "Last5AwayAvergeTotalRedCards",
-            "l5_home_for_league_avg_shots",
-            "l5_home_for_league_avg_sot",
-            "l5_home_for_league_avg_corners",
-            "l5_home_for_league_avg_fouls",
-            "l5_home_for_league_avg_yellow_cards",
-            "l5_home_for_league_avg_red_cards",
-            "l5_away_for_league_avg_shots",
-            "l5_away_for_league_avg_sot",
-            "l5_away_for_league_avg_corners",
-            "l5_away_for_league_avg_fouls",
-            "l5_away_for_league_avg_yellow_cards",
-            "l5_away_for_league_avg_red_cards",
-            "l5_away_against_league_avg_shots",
-            "l5_away_against_league_avg_sot",
-            "l5_away_against_league_avg_corners",
-            "l5_away_against_league_avg_fouls",
-            "l5_away_against_league_avg_yellow_cards",
-            "l5_away_against_league_avg_red_cards",
-            "l5_home_against_league_avg_shots",
-            "l5_home_against_league_avg_sot",
-            "l5_home_against_league_avg_corners",
-            "l5_home_against_league_avg_fouls",
-            "l5_home_against_league_avg_yellow_cards",
-            "l5_home_against_league_avg_red_cards",
-            "HeadToHeadBTTS",
-            "HeadToHeadHomeTotalShots",
-            "HeadToHeadAwayTotalShots",
-            "HeadToHeadHomeShotsOnTarget",
-            "HeadToHeadAwayShotsOnTarget",
-            "HeadToHeadHomeFouls",
-            "HeadToHeadAwayFouls",
-            "HeadToHeadHomeCorners",
-            "HeadToHeadAwayCorners",
-            "HeadToHeadHomeYellowCards",
-            "HeadToHeadAwayYellowCards",
-            "HeadToHeadHomeRedCards",
-            "HeadToHeadAwayRedCards",
-            "HeadToHeadOver7Corners",
-            "HeadToHeadOver8Corners",
-            "HeadToHeadOver9Corners",
-            "HeadToHeadOver10Corners",
-            "HeadToHeadOver1YellowCards",
-            "HeadToHeadOver2YellowCards",
-            "HeadToHeadOver3YellowCards",
-            "HeadToHeadOver4YellowCards",
-            "HomeGoals",
-            "AwayGoals",
-            "Corners",
-            "YellowCards",
-            "RedCards",
-            "HTRHome",
-            "HTRDraw",
-            "HTRAway",
-            "FTTotalGoalsOver0.5",
-            "FTTotalGoalsOver1.5",
-            "FTTotalGoalsOver2.5",
-            "FTTotalGoalsOver3.5",
-            "FTBTTS",
-            "FHTTotalGoalsOver0.5",
-            "FHTTotalGoalsOver1.5",
-            "FHTTotalGoalsOver2.5",
-            "FHTTotalGoalsOver3.5",
-            "SHTTotalGoalsOver0.5",
-            "SHTTotalGoalsOver1.5",
-            "SHTTotalGoalsOver2.5",
-            "SHTTotalGoalsOver3.5",
-            "HomeWinToNil",
-            "AwayWinToNil",
-            "ScoredFirstTime",
-            "HomeSOTResults",
-            "HomeShotsResults",
-            "HomeFoulsResults",
-            "HomeCornersResults",
-            "HomeOffsidesResults",
-            "HomeYellowsResults",
-            "HomeRedsResults",
-            "HomeGoalKeeperSavesResults",
-            "HomeXGResults",
-            "AwaySOTResults",
-            "AwayShotsResults",
-            "AwayFoulsResults",
-            "AwayCornersResults",
-            "AwayOffsidesResults",
-            "AwayYellowsResults",
-            "AwayRedsResults",
-            "AwayGoalKeeperSavesResults",
-            "AwayXGResults",
-            "HomeGoals",
-            "AwayGoals",
-            "Corners",
-            "YellowCards",
-            "RedCards",
-            "HTRHome",
-            "HTRDraw",
-            "HTRAway",
-            "FTTotalGoalsOver0.5 ",
-            "FTTotalGoalsOver1.5 ",
-            "FTTotalGoalsOver2.5 ",
-            "FTTotalGoalsOver3.5 ",
-            "FTBTTS",
-            "FHTTotalGoalsOver0.5",
-            "FHTTotalGoalsOver1.5",
-            "FHTTotalGoalsOver2.5",
-            "FHTTotalGoalsOver3.5",
-            "SHTTotalGoalsOver0.5",
-            "SHTTotalGoalsOver1.5",
-            "SHTTotalGoalsOver2.5",
-            "SHTTotalGoalsOver3.5",
-            "HomeWinToNil",
-            "AwayWinToNil",
-            "ScoredFirstTime",
-            "Last5HomeOver7Corners",
-            "Last5HomeOver8Corners",
-            "Last5HomeOver9Corners",
-            "Last5HomeOver10Corners",
-            "Last5HomeAvergeTotalYellowCards",
-            "Last5HomeOver1YellowCards",
-            "Last5HomeOver2YellowCards",
-            "Last5HomeOver3YellowCards",
-            "Last5HomeOver4YellowCards",
-            "Last5HomeAvergeTotalRedCards",
-            "Last5AwayOver7Corners",
-            "Last5AwayOver8Corners",
-            "Last5AwayOver9Corners",
-            "Last5AwayOver10Corners",
-            "Last5AwayAvergeTotalYellowCards",
-            "Last5AwayOver1YellowCards",
-            "Last5AwayOver2YellowCards",
-            "Last5AwayOver3YellowCards",
-            "Last5AwayOver4YellowCards",
-            "Last5AwayAvergeTotalRedCards",
-            "l5_league_avg_btts",
-            "l5HomeLeagueCleanSheet",
-            "l5AwayLeagueCleanSheet",
-        ]
+        fingerprint = file_fingerprint(filepath)
+    except OSError:
+        fingerprint = None  # _load_data_from_csv reports the missing file
+    if columns is not None:
+        columns = tuple(columns)
+    if typed:
+        season = _season_week_files(os.path.dirname(filepath))
+        # Hashing the short digest rather than the tuple keeps cache hits cheap
+        season_key = hashlib.sha1(repr(season).encode("utf-8")).hexdigest()
+        df = _load_categorical_frame(filepath, fingerprint, columns, season_key, season)
+    else:
+        df = _load_data_from_csv(filepath, fingerprint, typed, columns)
+    return df.copy(deep=False)
+
 
-        int_cols = ["h2h_hva_games", "h2h_all_games", "match_id"]
+# The typed frame with its categoricals coded, per file version and season
+# dictionary: a week added to the season re-codes the cached frames, without
+# reading the weeks again.
+@st.cache_resource(max_entries=64)
+def _load_categorical_frame(
+    filepath, fingerprint, columns, season_key, _season
+) -> pd.DataFrame:
+    df = _load_data_from_csv(filepath, fingerprint, True, columns)
+    if df.empty:
+        return df
+    return to_categoricals(df.copy(deep=False), _season_categories(_season))
 
-        for col in float_cols:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
 
-        for col in int_cols:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
+# One frame per file version, shared by every session of the process; callers
+# get shallow copies. Entries for replaced versions are never hit again.
+@st.cache_resource(max_entries=64)
+def _load_data_from_csv(filepath, fingerprint, typed, columns=None) -> pd.DataFrame:
+    add_transient_message("info", f"Loading data from CSV file: {filepath}")
 
-        string_cols = df.select_dtypes(include="object").columns
-        df[string_cols] = df[string_cols].fillna("")
+    try:
+        df = read_weekly_frame(filepath, _with_grade_sources(columns))
 
         if "match_id" not in df.columns:
             st.error("CSV file is missing the required 'match_id' column.")
             add_transient_message(
                 "error", "CSV file is missing the required 'match_id' column."
             )
-            return []
+            return pd.DataFrame()
 
         duplicates_count = df.duplicated(subset=["match_id"]).sum()
         if duplicates_count > 0:
@@ -668,23 +1017,20 @@ def load_data_from_csv(filepath) -> pd.DataFrame:
                 f"Found {duplicates_count} duplicate match_id entries in the CSV. Keeping the first occurrence of each.",
             )
 
-        df_deduplicated = df.drop_duplicates(subset=["match_id"], keep="first")
-
-        cleaned_data = (
-            df_deduplicated.astype(object)
-            .where(pd.notnull(df_deduplicated), None)
-            .to_dict("records")
+        cleaned_data_df = _select_columns(
+            add_stored_grades(prepare_week_frame(df), filepath, columns), columns
         )
-        cleaned_data_df = pd.DataFrame(cleaned_data)
-
-        if "rec_prediction" in cleaned_data_df.columns:
-            cleaned_data_df["rec_prediction"] = cleaned_data_df["rec_prediction"].apply(
-                clean_prediction_string
+        if not typed:
+            cleaned_data = (
+                cleaned_data_df.astype(object)
+                .where(pd.notnull(cleaned_data_df), None)
+                .to_dict("records")
             )
+            cleaned_data_df = pd.DataFrame(cleaned_data)
 
         add_transient_message(
             "success",
-            f"Successfully loaded {len(cleaned_data)} matches from '{filepath}'.",
+            f"Successfully loaded {len(cleaned_data_df)} matches from '{filepath}'.",
         )
         return cleaned_data_df
 
@@ -696,10 +1042,1010 @@ def load_data_from_csv(filepath) -> pd.DataFrame:
             "error",
             f"CSV file '{filepath}' not found. Please create it or change DATA_SOURCE.",
         )
-        return []
+        return pd.DataFrame()
     except Exception as e:
         add_transient_message("error", f"Error loading data from CSV '{filepath}': {e}")
+        return pd.DataFrame()
+
+
+def _with_grade_sources(columns):
+    """``columns`` plus the columns their grade columns are computed from."""
+    if columns is None:
+        return None
+    graded = [
+        grading.GRADE_COLUMNS[col] for col in columns if col in grading.GRADE_COLUMNS
+    ]
+    if not graded:
+        return columns
+    return tuple(
+        dict.fromkeys([*columns, *graded, *grading.RESULT_COLUMNS.values()])
+    )
+
+
+def load_match_details(filepath, match_id) -> dict:
+    """Full record of one match, for views that loaded only a projection.
+
+    Values are converted like the records of ``typed=False`` frames (None
+    for missing); an unknown match_id or unreadable file gives an empty dict.
+    """
+    try:
+        fingerprint = file_fingerprint(filepath)
+    except OSError:
+        return {}
+    return _load_match_details(filepath, fingerprint, match_id)
+
+
+@st.cache_data(max_entries=256)
+def _load_match_details(filepath, fingerprint, match_id) -> dict:
+    try:
+        df = grading.add_grade_columns(
+            prepare_week_frame(read_match_row(filepath, match_id))
+        )
+    except Exception as e:
+        add_transient_message(
+            "error", f"Could not load match {match_id} from '{filepath}': {e}"
+        )
+        return {}
+    if df.empty:
+        return {}
+    return df.astype(object).where(pd.notnull(df), None).iloc[0].to_dict()
+
+
+def load_weekly_frames(file_paths, max_workers=None) -> list[pd.DataFrame]:
+    """Loads several weekly CSVs on a thread pool, returned in input order.
+
+    The Arrow CSV reader and sidecar reads release the GIL, so threads scale
+    without copying finished frames between processes. Workers share the
+    caller's Streamlit context so cache hits and transient messages behave
+    as in a serial loop.
+    """
+    file_paths = list(file_paths)
+    if max_workers is None:
+        max_workers = INGEST_WORKERS
+    max_workers = max(1, min(max_workers, len(file_paths)))
+    if max_workers == 1:
+        return [load_data_from_csv(f_path) for f_path in file_paths]
+
+    ctx = get_script_run_ctx(suppress_warning=True)
+    with ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix="week-loader",
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx),
+    ) as executor:
+        return list(executor.map(load_data_from_csv, file_paths))
+
+
+def combine_weekly_frames(frames) -> pd.DataFrame:
+    """Concatenates week frames after giving shared columns a common dtype.
+
+    A column typed differently across weeks (e.g. Int64 in one week, float
+    in another that has fractional values) would otherwise concat to
+    object; numeric mixes become float64 and anything else text.
+    """
+    frames = [df for df in frames if not df.empty]
+    if not frames:
+        return pd.DataFrame()
+
+    column_dtypes = {}
+    for df in frames:
+        for col, dtype in df.dtypes.items():
+            column_dtypes.setdefault(col, set()).add(dtype)
+
+    target_dtypes = {}
+    for col, dtypes in column_dtypes.items():
+        if len(dtypes) == 1:
+            continue
+        if all(pd.api.types.is_numeric_dtype(dtype) for dtype in dtypes):
+            target_dtypes[col] = "float64"
+        else:
+            target_dtypes[col] = STRING_DTYPE
+
+    if target_dtypes:
+        frames = [
+            df.astype({c: t for c, t in target_dtypes.items() if c in df.columns})
+            for df in frames
+        ]
+    return pd.concat(frames, ignore_index=True)
+
+
+# --- Week Compression ---
+# zstd level for converted weeks: a one-off cost that reads back as fast as
+# the default level
+WEEK_ZSTD_LEVEL = 19
+
+
+def _week_parquet_writer(path, arrow_schema):
+    return pq.ParquetWriter(
+        path,
+        arrow_schema,
+        compression="zstd",
+        compression_level=WEEK_ZSTD_LEVEL,
+        # Per-column statistics and the Arrow schema copy dominate the footer
+        # of a short, wide week
+        write_statistics=False,
+        store_schema=False,
+    )
+
+
+def _write_week_parquet(df, path) -> None:
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    with _week_parquet_writer(path, table.schema) as writer:
+        writer.write_table(table)
+
+
+def compress_week_file(f_path, suffix=".csv.zst") -> Path:
+    """Rewrites a weekly file as ``<week><suffix>`` in the same directory.
+
+    ``suffix`` is ".csv.zst", ".csv.gz" or ".parquet" (zstd-compressed,
+    holding the typed frame). The new file is parsed back and compared with
+    the source before it is kept; the source itself is left in place, and
+    list_week_files prefers the newer file from then on.
+    """
+    if suffix not in WEEK_FILE_SUFFIXES or suffix == ".csv":
+        raise ValueError(f"Unsupported compressed week format: '{suffix}'")
+    source_suffix = week_file_suffix(f_path)
+    if suffix != ".parquet" and source_suffix == ".parquet":
+        raise ValueError(f"'{f_path}' is Parquet and cannot be rewritten as CSV.")
+
+    f_path = Path(f_path)
+    target = f_path.with_name(f_path.name[: -len(source_suffix)] + suffix)
+    if target == f_path:
+        return target
+    tmp_path = _temp_path(target)
+    expected = _parse_weekly_file(f_path)
+    try:
+        if suffix == ".parquet":
+            _write_week_parquet(expected, tmp_path)
+        elif suffix == ".csv.zst":
+            with _open_week_file(f_path) as source:
+                data = source.read()
+            codec = pa.Codec("zstd", compression_level=WEEK_ZSTD_LEVEL)
+            with open(tmp_path, "wb") as out:
+                out.write(codec.compress(data, asbytes=True))
+        else:
+            with _open_week_file(f_path) as source, gzip.open(tmp_path, "wb") as out:
+                while chunk := source.read(STREAMING_BLOCK_BYTES):
+                    out.write(chunk)
+        os.replace(tmp_path, target)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    if not _parse_weekly_file(target).equals(expected):
+        target.unlink(missing_ok=True)
+        raise ValueError(f"'{target}' does not read back as '{f_path}'.")
+    return target
+
+
+# --- Text Feed Weeks ---
+def text_week_frame(records) -> pd.DataFrame:
+    """Typed week frame from text_feed.to_week_record rows.
+
+    Columns come in registry order with their declared dtypes and the same
+    missing-value conventions as a parsed weekly CSV: "" in text columns,
+    NaN/NA in numeric ones.
+    """
+    present = set().union(*records) if records else set()
+    columns = [col for col in schema.COLUMNS if col in present]
+    df = pd.DataFrame.from_records(records, columns=columns)
+    for col in columns:
+        dtype = schema.COLUMNS[col].dtype
+        if dtype == schema.STRING:
+            df[col] = df[col].astype(STRING_DTYPE).fillna("")
+        else:
+            values = pd.to_numeric(df[col], errors="coerce")
+            df[col] = values.astype("Int64" if dtype == schema.INT else "float64")
+    return df
+
+
+# Matches converted per batch by convert_text_feed
+TEXT_WEEK_BATCH_ROWS = 5000
+
+
+def convert_text_feed(filepath, target) -> dict:
+    """Writes a text feed as a Parquet week file, in the weekly CSV schema.
+
+    The result reads like any other week (list_week_files,
+    _parse_weekly_file, sidecars and the combined store), so text-sourced
+    weeks get the typed CSV code paths. The feed is streamed: every
+    TEXT_WEEK_BATCH_ROWS matches become a text_week_frame batch written to
+    the file, so memory is bounded by the batch rather than the feed. Like
+    compress_week_file, the file is written under a temporary name and
+    checked on read-back, batch by batch against a hash of every row
+    written, before it replaces ``target``. Returns the counts of matches
+    written and blocks skipped.
+    """
+    target = Path(target)
+    if week_file_suffix(target) != ".parquet" or ".parquet" not in WEEK_FILE_SUFFIXES:
+        raise ValueError(f"'{target}' must be a .parquet week (requires pyarrow).")
+    skipped = []
+    records = (
+        text_feed.to_week_record(match)
+        for match in text_feed.iter_feed(filepath, skipped=skipped)
+    )
+
+    tmp_path = _temp_path(target)
+    writer = None
+    dtypes = None
+    row_hashes = []
+    try:
+        for batch in itertools.batched(records, TEXT_WEEK_BATCH_ROWS):
+            df = text_week_frame(batch)
+            if writer is None:
+                dtypes = df.dtypes
+                arrow_schema = pa.Schema.from_pandas(df, preserve_index=False)
+                writer = _week_parquet_writer(tmp_path, arrow_schema)
+            writer.write_table(
+                pa.Table.from_pandas(df, schema=writer.schema, preserve_index=False)
+            )
+            row_hashes.append(pd.util.hash_pandas_object(df, index=False).to_numpy())
+        if writer is None:
+            raise ValueError(f"No matches could be parsed from '{filepath}'.")
+        writer.close()
+        row_hashes = np.concatenate(row_hashes)
+        if not _reads_back_as(tmp_path, dtypes, row_hashes):
+            raise ValueError(f"'{target}' does not read back as the parsed feed.")
+        os.replace(tmp_path, target)
+    finally:
+        if writer is not None:
+            writer.close()
+        tmp_path.unlink(missing_ok=True)
+    return {"matches": len(row_hashes), "skipped": len(skipped)}
+
+
+def _reads_back_as(path, dtypes, row_hashes) -> bool:
+    """Whether a Parquet week reads back, as _parse_weekly_file would read
+    it, with ``dtypes`` and rows hashing to ``row_hashes``."""
+    start = 0
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=TEXT_WEEK_BATCH_ROWS):
+        df = to_nullable_dtypes(_arrow_to_frame(pa.Table.from_batches([batch])))
+        hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        stop = start + len(df)
+        if not (
+            df.dtypes.equals(dtypes)
+            and np.array_equal(hashes, row_hashes[start:stop])
+        ):
+            return False
+        start = stop
+    return start == len(row_hashes)
+
+
+# --- Week Manifest ---
+# Week discovery for every page, kept in memory per process. The directory
+# listing is reused until the directory's mtime changes (adding, removing or
+# renaming a week). Listing weeks opens no file; a week's contents are
+# summarised only when a page asks for them, and the summary is reused until
+# the week's size or mtime changes.
+# week_dir -> (dir mtime_ns, [(week, path), ...])
+_week_listings = {}
+# abs path -> (size, mtime_ns, summary)
+_week_summaries = {}
+
+
+def list_week_files(week_dir) -> list[tuple[int, str]]:
+    """(week number, path) for every week file in ``week_dir``, by week.
+
+    A week may be stored as any of WEEK_FILE_SUFFIXES ("36.csv",
+    "36.csv.zst", ...). When several forms of one week exist, the most
+    recently modified is used, so a freshly exported CSV wins over an older
+    compressed copy.
+    """
+    week_dir = str(week_dir)
+    try:
+        dir_mtime_ns = os.stat(week_dir).st_mtime_ns
+    except OSError:
         return []
+    known = _week_listings.get(week_dir)
+    if known and known[0] == dir_mtime_ns:
+        return list(known[1])
+
+    latest = {}
+    for f_path in glob.glob(os.path.join(week_dir, "[0-9]*")):
+        suffix = week_file_suffix(f_path)
+        if not suffix:
+            continue
+        match = re.fullmatch(r"(\d+)", os.path.basename(f_path)[: -len(suffix)])
+        if not match:
+            continue
+        try:
+            mtime_ns = os.stat(f_path).st_mtime_ns
+        except OSError:
+            continue
+        week = int(match.group(1))
+        if week not in latest or mtime_ns > latest[week][0]:
+            latest[week] = (mtime_ns, f_path)
+    week_files = sorted((week, f_path) for week, (_, f_path) in latest.items())
+    _week_listings[week_dir] = (dir_mtime_ns, week_files)
+    return list(week_files)
+
+
+def week_manifest(week_dir) -> list[dict]:
+    """Every week in ``week_dir``, latest week first.
+
+    Each entry holds ``week``, ``path``, ``size`` and ``mtime`` (None for a
+    week removed since the directory was listed). No week file is opened;
+    see week_summary for what a week contains.
+    """
+    manifest = []
+    for week, f_path in reversed(list_week_files(week_dir)):
+        entry = {"week": week, "path": f_path, "size": None, "mtime": None}
+        try:
+            stat = os.stat(f_path)
+            entry.update(size=stat.st_size, mtime=stat.st_mtime)
+        except OSError:
+            pass  # Listed anyway, so selecting it reports its own error
+        manifest.append(entry)
+    return manifest
+
+
+def week_summary(f_path) -> dict:
+    """What one week file contains, summarised from its Arrow sidecar.
+
+    Holds ``rows`` (distinct matches), ``first_date``/``last_date``,
+    ``leagues`` and the schema ``groups`` its columns cover. A week that
+    cannot be read gives no rows and no dates.
+    """
+    path = os.path.abspath(f_path)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        stat = None
+    key = (stat.st_size, stat.st_mtime_ns) if stat else None
+    known = _week_summaries.get(path)
+    if known and known[:2] == key:
+        return dict(known[2])
+    summary = _summarise_week(f_path)
+    if key:
+        _week_summaries[path] = (*key, summary)
+    return dict(summary)
+
+
+def _summarise_week(f_path) -> dict:
+    try:
+        df = read_week_columns(f_path, ("match_id", "date", "league_name"))
+        if "match_id" in df.columns:
+            df = df.drop_duplicates(subset=["match_id"])
+        dates = pd.Series(dtype="datetime64[ns]")
+        if "date" in df.columns:
+            dates = pd.to_datetime(
+                df["date"], format="%d/%m/%Y", errors="coerce"
+            ).dropna()
+        leagues = []
+        if "league_name" in df.columns:
+            leagues = sorted(
+                league for league in df["league_name"].dropna().unique() if league
+            )
+        return {
+            "rows": len(df),
+            "first_date": dates.min().date() if not dates.empty else None,
+            "last_date": dates.max().date() if not dates.empty else None,
+            "leagues": leagues,
+            "groups": schema.column_groups(_read_week_header(f_path)),
+        }
+    except Exception as e:
+        add_transient_message("warning", f"Could not summarise '{f_path}': {e}")
+        return {
+            "rows": 0,
+            "first_date": None,
+            "last_date": None,
+            "leagues": [],
+            "groups": [],
+        }
+
+
+# --- Season Categories ---
+def _week_categories(f_path) -> dict[str, list]:
+    """Sorted distinct values of each categorical column in one week."""
+    df = prepare_week_frame(
+        read_week_columns(f_path, ("match_id", *schema.CATEGORICAL_COLUMNS))
+    )
+    return {
+        col: sorted(df[col].dropna().unique().tolist())
+        for col in schema.CATEGORICAL_COLUMNS
+        if col in df.columns
+    }
+
+
+def season_categories(week_dir) -> dict[str, list]:
+    """Category dictionary shared by every week in ``week_dir``.
+
+    Values are listed in order of first appearance, week by week, so a new
+    week only appends categories and the codes of existing values stay the
+    same. Recomputed when any week file changes.
+    """
+    return _season_categories(_season_week_files(week_dir))
+
+
+def _season_week_files(week_dir) -> tuple[tuple[str, str], ...]:
+    """(path, content hash) of each week: what the season dictionary is built from."""
+    week_files = []
+    for _, f_path in list_week_files(os.path.abspath(week_dir)):
+        try:
+            week_files.append((f_path, file_fingerprint(f_path)))
+        except OSError:
+            continue  # Removed since it was listed
+    return tuple(week_files)
+
+
+@st.cache_data(max_entries=8)
+def _season_categories(week_files) -> dict[str, list]:
+    categories = {}
+    for f_path, _ in week_files:
+        try:
+            week_categories = _week_categories(f_path)
+        except Exception as e:
+            add_transient_message(
+                "warning", f"Could not read categories from '{f_path}': {e}"
+            )
+            continue
+        for col, values in week_categories.items():
+            categories.setdefault(col, {}).update(dict.fromkeys(values))
+    return {col: list(values) for col, values in categories.items()}
+
+
+def to_categoricals(df, categories) -> pd.DataFrame:
+    """Codes ``df``'s categorical columns against a season dictionary.
+
+    Values missing from ``categories`` (a file outside the season, a week
+    that failed to load) are appended rather than turned into NaN.
+    """
+    for col in schema.CATEGORICAL_COLUMNS:
+        if col not in df.columns or isinstance(df[col].dtype, pd.CategoricalDtype):
+            continue
+        col_categories = categories.get(col, [])
+        known = set(col_categories)
+        unseen = [value for value in df[col].dropna().unique() if value not in known]
+        if unseen:
+            col_categories = [*col_categories, *sorted(unseen)]
+        df[col] = pd.Categorical(df[col], categories=col_categories)
+    return df
+
+
+# --- Combined Store ---
+# One Arrow partition per week plus a manifest recording the source file each
+# partition was built from and the columns it carries. Partitions are named
+# after their content, so a refresh writes new files for changed weeks only
+# and switches snapshots by atomically replacing the manifest. Refreshing,
+# publishing and removing files happen under the store lock (_locked_store),
+# so a refresh never removes the partitions or snapshot another one is using.
+_store_lock = threading.RLock()
+# store dir -> its open lock file, while _store_lock's holder has it locked
+_store_lock_files = {}
+
+
+def _lock_file(f) -> None:
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        return
+    f.seek(0)
+    while True:
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            continue  # LK_LOCK gives up after ten seconds
+
+
+def _unlock_file(f) -> None:
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextlib.contextmanager
+def _locked_store(store_dir):
+    """Holds the combined store in ``store_dir`` for the calling thread.
+
+    Other sessions of the process wait on _store_lock, other server
+    processes on an exclusive lock of ``store_dir``/store.lock. Re-entrant,
+    so the public store functions can be called with the lock held.
+    """
+    store_dir = Path(store_dir)
+    with _store_lock:
+        if str(store_dir) in _store_lock_files:
+            yield
+            return
+        store_dir.mkdir(parents=True, exist_ok=True)
+        with open(store_dir / "store.lock", "a+b") as lock_file:
+            _lock_file(lock_file)
+            _store_lock_files[str(store_dir)] = lock_file
+            try:
+                yield
+            finally:
+                del _store_lock_files[str(store_dir)]
+                _unlock_file(lock_file)
+
+
+def _read_store_manifest(store_dir, week_dir) -> dict:
+    try:
+        with open(store_dir / "manifest.json", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if (
+        manifest.get("version") != COLUMNAR_CACHE_VERSION
+        or manifest.get("store_version") != COMBINED_STORE_VERSION
+        or manifest.get("week_dir") != str(week_dir)
+    ):
+        return {}
+    return {entry["path"]: entry for entry in manifest.get("weeks", [])}
+
+
+def _write_store_manifest(store_dir, week_dir, entries) -> None:
+    manifest = {
+        "version": COLUMNAR_CACHE_VERSION,
+        "store_version": COMBINED_STORE_VERSION,
+        "week_dir": str(week_dir),
+        "weeks": entries,
+    }
+    tmp_path = _temp_path(store_dir / "manifest.json")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, store_dir / "manifest.json")
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _ingest_week(f_path, store_dir, content_hash) -> dict:
+    stem = os.path.basename(f_path).split(".", 1)[0]
+    partition = f"{stem}-{content_hash[:12]}.arrow"
+    if _streams_into_arrow(f_path):
+        header = _read_week_header(f_path)
+        if "match_id" not in header:
+            raise ValueError(f"'{f_path}' is missing the required 'match_id' column.")
+        try:
+            # Large week: CSV blocks go straight into the partition
+            result = stream_weekly_csv(
+                f_path, store_dir / partition, clean_predictions=True
+            )
+            return {
+                "partition": partition,
+                "rows": result["rows"],
+                "groups": schema.column_groups(header),
+                "columns": header,
+            }
+        except pa.ArrowInvalid:
+            pass  # Values Arrow cannot convert: ingest from the parsed frame
+
+    df = read_weekly_frame(f_path)
+    if "match_id" not in df.columns:
+        raise ValueError(f"'{f_path}' is missing the required 'match_id' column.")
+    df = prepare_week_frame(df)
+
+    tmp_path = _temp_path(store_dir / partition)
+    try:
+        df.to_feather(tmp_path, compression="uncompressed")
+        os.replace(tmp_path, store_dir / partition)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return {
+        "partition": partition,
+        "rows": len(df),
+        "groups": schema.column_groups(df.columns),
+        "columns": list(df.columns),
+    }
+
+
+def _ingest_weeks(weeks, store_dir) -> list:
+    """_ingest_week for each (path, content hash), on INGEST_WORKERS threads.
+
+    Returns, in the order of ``weeks``, each week's entry or the exception
+    its ingest raised. Workers share the caller's Streamlit context, as in
+    load_weekly_frames.
+    """
+
+    def ingest(week):
+        f_path, content_hash = week
+        try:
+            return _ingest_week(f_path, store_dir, content_hash)
+        except Exception as e:
+            return e
+
+    max_workers = max(1, min(INGEST_WORKERS, len(weeks)))
+    if max_workers == 1:
+        return [ingest(week) for week in weeks]
+
+    ctx = get_script_run_ctx(suppress_warning=True)
+    with ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix="week-ingest",
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx),
+    ) as executor:
+        return list(executor.map(ingest, weeks))
+
+
+def refresh_combined_store(week_dir, store_dir=None):
+    """Brings the combined store in line with the weekly CSVs in ``week_dir``.
+
+    Weeks whose size and mtime match the manifest are not opened; a changed
+    stat is confirmed with a content hash before the week is parsed again.
+    The weeks to parse are ingested together on INGEST_WORKERS threads.
+    Returns the partition paths of the current snapshot in week order, or
+    None when pyarrow is not installed.
+    """
+    entries = _refresh_combined_store(week_dir, store_dir)
+    if entries is None:
+        return None
+    store_dir = Path(store_dir or COMBINED_STORE_DIR)
+    return [str(store_dir / entry["partition"]) for entry in entries]
+
+
+def _refresh_combined_store(week_dir, store_dir=None):
+    if not PYARROW_AVAILABLE:
+        return None
+    store_dir = Path(store_dir or COMBINED_STORE_DIR)
+    week_dir = os.path.abspath(week_dir)
+
+    with _locked_store(store_dir):
+        week_files = list_week_files(week_dir)
+        previous = _read_store_manifest(store_dir, week_dir)
+        entries = []
+        # Weeks whose content changed: (position in entries, path, hash)
+        pending = []
+        changed = len(previous) != len(week_files)
+        for week, f_path in week_files:
+            stat = os.stat(f_path)
+            entry = previous.get(f_path)
+            if not (
+                entry
+                and entry["size"] == stat.st_size
+                and entry["mtime_ns"] == stat.st_mtime_ns
+                and (store_dir / entry["partition"]).exists()
+            ):
+                changed = True
+                content_hash = file_fingerprint(f_path)
+                if not (
+                    entry
+                    and entry["sha1"] == content_hash
+                    and (store_dir / entry["partition"]).exists()
+                ):
+                    pending.append((len(entries), f_path, content_hash))
+                    entry = {}  # Completed once the week is ingested
+                entry = {
+                    **entry,
+                    "path": f_path,
+                    "week": week,
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "sha1": content_hash,
+                }
+            entries.append(entry)
+
+        failed = set()
+        ingested = _ingest_weeks(
+            [(f_path, content_hash) for _, f_path, content_hash in pending], store_dir
+        )
+        for (position, f_path, _), result in zip(pending, ingested):
+            if isinstance(result, Exception):
+                add_transient_message(
+                    "error",
+                    f"Could not add '{f_path}' to the combined data: {result}",
+                )
+                failed.add(position)
+            else:
+                entries[position] = {**result, **entries[position]}
+        entries = [entry for i, entry in enumerate(entries) if i not in failed]
+
+        if changed:
+            _write_store_manifest(store_dir, week_dir, entries)
+            live_files = {entry["partition"] for entry in entries}
+            live_files.add(_snapshot_name(entries))
+            for stale_path in store_dir.glob("*.arrow"):
+                if stale_path.name not in live_files:
+                    try:
+                        stale_path.unlink(missing_ok=True)
+                    except OSError:
+                        pass  # Still memory-mapped by a reader (Windows)
+        return entries
+
+
+def unify_week_schemas(schemas):
+    """Canonical superset of the week schemas, in order of first appearance.
+
+    Registry columns keep their declared type; an INT column becomes float64
+    once any week stored it as float (fractional values). Columns unknown to
+    the registry keep a type all weeks agree on, float64 for numeric mixes
+    and string otherwise.
+    """
+    column_types = {}
+    for week_schema in schemas:
+        for name, field_type in zip(week_schema.names, week_schema.types):
+            types = column_types.setdefault(name, set())
+            if field_type != pa.null():
+                types.add(field_type)
+
+    fields = []
+    for name, types in column_types.items():
+        spec = schema.COLUMNS.get(name)
+        if spec is not None and spec.dtype == schema.STRING:
+            # pandas' Arrow-backed strings round-trip as large_string
+            field_type = (
+                pa.large_string() if pa.large_string() in types else pa.string()
+            )
+        elif spec is not None and spec.dtype == schema.INT and types <= {pa.int64()}:
+            field_type = pa.int64()
+        elif spec is not None:
+            field_type = pa.float64()
+        elif len(types) == 1:
+            field_type = next(iter(types))
+        elif types and all(
+            pa.types.is_integer(t) or pa.types.is_floating(t) for t in types
+        ):
+            field_type = pa.float64()
+        else:
+            field_type = pa.string()
+        fields.append(pa.field(name, field_type))
+    return pa.schema(fields)
+
+
+def _align_to_schema(table, target):
+    """``table`` laid out as ``target``, with typed nulls for absent columns."""
+    present = dict(zip(table.column_names, table.columns))
+    columns = []
+    for field in target:
+        column = present.get(field.name)
+        if column is None:
+            column = pa.nulls(table.num_rows, field.type)
+        elif column.type != field.type:
+            column = column.cast(field.type)
+        columns.append(column)
+    return pa.table(columns, schema=target)
+
+
+def _snapshot_name(entries) -> str:
+    partitions = "|".join(entry["partition"] for entry in entries)
+    return f"snapshot-{hashlib.sha1(partitions.encode('utf-8')).hexdigest()[:12]}.arrow"
+
+
+def _concat_partitions(tables):
+    """The week tables concatenated on their canonical schema."""
+    target = unify_week_schemas(table.schema for table in tables)
+    try:
+        # Arrow null-fills absent columns itself; only the types need fixing
+        table = pa.concat_tables(tables, promote_options="permissive")
+        if not table.schema.equals(target):
+            table = table.cast(target)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # A column is text in one week and numeric in another
+        table = pa.concat_tables(
+            [_align_to_schema(table, target) for table in tables]
+        )
+    return table
+
+
+def publish_combined_snapshot(store_dir, entries) -> Path:
+    """Arrow file holding every week of ``entries`` on one schema.
+
+    Named after the partitions it was built from, so it is written once per
+    snapshot by whichever session or server process gets there first; the
+    others only map it. Written under the store lock; readers map it before
+    releasing that lock (see _current_snapshot), so a refresh that makes it
+    stale cannot remove it while it is being opened.
+    """
+    store_dir = Path(store_dir)
+    snapshot_path = store_dir / _snapshot_name(entries)
+    with _locked_store(store_dir):
+        if not snapshot_path.exists():
+            tables = [
+                feather.read_table(store_dir / entry["partition"], memory_map=True)
+                for entry in entries
+            ]
+            table = _concat_partitions(tables) if tables else pa.table({})
+            tmp_path = _temp_path(snapshot_path)
+            try:
+                feather.write_feather(table, tmp_path, compression="uncompressed")
+                os.replace(tmp_path, snapshot_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+    return snapshot_path
+
+
+# Shared by every session of the process instead of copied into each one;
+# callers hand out shallow copies (see load_combined_snapshot).
+@st.cache_resource(max_entries=4)
+def read_combined_store(snapshot_path, week_dir, _entries=()) -> pd.DataFrame:
+    """Combined frame for one published snapshot, built once per process.
+
+    The snapshot is memory-mapped read-only: its text columns stay
+    Arrow-backed views of the mapped file, so all sessions and all server
+    processes share those pages through the OS page cache. ``_entries``, the
+    manifest entries the snapshot was published from, adds their grade
+    columns (see _add_snapshot_grades).
+    """
+    df = _arrow_to_frame(feather.read_table(snapshot_path, memory_map=True))
+    return to_categoricals(
+        _add_snapshot_grades(df, _entries), season_categories(week_dir)
+    )
+
+
+def _add_snapshot_grades(df, entries) -> pd.DataFrame:
+    """The combined frame with the "<column>_grade" columns of its weeks.
+
+    Each week's rows are graded by add_stored_grades against their source
+    file, on the columns that week carries, so they reuse (and fill) the
+    same grade store as load_data_from_csv. Rows of weeks without a
+    prediction column get a missing grade.
+    """
+    codes = {}
+    start = 0
+    for entry in entries:
+        stop = start + entry["rows"]
+        week_df = df.iloc[start:stop]
+        week_df = week_df[[col for col in entry["columns"] if col in df.columns]]
+        graded = add_stored_grades(week_df, entry["path"])
+        for grade_column in grading.available_grade_columns(week_df):
+            codes.setdefault(grade_column, np.full(len(df), -1, dtype=np.int8))
+            codes[grade_column][start:stop] = graded[grade_column].cat.codes
+        start = stop
+    return df.assign(
+        **{
+            grade_column: pd.Categorical.from_codes(
+                grade_codes, categories=grading.GRADES
+            )
+            for grade_column, grade_codes in codes.items()
+        }
+    )
+
+
+def _week_coverage(weeks) -> list[dict]:
+    """Row range, column groups and columns of each (week, rows, columns)."""
+    coverage = []
+    start = 0
+    for week, rows, columns in weeks:
+        coverage.append(
+            {
+                "week": week,
+                "start": start,
+                "stop": start + rows,
+                "groups": schema.column_groups(columns),
+                "columns": frozenset(columns),
+            }
+        )
+        start += rows
+    return coverage
+
+
+def _current_snapshot(week_dir):
+    """Entries, snapshot path and frame of the store brought up to date.
+
+    The store stays locked until the snapshot is mapped, so no other refresh
+    can remove it first. None when pyarrow is not installed.
+    """
+    if not PYARROW_AVAILABLE:
+        return None
+    with _locked_store(COMBINED_STORE_DIR):
+        entries = _refresh_combined_store(week_dir)
+        snapshot_path = str(publish_combined_snapshot(COMBINED_STORE_DIR, entries))
+        df = read_combined_store(snapshot_path, os.path.abspath(week_dir), entries)
+    return entries, snapshot_path, df
+
+
+def load_combined_snapshot(week_dir) -> tuple[pd.DataFrame, list[dict]]:
+    """Every week in ``week_dir`` as one frame, plus which weeks carry what.
+
+    The coverage lists, per week and in frame order, the rows it occupies
+    (``start``/``stop``), its schema groups and its columns, so aggregations
+    can skip weeks without a column (see rows_with_columns). The frame
+    carries the "<column>_grade" columns, read from the grade store. It is a
+    shallow copy of the process-wide one, so columns added or replaced by
+    the caller stay private to it. Without pyarrow the weeks are loaded (and
+    cached) one by one instead of via the store.
+    """
+    current = _current_snapshot(week_dir)
+    if current is not None:
+        entries, _, df = current
+        coverage = _week_coverage(
+            (entry["week"], entry["rows"], entry["columns"]) for entry in entries
+        )
+        return df.copy(deep=False), coverage
+
+    week_files = list_week_files(week_dir)
+    frames = load_weekly_frames(f_path for _, f_path in week_files)
+    coverage = _week_coverage(
+        (week, len(df), df.columns)
+        for (week, _), df in zip(week_files, frames)
+        if not df.empty
+    )
+    return combine_weekly_frames(frames), coverage
+
+
+def load_combined_data(week_dir) -> pd.DataFrame:
+    """Every week in ``week_dir`` as one frame, via the combined store."""
+    return load_combined_snapshot(week_dir)[0]
+
+
+def rows_with_columns(df, coverage, columns) -> pd.DataFrame:
+    """Rows of a combined frame from the weeks that carry all ``columns``."""
+    ranges = [
+        (week["start"], week["stop"])
+        for week in coverage
+        if week["columns"].issuperset(columns)
+    ]
+    if len(ranges) == len(coverage):
+        return df
+    if not ranges:
+        return df.iloc[0:0]
+    return df.iloc[np.concatenate([np.arange(start, stop) for start, stop in ranges])]
+
+
+# --- Week Watcher ---
+# What the pages load through load_data_from_csv: whole weeks (Results
+# Analysis) and the overview projection (Match Analysis)
+WATCHED_PROJECTIONS = (None, schema.OVERVIEW_COLUMNS)
+
+
+def _reload_changed_week(f_path) -> None:
+    """Drops the cached frames of ``f_path``'s previous version, then reloads it.
+
+    Every projection in WATCHED_PROJECTIONS is loaded again, so the pages'
+    next runs find the new version cached.
+    """
+    known = _file_fingerprints.get(os.path.abspath(f_path))
+    if known:
+        for columns in WATCHED_PROJECTIONS:
+            for typed in (True, False):
+                _load_data_from_csv.clear(f_path, known[2], typed, columns)
+    # Keyed on the season, which every changed week changes
+    _load_categorical_frame.clear()
+    for columns in WATCHED_PROJECTIONS:
+        load_data_from_csv(f_path, columns=columns)
+
+
+def _watch_week_files(week_dir, interval) -> None:
+    seen = None
+    snapshot_path = None
+    while True:
+        try:
+            current = {}
+            for _, f_path in list_week_files(week_dir):
+                stat = os.stat(f_path)
+                current[f_path] = (stat.st_size, stat.st_mtime_ns)
+
+            if seen != current:
+                if seen is not None:
+                    for f_path, f_stat in current.items():
+                        if seen.get(f_path) != f_stat:
+                            _reload_changed_week(f_path)
+                # Refreshed and mapped under the store lock, like a page load
+                snapshot = _current_snapshot(week_dir)
+                new_snapshot_path = snapshot[1] if snapshot else None
+                if snapshot_path and new_snapshot_path != snapshot_path:
+                    read_combined_store.clear(snapshot_path, week_dir)
+                snapshot_path = new_snapshot_path
+            seen = current
+        except Exception:
+            _LOGGER.exception("Week watcher on '%s' failed a scan", week_dir)
+        time.sleep(interval)
+
+
+@st.cache_resource
+def _start_week_watcher(week_dir, interval) -> threading.Thread:
+    watcher = threading.Thread(
+        target=_watch_week_files,
+        args=(week_dir, interval),
+        name="week-watcher",
+        daemon=True,
+    )
+    watcher.start()
+    return watcher
+
+
+def start_week_watcher(week_dir, interval=None):
+    """Starts (once per process) the optional watcher on ``week_dir``.
+
+    The watcher polls the weekly CSVs; when one is added or rewritten it
+    evicts that week's cached frames, loads the new version in every
+    WATCHED_PROJECTIONS and refreshes the combined store, so the next page
+    run finds them warm. Failed scans are logged, as no session is there to
+    show them. Does nothing unless WATCH_WEEKLY_FILES is set.
+    """
+    if not WATCH_WEEKLY_FILES:
+        return None
+    return _start_week_watcher(
+        os.path.abspath(week_dir), interval or WEEK_WATCH_INTERVAL_SECONDS
+    )
 
 
 @st.cache_data
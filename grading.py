@@ -0,0 +1,892 @@
+"""Batch grading of prediction columns against match results.
+
+Each distinct prediction string is parsed once into a ``BetSpec`` naming
+the market, side and line, e.g. BetSpec(Market.GOALS_OU, side=OVER,
+line=2.5). ``parse_prediction`` keeps the specs in a bounded LRU cache
+(``parse_cache_stats`` reports its hit rate). Rows sharing a spec are then
+graded together with NumPy comparisons (``grade_predictions``); a single
+match goes through the same code (``grade_prediction``), and
+``add_grade_columns`` grades a week's prediction columns on load. This is
+the only grader the app uses. Parsing follows the check_prediction_success
+the pages used to copy (frozen in benchmarks/legacy_grading.py) branch for
+branch, and both give the same WIN/LOSS/PUSH/PENDING for every stored
+prediction (benchmarks/diff_grading.py replays them through both).
+
+A prediction is parsed with the match's team names only when it mentions
+one of them (or a name is missing); otherwise every match with that string
+shares one spec parsed with team names that cannot match.
+Team names are normalised once per name and compared literally, never
+compiled into patterns, so names like "1. FC Köln" or "Brighton & Hove"
+grade like any other.
+"""
+
+import math
+import re
+from dataclasses import dataclass, replace
+from enum import Enum
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from config import PREDICTION_CACHE_SIZE
+
+GRADES = ("WIN", "LOSS", "PUSH", "PENDING")
+WIN, LOSS, PUSH, PENDING = range(len(GRADES))
+
+# Result columns the pages grade against, by grade_predictions argument
+RESULT_COLUMNS = {
+    "home_goals": "HomeGoals",
+    "away_goals": "AwayGoals",
+    "total_corners": "Corners",
+    "home_teams": "home_team",
+    "away_teams": "away_team",
+    "home_yellow_cards": "HomeYellowsResults",
+    "away_yellow_cards": "AwayYellowsResults",
+    "home_red_cards": "HomeRedsResults",
+    "away_red_cards": "AwayRedsResults",
+}
+
+# Prediction columns graded on week load, with how Match Analysis reads each
+# as a bet: whether the "(...)" confidence after the bet is dropped, and the
+# market appended to it ("Over 8.5" in pred_corners is "Over 8.5 Corners")
+GRADED_COLUMNS = {
+    "rec_prediction": (False, ""),
+    "value_bets": (False, ""),
+    "pred_outcome": (True, ""),
+    "pred_goals": (True, " goals"),
+    "pred_corners": (True, " Corners"),
+    "pred_cards": (True, " Yellow Cards"),
+    "pred_alt": (True, ""),
+}
+GRADE_SUFFIX = "_grade"
+# Grade column -> the prediction column it grades
+GRADE_COLUMNS = {f"{column}{GRADE_SUFFIX}": column for column in GRADED_COLUMNS}
+
+
+# --- Prediction Text ---
+def clean_prediction_string(prediction_str: str) -> str:
+    """Normalised prediction text: "Match Outcome: " and "OverUnder...: "
+    prefixes rewritten, 1X/X2 labels spelled out, repeated words and
+    whitespace collapsed. Empty for anything that is not a non-blank string.
+    """
+    if not isinstance(prediction_str, str) or not prediction_str.strip():
+        return ""
+
+    clean_str = prediction_str.strip()
+
+    prefixes_to_remove = [
+        "Match Outcome: ",
+    ]
+    for prefix in prefixes_to_remove:
+        if clean_str.startswith(prefix):
+            clean_str = clean_str[len(prefix) :].strip()
+            break
+
+    if (
+        "OverUnderCards: " in clean_str
+        or "OverUnderCorners: " in clean_str
+        or "OverUnderGoals: " in clean_str
+    ):
+        first, second = clean_str.split(": ", 1)
+        first_lower = first.lower()
+        if "cards" in first_lower:
+            clean_str = f"{second} Cards"
+        elif "corners" in first_lower:
+            clean_str = f"{second} Corners"
+        elif "goals" in first_lower:
+            clean_str = f"{second} Goals"
+        else:
+            clean_str = f"{second}"
+
+    if "Home or Draw (1X)" in clean_str:
+        clean_str = re.sub(r"^Home or Draw \(1X\)", "Home Win or Draw", clean_str)
+    elif "Away or Draw (X2)" in clean_str:
+        clean_str = re.sub(r"^Away or Draw \(X2\)", "Away Win or Draw", clean_str)
+
+    clean_str = re.sub(r"\b(\w+)\s+\1\b", r"\1", clean_str)
+    clean_str = re.sub(r"\s+", " ", clean_str).strip()
+
+    return clean_str
+
+
+def normalise_predictions(values) -> pd.Series:
+    """``values`` through clean_prediction_string, once per distinct value.
+
+    The cleaned labels are mapped back to the rows through a categorical, so
+    the cost grows with the number of distinct predictions, not rows.
+    Missing values stay missing and the result keeps the dtype of ``values``.
+    """
+    values = pd.Series(values)
+    codes, labels = pd.factorize(values)
+    cleaned = pd.Index([clean_prediction_string(label) for label in labels])
+    categories = cleaned.unique()
+    # Code -1 (missing) picks the trailing -1
+    label_codes = np.append(categories.get_indexer(cleaned), -1)
+    normalised = pd.Categorical.from_codes(label_codes[codes], categories=categories)
+    return pd.Series(normalised, index=values.index, name=values.name).astype(
+        values.dtype
+    )
+
+
+# --- Bet Specs ---
+class Market(Enum):
+    PENDING = "pending"
+    OUTCOME = "outcome"
+    TEAM_WIN = "team_win"
+    WIN_AND_GOALS_OU = "win_and_goals_ou"
+    DOUBLE_CHANCE_AND_UNDER = "double_chance_and_under"
+    HANDICAP = "handicap"
+    CLEAN_SHEET = "clean_sheet"
+    WIN_TO_NIL = "win_to_nil"
+    BTTS = "btts"
+    GOALS_OU = "goals_ou"
+    TEAM_GOALS_OU = "team_goals_ou"
+    CORNERS_OU = "corners_ou"
+    CARDS_OU = "cards_ou"
+
+
+HOME, AWAY = "home", "away"
+OVER, UNDER = "over", "under"
+YES, NO = "yes", "no"
+FULL_TIME = "FT"
+
+
+@dataclass(frozen=True)
+class BetSpec:
+    """What a prediction string bets on, independent of the result.
+
+    ``team`` is the side a team market is about (HOME/AWAY, None when the
+    prediction names neither team), ``side`` is OVER/UNDER or YES/NO and
+    ``line`` the goals, corners or card-points line (the handicap for
+    HANDICAP). OUTCOME bets list ``clauses`` of (winning outcomes, whether
+    a miss is final) tried in order, falling back to ``default``.
+    ``needs_scores`` makes corner and card bets PENDING without a score,
+    as check_prediction_success did after a handicap, clean sheet or win
+    to nil branch matched without naming a team.
+    """
+
+    market: Market
+    team: str | None = None
+    side: str | None = None
+    line: float | None = None
+    period: str = FULL_TIME
+    push: bool = False
+    clauses: tuple = ()
+    default: int = PENDING
+    needs_scores: bool = False
+
+
+PENDING_SPEC = BetSpec(Market.PENDING)
+# Stands in for team names when a prediction mentions neither team
+_NO_TEAM = "\x00"
+# Full-time outcome of a match: index into "HDA"
+_HOME, _DRAW, _AWAY = range(3)
+_OUTCOME_CODES = {"h": (_HOME,), "x": (_DRAW,), "a": (_AWAY,)}
+_DC_CODES = {"1x": (_HOME, _DRAW), "2x": (_AWAY, _DRAW), "12": (_HOME, _AWAY)}
+
+# "and" only as a word in combos, so "Sunderland Under 0.5 Goals" is not one
+_COMBO_WIN_OU = re.compile(
+    r"^(.*?)(?:\s+to\s+win)?\s*(?:&|\band\b)\s*(over|under)\s*(\d+\.\d+)\s*goals?$"
+)
+_TEAM_SCORE_OU = re.compile(
+    r"^(home|away)\s*team\s*to\s*score\s*(over|under)\s*(\d+\.\d+)\s*goals?$"
+)
+_TEAM_WIN = re.compile(r"^(.*?)(?:\s+win)(?:\s*\(\d+\/10\))?$")
+_COMBO_DC_UNDER = re.compile(
+    r"^(.*?)\s*(?:&|\band\b)\s*under\s*(\d+\.\d+)\s*goals?$"
+)
+_HANDICAP = re.compile(r"^(.*?)\s*([+-]\d+\.\d+)\s*(?:asian\s*)?handicap$")
+_CORNERS_OU = re.compile(r"\b(o|u|over|under)\s*(\d+(?:\.\d+)?)\s*(?:corners?|c\b)")
+_CARDS_OU = re.compile(r"\b(o|u|over|under)\s*(\d+(?:\.\d+)?)\s*(?:yellow\s*)?cards?\b")
+_YES_WORD = re.compile(r"\byes\b")
+_BTTS_YES = re.compile(r"\b(btts|both\s*teams\s*to\s*score)\s*(yes)?\b|\bgg\b")
+_BTTS_NOT_YES = re.compile(r"\b(btts|both\s*teams\s*to\s*score)\s*no\b|\bng\b")
+_BTTS_NO = re.compile(r"\b(btts|both\s*teams\s*to\s*score)\s*no\b|\bng\b|\bno\s*goal\b")
+_HOME_TEAM_OU = re.compile(
+    r"\b(home\s*team)\s+(o|u|over|under)\s*(\d+(?:\.\d+)?)(?:\s*goals?)?"
+)
+_AWAY_TEAM_OU = re.compile(
+    r"\b(away\s*team)\s+(o|u|over|under)\s*(\d+(?:\.\d+)?)(?:\s*goals?)?"
+)
+# What follows a team name in "<team> over 1.5"; the name itself is matched
+# literally (_named_team_ou), never compiled into a pattern
+_OU_AFTER_NAME = re.compile(r"\s+(o|u|over|under)\s*(\d+(?:\.\d+)?)")
+_OR_WORD = re.compile(r"\bor\s+")
+_TOTAL_GOALS_OU = re.compile(r"(o|u|over|under)\s*(\d+(?:\.\d+)?)(?:\s*goals?)?")
+_DOUBLE_CHANCE = re.compile(r"\b(double\s*chance|dc)\b")
+_DOUBLE_CHANCE_PAIR = re.compile(r"\b(?:double\s*chance|dc)\s*([1x2]{2})\b")
+_OUTCOME_PAIR = re.compile(r"([hax12])([x12])?")
+_OUTCOME_LETTER = re.compile(r"([hax])\s*\(.+\)")
+_OUTCOME_LETTER_NOTE = re.compile(r"([hax])(?:\s*\(.+\))?")
+_OUTCOME_PHRASES = (
+    "home or draw",
+    "away or draw",
+    "home or away",
+    "draw or home",
+    "draw or away",
+    "away or home",
+    "home win",
+    "away win",
+)
+
+
+def _over_under(ou_type) -> str:
+    return OVER if ou_type.startswith("o") else UNDER
+
+
+def _side(team_part, home_team_lower, away_team_lower):
+    if team_part == "home" or team_part == home_team_lower:
+        return HOME
+    if team_part == "away" or team_part == away_team_lower:
+        return AWAY
+    return None
+
+
+def _mentioned_side(team_part, home_team_lower, away_team_lower):
+    if "home" in team_part or (home_team_lower and home_team_lower in team_part):
+        return HOME
+    if "away" in team_part or (away_team_lower and away_team_lower in team_part):
+        return AWAY
+    return None
+
+
+def _is_outcome_part(part, home_team_lower, away_team_lower) -> bool:
+    return bool(
+        _DOUBLE_CHANCE.search(part)
+        or _OUTCOME_PAIR.fullmatch(part)
+        or _OUTCOME_LETTER.fullmatch(part)
+        or any(phrase in part for phrase in _OUTCOME_PHRASES)
+        or part in ("home", "draw", "away", "1", "2", "x")
+        or (home_team_lower and part == home_team_lower)
+        or (away_team_lower and part == away_team_lower)
+    )
+
+
+def _outcome_clause(part, single, home_team_lower, away_team_lower):
+    """(outcomes that win, whether a miss is a LOSS) for one comma part.
+
+    None when the part names no outcome; a miss that is not a LOSS moves on
+    to the next part.
+    """
+    hax = _OUTCOME_LETTER_NOTE.fullmatch(part)
+    if hax:
+        return _OUTCOME_CODES[hax.group(1)], single
+    dc_pair = _DOUBLE_CHANCE_PAIR.search(part)
+    if dc_pair:
+        return _DC_CODES.get("".join(sorted(dc_pair.group(1))), ()), True
+    if len(part) == 2 and all(c in "12x" for c in part):
+        return _DC_CODES.get("".join(sorted(part)), ()), single
+
+    or_draw = re.search(r"\bor\s+draw\b", part)
+    home_named = home_team_lower and home_team_lower in part
+    away_named = away_team_lower and away_team_lower in part
+    if or_draw and (re.search(r"\bhome\b", part) or home_named):
+        return (_HOME, _DRAW), True
+    if or_draw and (re.search(r"\baway\b", part) or away_named):
+        return (_AWAY, _DRAW), True
+    if (
+        (re.search(r"\bhome\b", part) and re.search(r"\bor\s+away\b", part))
+        or (
+            home_named
+            and (
+                re.search(r"\bor\s+away\b", part)
+                or (away_team_lower and _or_team(away_team_lower, part))
+            )
+        )
+        or (
+            away_named
+            and (
+                re.search(r"\bor\s+home\b", part)
+                or (home_team_lower and _or_team(home_team_lower, part))
+            )
+        )
+    ):
+        return (_HOME, _AWAY), True
+
+    outcomes = set()
+    if part in ("home win", "home", "1") or re.fullmatch(r"home\s*win", part):
+        outcomes.add(_HOME)
+    if part in ("away", "2") or re.fullmatch(r"away\s*win", part):
+        outcomes.add(_AWAY)
+    if part in ("draw", "x"):
+        outcomes.add(_DRAW)
+    if home_team_lower and part == home_team_lower:
+        outcomes.add(_HOME)
+    if away_team_lower and part == away_team_lower:
+        outcomes.add(_AWAY)
+    if outcomes:
+        return tuple(sorted(outcomes)), False
+    return None
+
+
+def _or_team(team_lower, part) -> bool:
+    """Whether ``part`` has "or <team>", with the name taken literally."""
+    return any(part.startswith(team_lower, m.end()) for m in _OR_WORD.finditer(part))
+
+
+def _named_team_ou(team_lower, pred_lower):
+    """Over/under match for "<team> over 1.5" with the name taken literally.
+
+    The name must start the prediction or follow whitespace, as in the
+    pattern check_prediction_success built from it.
+    """
+    start = pred_lower.find(team_lower)
+    while start != -1:
+        if start == 0 or pred_lower[start - 1].isspace():
+            m = _OU_AFTER_NAME.match(pred_lower, start + len(team_lower))
+            if m:
+                return m
+        start = pred_lower.find(team_lower, start + 1)
+    return None
+
+
+@lru_cache(maxsize=PREDICTION_CACHE_SIZE)
+def parse_prediction(prediction_str, home_team_lower, away_team_lower) -> BetSpec:
+    """Bet spec for a prediction string, given lower-cased team names.
+
+    Branches are tried in check_prediction_success order. Markets that
+    returned PENDING on missing scores before deciding whether they apply
+    (handicap, clean sheet, win to nil) set ``needs_scores`` on whatever
+    spec comes next, so that ordering is kept.
+    """
+    if (
+        not prediction_str
+        or not isinstance(prediction_str, str)
+        or prediction_str.strip() == "--"
+    ):
+        return PENDING_SPEC
+
+    pred_lower, _ = _lowered(prediction_str)
+    # Team names as they read in pred_lower, where repeated words are
+    # collapsed ("Colo Colo" -> "colo"); outcome parts read the raw string
+    home_cleaned = _cleaned_name(home_team_lower)
+    away_cleaned = _cleaned_name(away_team_lower)
+
+    m = _COMBO_WIN_OU.search(pred_lower)
+    if m:
+        team_part, ou_type, line = m.groups()
+        team_part = team_part.strip()
+        winner = None
+        if team_part == "home win" or team_part == home_cleaned:
+            winner = HOME
+        elif team_part == "away win" or team_part == away_cleaned:
+            winner = AWAY
+        return BetSpec(
+            Market.WIN_AND_GOALS_OU, team=winner, side=ou_type, line=float(line)
+        )
+
+    m = _TEAM_SCORE_OU.search(pred_lower)
+    if m:
+        team_side, ou_type, line = m.groups()
+        return BetSpec(
+            Market.TEAM_GOALS_OU, team=team_side, side=ou_type, line=float(line)
+        )
+
+    m = _TEAM_WIN.match(pred_lower)
+    if m:
+        side = _side(m.group(1).strip(), home_cleaned, away_cleaned)
+        return BetSpec(Market.TEAM_WIN, team=side) if side else PENDING_SPEC
+
+    m = _COMBO_DC_UNDER.search(pred_lower)
+    if m:
+        dc_part, line = m.groups()
+        dc_part = dc_part.strip()
+        side = None
+        if (
+            "home" in dc_part
+            or "1x" in dc_part
+            or (home_cleaned and home_cleaned in dc_part)
+        ):
+            side = HOME
+        elif (
+            "away" in dc_part
+            or "x2" in dc_part
+            or (away_cleaned and away_cleaned in dc_part)
+        ):
+            side = AWAY
+        return BetSpec(
+            Market.DOUBLE_CHANCE_AND_UNDER, team=side, side=UNDER, line=float(line)
+        )
+
+    gated = False
+    m = _HANDICAP.search(pred_lower)
+    if m:
+        gated = True
+        team_part, handicap = m.groups()
+        side = _side(team_part.strip(), home_cleaned, away_cleaned)
+        if side:
+            return BetSpec(Market.HANDICAP, team=side, line=float(handicap))
+
+    if "clean sheet" in pred_lower:
+        gated = True
+        team_part = _YES_WORD.sub("", pred_lower.replace("clean sheet", "")).strip()
+        side = _mentioned_side(team_part, home_cleaned, away_cleaned)
+        if side:
+            return BetSpec(Market.CLEAN_SHEET, team=side, side=YES)
+
+    if "win to nil" in pred_lower:
+        gated = True
+        team_part = pred_lower.replace("to win to nil", "").strip()
+        side = _mentioned_side(team_part, home_cleaned, away_cleaned)
+        if side:
+            return BetSpec(Market.WIN_TO_NIL, team=side)
+
+    spec = _parse_remaining(
+        prediction_str,
+        pred_lower,
+        (home_team_lower, away_team_lower),
+        (home_cleaned, away_cleaned),
+    )
+    return replace(spec, needs_scores=True) if gated else spec
+
+
+def _parse_remaining(prediction_str, pred_lower, teams_lower, teams_cleaned):
+    home_team_lower, away_team_lower = teams_lower
+    m = _CORNERS_OU.search(pred_lower)
+    if m:
+        return BetSpec(
+            Market.CORNERS_OU,
+            side=_over_under(m.group(1)),
+            line=float(m.group(2)),
+            push=True,
+        )
+
+    m = _CARDS_OU.search(pred_lower)
+    if m:
+        return BetSpec(
+            Market.CARDS_OU,
+            side=_over_under(m.group(1)),
+            line=float(m.group(2)),
+            push=True,
+        )
+
+    if _BTTS_YES.search(pred_lower) and not _BTTS_NOT_YES.search(pred_lower):
+        return BetSpec(Market.BTTS, side=YES)
+    if _BTTS_NO.search(pred_lower):
+        return BetSpec(Market.BTTS, side=NO)
+
+    for side, pattern in ((HOME, _HOME_TEAM_OU), (AWAY, _AWAY_TEAM_OU)):
+        m = pattern.search(pred_lower)
+        if m:
+            return BetSpec(
+                Market.TEAM_GOALS_OU,
+                team=side,
+                side=_over_under(m.group(2)),
+                line=float(m.group(3)),
+                push=True,
+            )
+
+    for side, team in zip((HOME, AWAY), teams_cleaned):
+        if team:
+            m = _named_team_ou(team, pred_lower)
+            if m:
+                return BetSpec(
+                    Market.TEAM_GOALS_OU,
+                    team=side,
+                    side=_over_under(m.group(1)),
+                    line=float(m.group(2)),
+                    push=True,
+                )
+
+    m = _TOTAL_GOALS_OU.fullmatch(pred_lower)
+    if m:
+        return BetSpec(
+            Market.GOALS_OU,
+            side=_over_under(m.group(1)),
+            line=float(m.group(2)),
+            push=True,
+        )
+
+    parts = [p.strip().lower() for p in prediction_str.split(",")]
+    is_outcome_market = any(
+        _is_outcome_part(part, home_team_lower, away_team_lower) for part in parts
+    )
+    clauses = []
+    for part in parts:
+        clause = _outcome_clause(
+            part, len(parts) == 1, home_team_lower, away_team_lower
+        )
+        if clause is None:
+            continue
+        clauses.append(clause)
+        if clause[1]:
+            break  # A miss here is final
+    default = LOSS if is_outcome_market else PENDING
+    return BetSpec(Market.OUTCOME, clauses=tuple(clauses), default=default)
+
+
+@lru_cache(maxsize=PREDICTION_CACHE_SIZE)
+def _cleaned_name(team_lower) -> str:
+    """A lower-cased team name as it reads in a cleaned prediction."""
+    return clean_prediction_string(team_lower).lower() if team_lower else team_lower
+
+
+@lru_cache(maxsize=PREDICTION_CACHE_SIZE)
+def _lowered(prediction_str) -> tuple[str, str]:
+    cleaned = clean_prediction_string(prediction_str.strip())
+    return cleaned.lower(), prediction_str.lower()
+
+
+def _match_spec(prediction_str, home_team_lower, away_team_lower) -> BetSpec:
+    """parse_prediction for one match, shared by every match when possible.
+
+    Team names only change the spec when the prediction mentions one of them
+    (or a name is missing); otherwise the string is parsed with team names
+    that cannot match, so all its matches hit the same cache entry.
+    """
+    if not isinstance(prediction_str, str):
+        return PENDING_SPEC
+    cleaned, raw = _lowered(prediction_str)
+    if (
+        not home_team_lower
+        or not away_team_lower
+        or home_team_lower in raw
+        or away_team_lower in raw
+        or _cleaned_name(home_team_lower) in cleaned
+        or _cleaned_name(away_team_lower) in cleaned
+    ):
+        return parse_prediction(prediction_str, home_team_lower, away_team_lower)
+    return parse_prediction(prediction_str, _NO_TEAM, _NO_TEAM)
+
+
+def parse_cache_stats() -> dict:
+    """Hits, misses, size and hit rate of the parse_prediction cache."""
+    info = parse_prediction.cache_info()
+    calls = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+        "hit_rate": info.hits / calls if calls else 0.0,
+    }
+
+
+# --- Grading ---
+def _numbers(values, n):
+    if values is None:
+        return np.full(n, np.nan)
+    numbers = pd.to_numeric(pd.Series(values), errors="coerce")
+    return np.asarray(numbers, dtype="float64")
+
+
+def _red_cards(values, n):
+    """Red-card numbers, with None values as no red cards (NaN is missing)."""
+    if values is None:
+        return None
+    values = pd.Series(values, dtype=object)
+    return _numbers(values.where(values.map(lambda value: value is not None), 0), n)
+
+
+def _number(value) -> float | None:
+    """float(value), or None when it is missing or not a number."""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(number) else number
+
+
+@lru_cache(maxsize=PREDICTION_CACHE_SIZE)
+def _team_name(name) -> str:
+    """Normalised team name, compared literally against predictions."""
+    return name.lower().strip() if isinstance(name, str) and name else ""
+
+
+def _team_names(values, n) -> list[str]:
+    if values is None:
+        return [""] * n
+    names = pd.Series(values, dtype=object)
+    # Missing names (NaN, None) normalise to "" and need no lookup entry
+    lookup = {name: _team_name(name) for name in names.unique()}
+    return [lookup.get(name, "") for name in names.tolist()]
+
+
+def _result_columns(hg, ag, corners, yellows_and_reds) -> dict:
+    """Arrays _grade_spec reads, from float result columns.
+
+    ``yellows_and_reds`` pairs each side's yellow cards with its red cards
+    (None when there is no red-card column).
+    """
+    cards_valid = np.ones(len(hg), dtype=bool)
+    card_points = np.zeros(len(hg))
+    for yellows, reds in yellows_and_reds:
+        cards_valid &= ~np.isnan(yellows)
+        card_points += yellows
+        if reds is not None:
+            cards_valid &= ~np.isnan(reds)
+            card_points += 2 * reds
+    return {
+        "hg": hg,
+        "ag": ag,
+        "corners": corners,
+        "card_points": card_points,
+        "cards_valid": cards_valid,
+        "scores_valid": ~(np.isnan(hg) | np.isnan(ag)),
+        "outcome": np.where(hg > ag, _HOME, np.where(hg < ag, _AWAY, _DRAW)),
+    }
+
+
+def _compare(values, spec):
+    """Grades for an over/under line; PUSH on the line only when ``push``."""
+    won = values > spec.line if spec.side == OVER else values < spec.line
+    grades = np.where(won, WIN, LOSS)
+    if spec.push:
+        grades[values == spec.line] = PUSH
+    return grades
+
+
+def _grade_outcome(spec, outcome):
+    grades = np.full(len(outcome), spec.default)
+    undecided = np.ones(len(outcome), dtype=bool)
+    for outcomes, loss_on_miss in spec.clauses:
+        hit = undecided & np.isin(outcome, outcomes)
+        grades[hit] = WIN
+        undecided &= ~hit
+        if loss_on_miss:
+            grades[undecided] = LOSS
+            break
+    return grades
+
+
+def _grade_spec(spec, r):
+    """Grades for the rows ``r`` (a dict of equal-length arrays) of one spec."""
+    market = spec.market
+    if market is Market.PENDING:
+        return np.full(len(r["hg"]), PENDING)
+
+    if market is Market.CORNERS_OU or market is Market.CARDS_OU:
+        if market is Market.CORNERS_OU:
+            grades = _compare(r["corners"], spec)
+            grades[np.isnan(r["corners"])] = PENDING
+        else:
+            grades = _compare(r["card_points"], spec)
+            grades[~r["cards_valid"]] = PENDING
+        if spec.needs_scores:
+            grades[~r["scores_valid"]] = PENDING
+        return grades
+
+    hg, ag = r["hg"], r["ag"]
+    if spec.team == HOME:
+        team_goals, opponent_goals = hg, ag
+    else:
+        team_goals, opponent_goals = ag, hg
+    if market is Market.WIN_AND_GOALS_OU:
+        if spec.team is None:
+            won = np.zeros(len(hg), dtype=bool)
+        else:
+            won = team_goals > opponent_goals
+        won &= _compare(hg + ag, replace(spec, push=False)) == WIN
+        grades = np.where(won, WIN, LOSS)
+    elif market is Market.TEAM_GOALS_OU:
+        grades = _compare(team_goals, spec)
+    elif market is Market.TEAM_WIN:
+        grades = np.where(team_goals > opponent_goals, WIN, LOSS)
+    elif market is Market.DOUBLE_CHANCE_AND_UNDER:
+        if spec.team is None:
+            won = np.zeros(len(hg), dtype=bool)
+        else:
+            won = team_goals >= opponent_goals
+        grades = np.where(won & (hg + ag < spec.line), WIN, LOSS)
+    elif market is Market.HANDICAP:
+        grades = np.where(team_goals + spec.line > opponent_goals, WIN, LOSS)
+    elif market is Market.CLEAN_SHEET:
+        grades = np.where(opponent_goals == 0, WIN, LOSS)
+    elif market is Market.WIN_TO_NIL:
+        won = (team_goals > opponent_goals) & (opponent_goals == 0)
+        grades = np.where(won, WIN, LOSS)
+    elif market is Market.BTTS:
+        both = (hg > 0) & (ag > 0)
+        grades = np.where(both if spec.side == YES else ~both, WIN, LOSS)
+    elif market is Market.GOALS_OU:
+        grades = _compare(hg + ag, spec)
+    elif market is Market.OUTCOME:
+        grades = _grade_outcome(spec, r["outcome"])
+    else:
+        raise ValueError(f"Unknown bet spec: {spec!r}")
+    grades[~r["scores_valid"]] = PENDING
+    return grades
+
+
+def grade_predictions(
+    predictions,
+    home_goals,
+    away_goals,
+    total_corners=None,
+    home_teams=None,
+    away_teams=None,
+    home_yellow_cards=None,
+    away_yellow_cards=None,
+    home_red_cards=None,
+    away_red_cards=None,
+) -> pd.Categorical:
+    """WIN/LOSS/PUSH/PENDING for whole columns of predictions and results.
+
+    Arguments are equal-length sequences (lists, arrays or Series),
+    row-aligned, with the meaning check_prediction_success gives its
+    scalars. A red-card column of None, or a None red-card value, counts as
+    no red cards, as a None red-card value does there.
+    """
+    predictions = pd.Series(predictions, dtype=object).tolist()
+    n = len(predictions)
+    home_names = _team_names(home_teams, n)
+    away_names = _team_names(away_teams, n)
+    columns = _result_columns(
+        _numbers(home_goals, n),
+        _numbers(away_goals, n),
+        _numbers(total_corners, n),
+        [
+            (_numbers(yellows, n), _red_cards(reds, n))
+            for yellows, reds in (
+                (home_yellow_cards, home_red_cards),
+                (away_yellow_cards, away_red_cards),
+            )
+        ],
+    )
+
+    spec_ids = {}
+    row_spec = np.empty(n, dtype=np.int64)
+    for i, (prediction, home, away) in enumerate(
+        zip(predictions, home_names, away_names)
+    ):
+        spec = _match_spec(prediction, home, away)
+        row_spec[i] = spec_ids.setdefault(spec, len(spec_ids))
+
+    codes = np.full(n, PENDING, dtype=np.int8)
+    order = np.argsort(row_spec, kind="stable")
+    starts = np.flatnonzero(np.diff(row_spec[order], prepend=-1))
+    specs = list(spec_ids)
+    for start, stop in zip(starts, [*starts[1:], n]):
+        rows = order[start:stop]
+        subset = {name: values[rows] for name, values in columns.items()}
+        codes[rows] = _grade_spec(specs[row_spec[rows[0]]], subset)
+    return pd.Categorical.from_codes(codes, categories=GRADES)
+
+
+def grade_prediction(
+    prediction_str,
+    home_goals,
+    away_goals,
+    total_corners=None,
+    home_team=None,
+    away_team=None,
+    home_yellow_cards=None,
+    away_yellow_cards=None,
+    home_red_cards=None,
+    away_red_cards=None,
+) -> str:
+    """WIN/LOSS/PUSH/PENDING for one match, as grade_predictions grades a row.
+
+    The per-match path of the pages: a cached parse, then a cached grade of
+    that spec for these results.
+    """
+    spec = _match_spec(prediction_str, _team_name(home_team), _team_name(away_team))
+    results = (
+        _number(home_goals),
+        _number(away_goals),
+        _number(total_corners),
+        _number(home_yellow_cards),
+        _number(away_yellow_cards),
+        # No red-card value counts as no red cards
+        0.0 if home_red_cards is None else _number(home_red_cards),
+        0.0 if away_red_cards is None else _number(away_red_cards),
+    )
+    return _grade_match(spec, results)
+
+
+@lru_cache(maxsize=PREDICTION_CACHE_SIZE)
+def _grade_match(spec, results) -> str:
+    """Grade of one spec for one match's results (None where missing)."""
+    hg, ag, corners, home_yellows, away_yellows, home_reds, away_reds = (
+        np.array([np.nan if value is None else value]) for value in results
+    )
+    columns = _result_columns(
+        hg, ag, corners, [(home_yellows, home_reds), (away_yellows, away_reds)]
+    )
+    return GRADES[_grade_spec(spec, columns)[0]]
+
+
+def grade_frame(df, column) -> pd.Series:
+    """Grades of ``df[column]`` against the result columns the pages use.
+
+    Result columns missing from ``df`` count as missing values, so their
+    markets grade PENDING.
+    """
+    grades = grade_predictions(
+        df[column],
+        **{arg: df.get(name) for arg, name in RESULT_COLUMNS.items()},
+    )
+    return pd.Series(grades, index=df.index, name=column)
+
+
+@lru_cache(maxsize=PREDICTION_CACHE_SIZE)
+def bet_text(prediction, column):
+    """``prediction`` from ``column`` as the bet Match Analysis grades.
+
+    Missing predictions become None and empty ones stay empty (both grade
+    PENDING).
+    """
+    drop_confidence, market = GRADED_COLUMNS[column]
+    if not isinstance(prediction, str):
+        return None
+    if drop_confidence:
+        prediction = prediction.split("(")[0].strip()
+    return f"{prediction}{market}" if prediction else prediction
+
+
+def bet_texts(predictions, column) -> list:
+    """bet_text of each prediction from ``column`` (cached per distinct value)."""
+    return [bet_text(prediction, column) for prediction in predictions]
+
+
+def grade_bet_rows(df, rows) -> dict[str, np.ndarray]:
+    """Grade codes (indexes into GRADES) of the bets at some rows of ``df``.
+
+    ``rows`` maps prediction columns to the row positions to grade in each.
+    All of them go through a single grade_predictions call, against the
+    result columns of their rows.
+    """
+    positions = np.concatenate([np.asarray(r, dtype=np.intp) for r in rows.values()])
+    predictions = [
+        text
+        for column, r in rows.items()
+        for text in bet_texts(df[column].iloc[r], column)
+    ]
+    results = df.iloc[positions]
+    codes = grade_predictions(
+        predictions, **{arg: results.get(name) for arg, name in RESULT_COLUMNS.items()}
+    ).codes
+    splits = np.cumsum([len(r) for r in rows.values()])[:-1]
+    return dict(zip(rows, np.split(codes, splits)))
+
+
+def available_grade_columns(df, columns=None) -> dict[str, str]:
+    """The GRADE_COLUMNS entries ``df`` has a source for, limited to ``columns``."""
+    return {
+        grade_column: column
+        for grade_column, column in GRADE_COLUMNS.items()
+        if column in df.columns and (columns is None or grade_column in columns)
+    }
+
+
+def add_grade_columns(df, columns=None) -> pd.DataFrame:
+    """``df`` with a categorical "<column>_grade" per graded column it has.
+
+    ``columns`` limits the grade columns added (all of GRADE_COLUMNS by
+    default). Each distinct prediction is turned into its bet text once and
+    all columns are graded in one grade_predictions call.
+    """
+    graded = available_grade_columns(df, columns)
+    if not graded:
+        return df
+    every_row = np.arange(len(df))
+    codes = grade_bet_rows(df, dict.fromkeys(graded.values(), every_row))
+    grades = {
+        grade_column: pd.Series(
+            pd.Categorical.from_codes(codes[column], categories=GRADES),
+            index=df.index,
+        )
+        for grade_column, column in graded.items()
+    }
+    return df.assign(**grades)
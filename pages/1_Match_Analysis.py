@@ -1,5 +1,3 @@
-import glob  # For finding weekly files
-import math
 import os
 import re
 import time
@@ -13,6 +11,16 @@ import numpy as np  # For NaN handling
 import pandas as pd
 import streamlit as st
 
+from data_loader import (
+    load_data_from_csv,
+    load_match_details,
+    load_weekly_data,
+    start_week_watcher,
+    week_manifest,
+    week_summary,
+)
+from schema import OVERVIEW_COLUMNS
+
 # import psycopg2 # Optional
 # from psycopg2 import sql # Optional
 
@@ -28,6 +36,7 @@ PROJECT_ROOT = Path(
     __file__
 ).parent.parent  # Goes up one level from 'pages' to the root
 WEEKLY_PREDICTIONS_DIR = PROJECT_ROOT / "data" / "pre_match"
+start_week_watcher(WEEKLY_PREDICTIONS_DIR)
 COMBINED_RESULTS_FILE = PROJECT_ROOT / "data" / "combined_results.csv"
 # WEEKLY_PREDICTIONS_DIR = "data/pre_match/"
 # COMBINED_RESULTS_FILE = "data/combined_results.csv"
@@ -326,37 +335,6 @@ if "transient_messages" not in st.session_state:
 
 
 # --- Helper Functions (Keep from previous version) ---
-def load_weekly_data(file_path):
-    try:
-        if os.path.exists(file_path):
-            return load_data_from_csv(file_path)
-            # return pd.read_csv(file_path)
-        else:
-            st.error(f"File not found: {file_path}")
-            return pd.DataFrame()  # Return empty dataframe
-    except Exception as e:
-        st.error(f"Error loading weekly file {file_path}: {e}")
-        return pd.DataFrame()
-
-
-def remove_duplicate_records(df) -> pd.DataFrame:
-    # duplicates_count = df.duplicated(subset=['match_id']).sum()
-    # if duplicates_count > 0:
-    #     # st.warning(f"Found {duplicates_count} duplicate match_id entries in the CSV. Keeping the first occurrence of each.")
-    #     add_transient_message("warning", f"Found {duplicates_count} duplicate match_id entries in the CSV. Keeping the first occurrence of each.")
-
-    # Drop duplicates based on 'match_id', keeping the first instance
-    df_deduplicated = df.drop_duplicates(subset=["match_id"], keep="first")
-
-    # --- Convert back to list of dictionaries ---
-    # This format seems expected by the rest of your app
-    # Handle potential NaN values properly during conversion
-    cleaned_data = df_deduplicated.astype(object).where(
-        pd.notnull(df_deduplicated), None
-    )  # .to_dict('records')
-    return cleaned_data
-
-
 # parse_percent, parse_specific_percent, parse_insights_string, parse_h2h_value
 def parse_percent(text_value, default=0):
     if not isinstance(text_value, str):
@@ -520,764 +498,6 @@ def create_colored_progress_bar(value, text_label=None):
 
 
 # --- Data Loading Functions ---
-# @st.cache_data # Cache results if data doesn't change often
-def load_data_from_text(filepath):
-    """Loads and parses match data from the text file."""
-    st.info(f"Loading data from Text file: {filepath}")
-    # --- Paste the complex text parsing logic from the previous response here ---
-    # This function should return a list of match dictionaries
-    all_matches = []
-    try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            content = f.read()
-    except FileNotFoundError:
-        st.error(f"Error: Data file '{filepath}' not found.")
-        return []
-    except Exception as e:
-        st.error(f"Error reading file '{filepath}': {e}")
-        return []
-
-    # Split into match blocks - assumes '📅' starts a new match
-    # Use positive lookahead (?=...) to keep the delimiter
-    match_blocks = re.split(r"(?=📅)", content)
-
-    for i, block in enumerate(match_blocks):
-        block = block.strip()
-        if not block or not block.startswith("📅"):
-            continue  # Skip empty blocks or fragments
-
-        match = {"raw_block": block}  # Store raw block for debugging if needed
-        lines = block.strip().split("\n")
-        current_insight_type = None
-        insight_buffer = ""
-
-        # Initialize with defaults (important!)
-        match.update(
-            {
-                "date": None,
-                "time": None,
-                "country": None,
-                "league": None,
-                "league_name": None,
-                "home_team": None,
-                "home_rank": "",
-                "away_team": None,
-                "away_rank": "",
-                "exp_val_h": None,
-                "exp_val_d": None,
-                "exp_val_a": None,
-                "advice": None,
-                "value_bets": None,
-                "form_home": None,
-                "form_away": None,
-                "ppg_h": None,
-                "ppg_h_all": None,
-                "ppg_a": None,
-                "ppg_a_all": None,
-                "goals_h": None,
-                "xg_h": None,
-                "goals_a": None,
-                "xg_a": None,
-                "conceded_h": None,
-                "xga_h": None,
-                "conceded_a": None,
-                "xga_a": None,
-                "halves_o05_h": None,
-                "halves_o05_a": None,
-                "team_goals_h": None,
-                "team_goals_a": None,
-                "match_goals_h": None,
-                "match_goals_a": None,
-                "clean_sheet_h": None,
-                "clean_sheet_a": None,
-                "win_rates_h": None,
-                "win_rates_a": None,
-                "h2h_hva_record": None,
-                "h2h_hva_games": None,
-                "h2h_all_record": None,
-                "h2h_all_games": None,
-                "h2h_hva_ppg_str": None,
-                "h2h_hva_goals_str": None,
-                "h2h_hva_ou": None,
-                "insights_home": "",
-                "insights_away": "",
-                "insights_total_h": "",
-                "insights_total_a": "",
-                "confidence_score": None,
-                "pred_outcome": None,
-                "pred_outcome_conf": None,
-                "pred_goals": None,
-                "pred_goals_conf": None,
-                "pred_corners": None,
-                "pred_corners_conf": None,
-                "rec_prediction": None,
-                "match_id": None,  # Will be generated at the end
-            }
-        )
-
-        home_team_buffer = None  # Buffer to identify total insights block
-
-        for line_num, line in enumerate(lines):
-            line = line.strip()
-            if not line:
-                continue
-
-            try:  # Wrap line parsing in try-except
-                # --- Parse Core Info ---
-                if line.startswith("📅"):
-                    m = re.search(r"📅\s*([\d/]+),\s*🕛\s*([\d:]+)", line)
-                    if m:
-                        match["date"], match["time"] = m.groups()
-                elif re.match(
-                    r"^[🌍🌎🌏🗺️⚽🏀🏈⚾🥎🎾🏐🏉🎱🔮🎮👾🏆🥇🥈🥉🏅🎖️🏵️🎗️🎀🎁🎂🎃🎄🎅🎆🎇✨🎈🎉🎊🎋🎍🎎🎏🎐🎑🧧🎀🎁🎗️🎟️🎫",
-                    line,
-                ):  # Match most common flags/emojis used for league
-                    parts = line.split(" ", 1)
-                    if len(parts) == 2:
-                        match["league"] = parts[1]
-                        country_parts = parts[1].split(",", 1)
-                        match["country"] = country_parts[0].strip()
-                        if len(country_parts) > 1:
-                            # Remove parentheses and content inside like ( 24 )
-                            league_part = re.sub(
-                                r"\s*\(\s*\d+\s*\)\s*$", "", country_parts[1]
-                            ).strip()
-                            match["league_name"] = league_part
-                        else:
-                            match["league_name"] = match[
-                                "country"
-                            ]  # Fallback if no comma
-                elif line.startswith("⚡"):
-                    # Make rank optional with (?:...)?
-                    m = re.search(
-                        r"\*(.*?)(?:\s*\((.*?)\))?\s*v\s*(.*?)(?:\s*\((.*?)\))?\*", line
-                    )
-                    if m:
-                        (
-                            match["home_team"],
-                            match["home_rank"],
-                            match["away_team"],
-                            match["away_rank"],
-                        ) = [g.strip() if g else "" for g in m.groups()]
-                        home_team_buffer = match["home_team"]  # Store home team name
-
-                # --- Parse Predictions & Values ---
-                elif line.startswith("✨ *Expected Value*:"):
-                    match["exp_val_h"] = (
-                        re.search(r"H\*:\s*([\d.]+%)", line).group(1)
-                        if re.search(r"H\*:\s*([\d.]+%)", line)
-                        else None
-                    )
-                    match["exp_val_d"] = (
-                        re.search(r"D\*:\s*([\d.]+%)", line).group(1)
-                        if re.search(r"D\*:\s*([\d.]+%)", line)
-                        else None
-                    )
-                    match["exp_val_a"] = (
-                        re.search(r"A\*:\s*([\d.]+%)", line).group(1)
-                        if re.search(r"A\*:\s*([\d.]+%)", line)
-                        else None
-                    )
-                elif line.startswith("✨ *Advice*:"):
-                    match["advice"] = line.split(":", 1)[1].strip()
-                elif line.startswith("🎯"):
-                    match["value_bets"] = line.split(":", 1)[1].strip()
-
-                # --- Parse Stats ---
-                elif line.startswith("📊 *H/All Form*:"):
-                    form_line = line.split(": ", 1)[1]
-                    parts = form_line.split("//")  # Split current form and all form
-                    home_parts = (
-                        parts[0].split("║") if "║" in parts[0] else [parts[0], ""]
-                    )
-                    away_parts = (
-                        parts[1].split("║")
-                        if len(parts) > 1 and "║" in parts[1]
-                        else [parts[1] if len(parts) > 1 else "", ""]
-                    )
-                    match["form_home"] = home_parts[0].strip()
-                    match["form_away"] = away_parts[
-                        0
-                    ].strip()  # Adjusted splitting needed if format changes
-                elif line.startswith("📈 *PPG:"):
-                    m_ppg = re.search(
-                        r"H\*:\s*([\d.]+)\s*\|\s*All:\s*([\d.]+)\s*║\s*\*A\*:\s*([\d.]+)\s*\|\s*All:\s*([\d.]+)",
-                        line,
-                    )
-                    if m_ppg:
-                        try:
-                            match["ppg_h"] = float(m_ppg.group(1))
-                        except:
-                            pass
-                        try:
-                            match["ppg_h_all"] = float(m_ppg.group(2))
-                        except:
-                            pass
-                        try:
-                            match["ppg_a"] = float(m_ppg.group(3))
-                        except:
-                            pass
-                        try:
-                            match["ppg_a_all"] = float(m_ppg.group(4))
-                        except:
-                            pass
-                elif line.startswith("⚽ *Goals/g:"):
-                    m_goals = re.search(
-                        r"H\*:\s*([\d.]+)\s*\(xG:\s*(.*?)\)\s*\|\s*\*A\*:\s*([\d.]+)\s*\(xG:\s*(.*?)\)",
-                        line,
-                    )
-                    if m_goals:
-                        try:
-                            match["goals_h"] = float(m_goals.group(1))
-                        except:
-                            pass
-                        xg_h_val = m_goals.group(2).strip()
-                        match["xg_h"] = (
-                            float(xg_h_val) if xg_h_val and xg_h_val != "" else None
-                        )
-                        try:
-                            match["goals_a"] = float(m_goals.group(3))
-                        except:
-                            pass
-                        xg_a_val = (
-                            m_goals.group(4).strip().rstrip(")")
-                        )  # Strip trailing ')'
-                        match["xg_a"] = (
-                            float(xg_a_val) if xg_a_val and xg_a_val != "" else None
-                        )
-                elif line.startswith("⚽ *Conceded/g:"):
-                    m_conc = re.search(
-                        r"H\*:\s*([\d.]+)\s*\(xGA:\s*(.*?)\)\s*\|\s*\*A\*:\s*([\d.]+)\s*\(xGA:\s*(.*?)\)",
-                        line,
-                    )
-                    if m_conc:
-                        try:
-                            match["conceded_h"] = float(m_conc.group(1))
-                        except:
-                            pass
-                        xga_h_val = m_conc.group(2).strip()
-                        match["xga_h"] = (
-                            float(xga_h_val) if xga_h_val and xga_h_val != "" else None
-                        )
-                        try:
-                            match["conceded_a"] = float(m_conc.group(3))
-                        except:
-                            pass
-                        xga_a_val = (
-                            m_conc.group(4).strip().rstrip(")")
-                        )  # Strip trailing ')'
-                        match["xga_a"] = (
-                            float(xga_a_val) if xga_a_val and xga_a_val != "" else None
-                        )
-                elif line.startswith("🥅 *Halves Over 0.5:"):
-                    parts = line.split(": ", 1)[1].split(" ║ ")
-                    match["halves_o05_h"] = parts[0].strip()
-                    match["halves_o05_a"] = parts[1].strip()
-                elif line.startswith("⚽ *Team Goals:"):
-                    parts = line.split(": ", 1)[1].split(" ║ ")
-                    match["team_goals_h"] = parts[0].strip()
-                    match["team_goals_a"] = parts[1].strip()
-                elif line.startswith("🥅 *Match Goals:"):
-                    parts = line.split(": ", 1)[1].split(" ║ ")
-                    match["match_goals_h"] = parts[0].strip()
-                    match["match_goals_a"] = parts[1].strip()
-                elif line.startswith("🧼"):
-                    parts = line.split(": ", 1)[1].split(" | ")
-                    cs_h = parts[0].replace("*A*", "").strip()
-                    cs_a = (
-                        parts[1].replace("*A*", "").strip() if len(parts) > 1 else None
-                    )
-                    match["clean_sheet_h"] = cs_h if cs_h != "nan" else None
-                    match["clean_sheet_a"] = cs_a if cs_a and cs_a != "nan" else None
-                elif line.startswith("🏆"):
-                    parts = line.split(": ", 1)[1].split(" | *A*: ")
-                    match["win_rates_h"] = parts[0].strip()
-                    match["win_rates_a"] = parts[1].strip() if len(parts) > 1 else None
-
-                # --- Parse H2H ---
-                elif line.startswith("📉 *HvA H2H Record*:"):
-                    m_h2h_hva = re.search(r":\s*([\d\-]+)\/(\d+)", line)
-                    if m_h2h_hva:
-                        match["h2h_hva_record"] = m_h2h_hva.group(1)
-                        try:
-                            match["h2h_hva_games"] = int(m_h2h_hva.group(2))
-                        except:
-                            pass
-                elif line.startswith("📉 *All H2H Record*:"):
-                    m_h2h_all = re.search(r":\s*([\d\-]+)\/(\d+)", line)
-                    if m_h2h_all:
-                        match["h2h_all_record"] = m_h2h_all.group(1)
-                        try:
-                            match["h2h_all_games"] = int(m_h2h_all.group(2))
-                        except:
-                            pass
-                elif line.startswith("📈 *H2H PPG:"):
-                    match["h2h_hva_ppg_str"] = line.split(": ", 1)[1]
-                elif line.startswith("⚽ *H2H Goals Scored:"):
-                    match["h2h_hva_goals_str"] = line.split(": ", 1)[1]
-                elif line.startswith("🥅 *H2H HvA Over/Under*:"):
-                    match["h2h_hva_ou"] = line.split(": ", 1)[1]
-
-                # --- Parse Insights (Improved Buffering) ---
-                elif line.startswith("✨ *Home Insights*:"):
-                    if current_insight_type:
-                        match[f"insights_{current_insight_type}"] = (
-                            insight_buffer.strip()
-                        )
-                    current_insight_type = "home"
-                    insight_buffer = (
-                        line.split(":", 1)[1].strip() + "\n" if ":" in line else "\n"
-                    )
-                elif line.startswith("✨ *Away Insights*:"):
-                    if current_insight_type:
-                        match[f"insights_{current_insight_type}"] = (
-                            insight_buffer.strip()
-                        )
-                    current_insight_type = "away"
-                    insight_buffer = (
-                        line.split(":", 1)[1].strip() + "\n" if ":" in line else "\n"
-                    )
-                elif line.startswith("✨ *Total Match Insights*:"):
-                    if current_insight_type:
-                        match[f"insights_{current_insight_type}"] = (
-                            insight_buffer.strip()
-                        )
-                    current_insight_type = None  # Stop basic insight capture
-                    insight_buffer = ""
-                elif line.startswith("⚡*"):  # Start of Total Match Insights block
-                    if insight_buffer and current_insight_type in [
-                        "home",
-                        "away",
-                    ]:  # Save previous basic block
-                        match[f"insights_{current_insight_type}"] = (
-                            insight_buffer.strip()
-                        )
-                    insight_buffer = ""  # Reset buffer for total insights
-                    team_name_match = re.match(r"⚡\*(.*?)\s*\(.*?\):", line)
-                    if team_name_match:
-                        team_name_in_line = team_name_match.group(1).strip()
-                        # Assign to total_h or total_a based on home_team_buffer
-                        if home_team_buffer and team_name_in_line == home_team_buffer:
-                            current_insight_type = "total_h"
-                        else:
-                            current_insight_type = "total_a"
-                        # Start buffer with content after the team name part
-                        insight_buffer = (
-                            line.split("):", 1)[1].strip() + "\n"
-                            if "):" in line
-                            else ""
-                        )
-                    else:  # If pattern fails, assume it's a continuation
-                        if current_insight_type:
-                            insight_buffer += line + "\n"
-
-                elif current_insight_type and line.startswith(
-                    "   -"
-                ):  # Indented lines belong to current block
-                    insight_buffer += line.strip() + "\n"
-                elif current_insight_type and not re.match(
-                    r"^(?:🎲|Match Outcome:|Over/Under Goals:|Over/Under Corners:|Recommended Prediction:)",
-                    line,
-                ):
-                    # Capture non-indented lines if we are inside an insight block, before confidence section starts
-                    insight_buffer += line.strip() + "\n"
-
-                # --- Parse Confidence & Final Predictions ---
-                elif line.startswith("🎲"):
-                    if (
-                        insight_buffer and current_insight_type
-                    ):  # Store last insight block
-                        match[f"insights_{current_insight_type}"] = (
-                            insight_buffer.strip()
-                        )
-                        insight_buffer = ""
-                        current_insight_type = None  # Reset type after storing
-                    m_conf = re.search(r"Score:\s*(\d+)", line)
-                    if m_conf:
-                        try:
-                            match["confidence_score"] = int(m_conf.group(1))
-                        except:
-                            pass
-                elif line.startswith("Match Outcome:"):
-                    m_pred = re.search(
-                        r":\s*(.*?)(?:\s*\((\d+)/10\))?$", line
-                    )  # Make confidence optional
-                    if m_pred:
-                        match["pred_outcome"] = m_pred.group(1).strip()
-                        if m_pred.group(2):
-                            try:
-                                match["pred_outcome_conf"] = int(m_pred.group(2))
-                            except:
-                                pass
-                elif line.startswith("Over/Under Goals:"):
-                    m_pred = re.search(r":\s*(.*?)(?:\s*\((\d+)/10\))?$", line)
-                    if m_pred:
-                        match["pred_goals"] = m_pred.group(1).strip()
-                        if m_pred.group(2):
-                            try:
-                                match["pred_goals_conf"] = int(m_pred.group(2))
-                            except:
-                                pass
-                elif line.startswith("Over/Under Corners:"):
-                    m_pred = re.search(r":\s*(.*?)(?:\s*\((\d+)/10\))?$", line)
-                    if m_pred:
-                        match["pred_corners"] = m_pred.group(1).strip()
-                        if m_pred.group(2):
-                            try:
-                                match["pred_corners_conf"] = int(m_pred.group(2))
-                            except:
-                                pass
-                elif line.startswith("Recommended Prediction:"):
-                    match["rec_prediction"] = line.split(":", 1)[1].strip()
-
-                # --- Fallback/End of block ---
-                elif line_num == len(lines) - 1:  # Last line check
-                    if insight_buffer and current_insight_type:
-                        match[f"insights_{current_insight_type}"] = (
-                            insight_buffer.strip()
-                        )
-
-            except Exception as e_line:
-                st.warning(
-                    f"Error parsing line {line_num + 1} in block {i + 1}: '{line}' - {e_line}"
-                )
-                continue  # Skip to next line on error
-
-        # --- Post-processing & ID ---
-        if match.get("home_team") and match.get(
-            "date"
-        ):  # Only add if core info was parsed
-            # Ensure all insight keys exist even if empty
-            for k in [
-                "insights_home",
-                "insights_away",
-                "insights_total_h",
-                "insights_total_a",
-            ]:
-                if k not in match:
-                    match[k] = ""
-            match["match_id"] = (
-                f"{match['home_team']}_{match['away_team']}_{match['date']}_{i}"
-            )
-            all_matches.append(match)
-        else:
-            st.warning(f"Skipped block {i + 1} due to missing core info (team/date).")
-
-    st.success(f"Successfully parsed {len(all_matches)} matches from '{filepath}'.")
-    return all_matches
-
-
-@st.cache_data
-def load_data_from_csv(filepath) -> pd.DataFrame:
-    """Loads match data from a CSV file."""
-    # st.info(f"Loading data from CSV file: {filepath}")
-    add_transient_message("info", f"Loading data from CSV file: {filepath}")
-
-    try:
-        df = pd.read_csv(filepath)
-
-        # Basic Cleaning & Type Conversion (adjust as needed based on actual CSV)
-        # Convert potential numeric columns, coercing errors to NaN then filling
-        float_cols = [
-            "exp_val_h",
-            "exp_val_d",
-            "exp_val_a",
-            "ppg_h",
-            "ppg_h_all",
-            "ppg_a",
-            "ppg_a_all",
-            "goals_h",
-            "xg_h",
-            "goals_a",
-            "xg_a",
-            "conceded_h",
-            "xga_h",
-            "conceded_a",
-            "xga_a",
-            "1h_o05_h",
-            "1h_o05_a",
-            "2h_o05_h",
-            "2h_o05_a",
-            "team_goals_0_5_h",
-            "team_goals_1_5_h",
-            "team_goals_0_5_a",
-            "team_goals_1_5_a",
-            "match_goals_1_5_a",
-            "match_goals_2_5_h",
-            "match_goals_1_5_h",
-            "match_goals_2_5_a",
-            "clean_sheet_h",
-            "clean_sheet_a",
-            "ht_win_rates_h",
-            "ft_win_rates_h",
-            "ht_win_rates_a",
-            "ft_win_rates_a",
-            "h2h_hva_ppg_str",
-            "h2h_hva_ppg_str",
-            "h2h_h_goals_str",
-            "HeadToHeadHomeXG",
-            "h2h_a_goals_str",
-            "HeadToHeadAwayXG",
-            "h2h_hva_o1_5",
-            "h2h_hva_o2_5",
-            # "confidence_score",
-            "pred_outcome_conf",
-            "pred_goals_conf",
-            "pred_corners_conf",
-            "pred_cards_conf",
-            "pred_alt_conf",
-            "model_success_rate",
-            "Last5_HomeBothTeamsToScore",
-            "Last5HomeAvergeTotalShots",
-            "Last5HomeAvergeTotalShotsOnGoal",
-            "Last5HomeAvergeTotalFouls",
-            "Last5HomeAvergeTotalcorners",
-            "Last5HomeAvergeTotalYellowCards",
-            "Last5HomeAvergeTotalRedCards",
-            "Last5_AwayBothTeamsToScore",
-            "Last5AwayAvergeTotalShots",
-            "Last5AwayAvergeTotalShotsOnGoal",
-            "Last5AwayAvergeTotalFouls",
-            "Last5AwayAvergeTotalcorners",
-            "Last5AwayAvergeTotalYellowCards",
-            "Last5AwayAvergeTotalRedCards",
-            "l5_home_for_league_avg_shots",
-            "l5_home_for_league_avg_sot",
-            "l5_home_for_league_avg_corners",
-            "l5_home_for_league_avg_fouls",
-            "l5_home_for_league_avg_yellow_cards",
-            "l5_home_for_league_avg_red_cards",
-            "l5_away_for_league_avg_shots",
-            "l5_away_for_league_avg_sot",
-            "l5_away_for_league_avg_corners",
-            "l5_away_for_league_avg_fouls",
-            "l5_away_for_league_avg_yellow_cards",
-            "l5_away_for_league_avg_red_cards",
-            "l5_away_against_league_avg_shots",
-            "l5_away_against_league_avg_sot",
-            "l5_away_against_league_avg_corners",
-            "l5_away_against_league_avg_fouls",
-            "l5_away_against_league_avg_yellow_cards",
-            "l5_away_against_league_avg_red_cards",
-            "l5_home_against_league_avg_shots",
-            "l5_home_against_league_avg_sot",
-            "l5_home_against_league_avg_corners",
-            "l5_home_against_league_avg_fouls",
-            "l5_home_against_league_avg_yellow_cards",
-            "l5_home_against_league_avg_red_cards",
-            "HeadToHeadBTTS",
-            "HeadToHeadHomeTotalShots",
-            "HeadToHeadAwayTotalShots",
-            "HeadToHeadHomeShotsOnTarget",
-            "HeadToHeadAwayShotsOnTarget",
-            "HeadToHeadHomeFouls",
-            "HeadToHeadAwayFouls",
-            "HeadToHeadHomeCorners",
-            "HeadToHeadAwayCorners",
-            "HeadToHeadHomeYellowCards",
-            "HeadToHeadAwayYellowCards",
-            "HeadToHeadHomeRedCards",
-            "HeadToHeadAwayRedCards",
-            "HeadToHeadOver7Corners",
-            "HeadToHeadOver8Corners",
-            "HeadToHeadOver9Corners",
-            "HeadToHeadOver10Corners",
-            "HeadToHeadOver1YellowCards",
-            "HeadToHeadOver2YellowCards",
-            "HeadToHeadOver3YellowCards",
-            "HeadToHeadOver4YellowCards",
-            "HomeGoals",
-            "AwayGoals",
-            "Corners",
-            "YellowCards",
-            "RedCards",
-            "HTRHome",
-            "HTRDraw",
-            "HTRAway",
-            "FTTotalGoalsOver0.5",
-            "FTTotalGoalsOver1.5",
-            "FTTotalGoalsOver2.5",
-            "FTTotalGoalsOver3.5",
-            "FTBTTS",
-            "FHTTotalGoalsOver0.5",
-            "FHTTotalGoalsOver1.5",
-            "FHTTotalGoalsOver2.5",
-            "FHTTotalGoalsOver3.5",
-            "SHTTotalGoalsOver0.5",
-            "SHTTotalGoalsOver1.5",
-            "SHTTotalGoalsOver2.5",
-            "SHTTotalGoalsOver3.5",
-            "HomeWinToNil",
-            "AwayWinToNil",
-            "ScoredFirstTime",
-            "HomeSOTResults",
-            "HomeShotsResults",
-            "HomeFoulsResults",
-            "HomeCornersResults",
-            "HomeOffsidesResults",
-            "HomeYellowsResults",
-            "HomeRedsResults",
-            "HomeGoalKeeperSavesResults",
-            "HomeXGResults",
-            "AwaySOTResults",
-            "AwayShotsResults",
-            "AwayFoulsResults",
-            "AwayCornersResults",
-            "AwayOffsidesResults",
-            "AwayYellowsResults",
-            "AwayRedsResults",
-            "AwayGoalKeeperSavesResults",
-            "AwayXGResults",
-            "HomeGoals",
-            "AwayGoals",
-            "Corners",
-            "YellowCards",
-            "RedCards",
-            "HTRHome",
-            "HTRDraw",
-            "HTRAway",
-            "FTTotalGoalsOver0.5 ",
-            "FTTotalGoalsOver1.5 ",
-            "FTTotalGoalsOver2.5 ",
-            "FTTotalGoalsOver3.5 ",
-            "FTBTTS",
-            "FHTTotalGoalsOver0.5",
-            "FHTTotalGoalsOver1.5",
-            "FHTTotalGoalsOver2.5",
-            "FHTTotalGoalsOver3.5",
-            "SHTTotalGoalsOver0.5",
-            "SHTTotalGoalsOver1.5",
-            "SHTTotalGoalsOver2.5",
-            "SHTTotalGoalsOver3.5",
-            "HomeWinToNil",
-            "AwayWinToNil",
-            "ScoredFirstTime",
-            "Last5HomeOver7Corners",
-            "Last5HomeOver8Corners",
-            "Last5HomeOver9Corners",
-            "Last5HomeOver10Corners",
-            "Last5HomeAvergeTotalYellowCards",
-            "Last5HomeOver1YellowCards",
-            "Last5HomeOver2YellowCards",
-            "Last5HomeOver3YellowCards",
-            "Last5HomeOver4YellowCards",
-            "Last5HomeAvergeTotalRedCards",
-            "Last5AwayOver7Corners",
-            "Last5AwayOver8Corners",
-            "Last5AwayOver9Corners",
-            "Last5AwayOver10Corners",
-            "Last5AwayAvergeTotalYellowCards",
-            "Last5AwayOver1YellowCards",
-            "Last5AwayOver2YellowCards",
-            "Last5AwayOver3YellowCards",
-            "Last5AwayOver4YellowCards",
-            "Last5AwayAvergeTotalRedCards",
-            "l5_league_avg_btts",
-            "l5HomeLeagueCleanSheet",
-            "l5AwayLeagueCleanSheet",
-        ]
-
-        int_cols = ["h2h_hva_games", "h2h_all_games", "match_id"]
-
-        for col in float_cols:
-            if col in df.columns:
-                # Coerce errors during conversion, then fill NaN with None (or 0 if appropriate)
-                # df[col] = df[col].fillna(pd.NA) # Replace NaN with pandas NA for better handling
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-
-        for col in int_cols:
-            if col in df.columns:
-                # Coerce errors during conversion, then fill NaN with None (or 0 if appropriate)
-                # df[col] = df[col].fillna(pd.NA) # Replace NaN with pandas NA for better handling
-                df[col] = pd.to_numeric(df[col], errors="coerce").astype(
-                    "Int64"
-                )  # Use nullable Int
-
-        # Fill NaN in string columns with None or empty string
-        string_cols = df.select_dtypes(include="object").columns
-        df[string_cols] = df[string_cols].fillna(
-            ""
-        )  # Fill NaNs in object columns with empty strings
-
-        # Typecast HomeGoals and AwayGoals to int if they exist and are not NaN
-
-        # if 'HomeGoals' in df.columns:
-        #     df['HomeGoals'] = pd.to_numeric(df['HomeGoals'], errors='coerce')
-        #     df.loc[df['HomeGoals'].notna(), 'HomeGoals'] = df['HomeGoals'].astype(int)
-        # if 'AwayGoals' in df.columns:
-        #     df['AwayGoals'] = pd.to_numeric(df['AwayGoals'], errors='coerce')
-        #     df.loc[df['AwayGoals'].notna(), 'AwayGoals'] = df['AwayGoals'].astype(int)
-
-        # --- !!! Deduplication Step !!! ---
-        # Check if 'match_id' column exists
-        if "match_id" not in df.columns:
-            st.error("CSV file is missing the required 'match_id' column.")
-            add_transient_message(
-                "error", "CSV file is missing the required 'match_id' column."
-            )
-            return []  # Return empty list
-
-        # Count duplicates before dropping (optional info)
-        # initial_rows = len(df)
-        duplicates_count = df.duplicated(subset=["match_id"]).sum()
-        if duplicates_count > 0:
-            # st.warning(f"Found {duplicates_count} duplicate match_id entries in the CSV. Keeping the first occurrence of each.")
-            add_transient_message(
-                "warning",
-                f"Found {duplicates_count} duplicate match_id entries in the CSV. Keeping the first occurrence of each.",
-            )
-
-        # Drop duplicates based on 'match_id', keeping the first instance
-        df_deduplicated = df.drop_duplicates(subset=["match_id"], keep="first")
-
-        # --- Convert back to list of dictionaries ---
-        # This format seems expected by the rest of your app
-        # Handle potential NaN values properly during conversion
-        cleaned_data = (
-            df_deduplicated.astype(object)
-            .where(pd.notnull(df_deduplicated), None)
-            .to_dict("records")
-        )
-        cleaned_data_df = pd.DataFrame(cleaned_data)
-
-        if "rec_prediction" in cleaned_data_df.columns:
-            cleaned_data_df["rec_prediction"] = cleaned_data_df["rec_prediction"].apply(
-                clean_prediction_string
-            )
-
-        # Optional: Log how many rows remain
-        # st.info(f"Loaded {len(cleaned_data)} unique matches from {initial_rows} rows in CSV.")
-        # st.success(f"Successfully loaded {len(cleaned_data)} matches from '{filepath}'.")
-        add_transient_message(
-            "success",
-            f"Successfully loaded {len(cleaned_data)} matches from '{filepath}'.",
-        )
-        return cleaned_data_df
-
-    except FileNotFoundError:
-        st.error(
-            f"Error: CSV file '{filepath}' not found. Please create it or change DATA_SOURCE."
-        )
-        add_transient_message(
-            "error",
-            f"CSV file '{filepath}' not found. Please create it or change DATA_SOURCE.",
-        )
-        # --- Create a sample CSV if it doesn't exist for simulation ---
-        # st.warning("Creating a sample CSV file for simulation.")
-        # sample_df = create_sample_dataframe() # Generate sample data
-        # try:
-        #     sample_df.to_csv(filepath, index=False)
-        #     st.info(f"Sample CSV created at '{filepath}'. Please reload the page.")
-        #     return []
-        # except Exception as e_write:
-        #     st.error(f"Could not write sample CSV: {e_write}")
-        return []
-    except Exception as e:
-        # st.error(f"Error loading data from CSV '{filepath}': {e}")
-        add_transient_message("error", f"Error loading data from CSV '{filepath}': {e}")
-        return []
-
-
 @st.cache_data
 def load_data_from_postgres(db_params):
     """Simulates loading data from PostgreSQL."""
@@ -1416,748 +636,6 @@ def add_transient_message(msg_type, text):
     )
 
 
-def clean_prediction_string(prediction_str: str) -> str:
-    """
-    Cleans and standardizes a raw prediction string to facilitate easier parsing.
-
-    Handles issues like:
-    - Removing leading/trailing whitespace and converting to lowercase.
-    - Removing common useless prefixes like "match outcome:".
-    - Splitting compound words like "overundercards:" into "over/under cards ".
-    - Removing duplicate adjacent words like "goals goals".
-    - Standardizing abbreviations and terms (e.g., "&" to "and", "o/u" to "over/under").
-
-    :param prediction_str: The raw prediction string from your source.
-    :return: A cleaned and standardized prediction string.
-    """
-    if not isinstance(prediction_str, str) or not prediction_str.strip():
-        return ""  # Return empty string for invalid input
-
-    # 1. Initial cleanup: lowercase and strip whitespace
-    clean_str = prediction_str.strip()  # .lower()
-
-    # 2. Remove common prefixes
-    prefixes_to_remove = [
-        "Match Outcome: ",
-        # "prediction:",
-        # "alternative pick:",
-        # "alternative signal:",
-        # "pick:",
-        # "signal:",
-    ]
-    for prefix in prefixes_to_remove:
-        if clean_str.startswith(prefix):
-            clean_str = clean_str[len(prefix) :].strip()
-            break  # Assume only one prefix needs removal
-
-    # 3. Handle compound words and insert spaces
-    # Turns "overundercards:4.5" into "over/under cards : 4.5"
-    # Turns "o1.5" into "o 1.5"
-    # Turns "home-1.5" into "home -1.5"
-    # This uses regex lookarounds to insert spaces without consuming the characters.
-    # Insert space between words and numbers/colons/hyphens
-    # clean_str = re.sub(r'([a-zA-Z])([:\-0-9])', r'\1 \2', clean_str)
-    # # Insert space between numbers and words
-    # clean_str = re.sub(r'([0-9])([a-zA-Z])', r'\1 \2', clean_str)
-
-    # 4. Split specific compound words and append context if needed
-    # If the string contains ": ", split into two parts
-    if (
-        "OverUnderCards: " in clean_str
-        or "OverUnderCorners: " in clean_str
-        or "OverUnderGoals: " in clean_str
-    ):
-        first, second = clean_str.split(": ", 1)
-        first_lower = first.lower()
-        # If "cards" in first part, append " cards" to second part
-        if "cards" in first_lower:
-            clean_str = f"{second} Cards"
-        # If "corners" in first part, append " corners" to second part
-        elif "corners" in first_lower:
-            clean_str = f"{second} Corners"
-        # If "goals" in first part, append " goals" to second part
-        elif "goals" in first_lower:
-            clean_str = f"{second} Goals"
-        else:
-            clean_str = f"{second}"
-
-    if "Home or Draw (1X)" in clean_str:
-        # Replace "Home or Draw (1X)" at the start of the string, possibly followed by confidence in parentheses
-        clean_str = re.sub(r"^Home or Draw \(1X\)", "Home Win or Draw", clean_str)
-
-    elif "Away or Draw (X2)" in clean_str:
-        # Replace "Away or Draw (X2)" at the start of the string, possibly followed by confidence in parentheses
-        clean_str = re.sub(r"^Away or Draw \(X2\)", "Away Win or Draw", clean_str)
-
-    # 5. Standardize terms and abbreviations
-    # term_replacements = {
-    #     "&": " and ",
-    #     "o/u": "over under",
-    #     " o ": " over ", # Pad with spaces to avoid replacing 'o' in words like 'home'
-    #     " u ": " under ",
-    #     " to win": " win", # "Urawa to win" -> "Urawa win"
-    #     " to score": "",  # "Team to score over 1.5" -> "Team over 1.5"
-    #     " team goals": " goals", # "home team goals over 1.5" -> "home goals over 1.5"
-    # }
-    # for term, replacement in term_replacements.items():
-    #     clean_str = clean_str.replace(term, replacement)
-
-    # 6. Remove duplicate adjacent words
-    # Uses a regex with a backreference (\1) to find a word (\b\w+\b)
-    # followed by one or more spaces (\s+) and then the exact same word.
-    clean_str = re.sub(r"\b(\w+)\s+\1\b", r"\1", clean_str)
-
-    # 7. Final cleanup: normalize whitespace (replace multiple spaces with a single one)
-    clean_str = re.sub(r"\s+", " ", clean_str).strip()
-
-    return clean_str
-
-
-# This is a simplified version, adjust based on your exact prediction strings
-# --- NEW Helper function to check ALL prediction types ---
-def check_prediction_success(
-    prediction_str,
-    home_goals,
-    away_goals,
-    total_corners,
-    total_yellow_cards,
-    home_team_name,
-    away_team_name,
-    home_yellow_cards,
-    away_yellow_cards,
-    home_red_cards,
-    away_red_cards,
-) -> str | None:
-    if (
-        not prediction_str
-        or not isinstance(prediction_str, str)
-        or prediction_str.strip() == "--"
-    ):
-        return "PENDING"
-
-    pred_cleaned = clean_prediction_string(prediction_str.strip())
-    pred_lower = pred_cleaned.lower()
-
-    # --- Data Validity ---
-    scores_valid = (
-        isinstance(home_goals, (int, float))
-        and not math.isnan(home_goals)
-        and isinstance(away_goals, (int, float))
-        and not math.isnan(away_goals)
-    )
-    corners_valid = isinstance(total_corners, (int, float)) and not math.isnan(
-        total_corners
-    )
-    # Check for individual team card validity
-    home_cards_valid = (
-        isinstance(home_yellow_cards, (int, float))
-        and not math.isnan(home_yellow_cards)
-        and (
-            home_red_cards is None
-            or (
-                isinstance(home_red_cards, (int, float))
-                and not math.isnan(home_red_cards)
-            )
-        )
-    )
-    away_cards_valid = (
-        isinstance(away_yellow_cards, (int, float))
-        and not math.isnan(away_yellow_cards)
-        and (
-            away_red_cards is None
-            or (
-                isinstance(away_red_cards, (int, float))
-                and not math.isnan(away_red_cards)
-            )
-        )
-    )
-
-    all_cards_valid = home_cards_valid and away_cards_valid
-
-    corners_valid = isinstance(total_corners, (int, float)) and not math.isnan(
-        total_corners
-    )
-
-    home_team_lower = home_team_name.lower().strip() if home_team_name else ""
-    away_team_lower = away_team_name.lower().strip() if away_team_name else ""
-
-    # --- Helper variables for outcomes ---
-    if scores_valid:
-        actual_home_win = home_goals > away_goals
-        actual_away_win = away_goals > home_goals
-        actual_draw = home_goals == away_goals
-        total_actual_goals = home_goals + away_goals
-
-    # --- 1. Team to Win AND Over/Under Goals ---
-    # Catches "Urawa to Win and Over 1.5 Goals", "Home Win & Under 3.5 Goals"
-    combo_win_ou_match = re.search(
-        r"^(.*?)(?:\s+to\s+win)?\s*(?:&|and)\s*(over|under)\s*(\d+\.\d+)\s*goals?$",
-        pred_lower,
-    )
-    if combo_win_ou_match:
-        if not scores_valid:
-            return "PENDING"
-        team_part, ou_type, line_val_str = combo_win_ou_match.groups()
-        line_val = float(line_val_str)
-        team_part = team_part.strip()
-
-        # Determine which team is predicted to win
-        predicted_winner = None
-        if team_part == "home win" or team_part == home_team_lower:
-            predicted_winner = "home"
-        elif team_part == "away win" or team_part == away_team_lower:
-            predicted_winner = "away"
-
-        # Check win condition
-        win_condition_met = (predicted_winner == "home" and actual_home_win) or (
-            predicted_winner == "away" and actual_away_win
-        )
-
-        # Check Over/Under condition
-        ou_condition_met = (ou_type == "over" and total_actual_goals > line_val) or (
-            ou_type == "under" and total_actual_goals < line_val
-        )
-
-        if win_condition_met and ou_condition_met:
-            return "WIN"
-        else:
-            return "LOSS"
-
-    # --- 1a. Team to Score Over/Under Goals ---
-    # Catches "Home Team to Score Over 1.5 Goals", "Away Team to Score Under 2.5 Goals"
-    team_score_ou_match = re.search(
-        r"^(home|away)\s*team\s*to\s*score\s*(over|under)\s*(\d+\.\d+)\s*goals?$",
-        pred_lower,
-    )
-    if team_score_ou_match:
-        team_side, ou_type, line_val_str = team_score_ou_match.groups()
-        line_val = float(line_val_str)
-        if not scores_valid:
-            return "PENDING"
-        if team_side == "home":
-            team_goals = home_goals
-        else:
-            team_goals = away_goals
-        if ou_type == "over":
-            return "WIN" if team_goals > line_val else "LOSS"
-        else:
-            return "WIN" if team_goals < line_val else "LOSS"
-
-    # --- 1b. Team to Win
-    # Catches {Actual Home Team Name} Win e.g."Hebei Kungfu Win(7/10)", "Home Win", "Away Win", "TeamName Win"
-    team_win_match = re.match(
-        r"^(.*?)(?:\s+win)(?:\s*\(\d+\/10\))?$", pred_cleaned, re.IGNORECASE
-    )
-    if team_win_match:
-        if not scores_valid:
-            return "PENDING"
-        team_name_pred = team_win_match.group(1).strip().lower()
-        # Check if predicted team matches home or away team
-        if team_name_pred == home_team_lower or team_name_pred == "home":
-            return "WIN" if actual_home_win else "LOSS"
-        elif team_name_pred == away_team_lower or team_name_pred == "away":
-            return "WIN" if actual_away_win else "LOSS"
-        # If team name doesn't match either, treat as pending or loss
-        return "PENDING"
-
-    # --- 2. Double Chance AND Under Goals ---
-    # Catches "Away Team Win or Draw and Under 3.5 Goals"
-    combo_dc_under_match = re.search(
-        r"^(.*?)\s*(?:&|and)\s*under\s*(\d+\.\d+)\s*goals?$", pred_lower
-    )
-    if combo_dc_under_match:
-        if not scores_valid:
-            return "PENDING"
-        dc_part, line_val_str = combo_dc_under_match.groups()
-        line_val = float(line_val_str)
-        dc_part = dc_part.strip()
-
-        # Determine which double chance is predicted
-        dc_condition_met = False
-        if (
-            "home" in dc_part
-            or "1x" in dc_part
-            or (home_team_lower and home_team_lower in dc_part)
-        ):
-            dc_condition_met = actual_home_win or actual_draw
-        elif (
-            "away" in dc_part
-            or "x2" in dc_part
-            or (away_team_lower and away_team_lower in dc_part)
-        ):
-            dc_condition_met = actual_away_win or actual_draw
-
-        # Check Under condition
-        under_condition_met = total_actual_goals < line_val
-
-        if dc_condition_met and under_condition_met:
-            return "WIN"
-        else:
-            return "LOSS"
-
-    # --- 3. Asian Handicap ---
-    # Catches "Home -1.5 Asian Handicap", "Yunnan Yukun -1.5 Asian Handicap"
-    ah_match = re.search(
-        r"^(.*?)\s*([+-]\d+\.\d+)\s*(?:asian\s*)?handicap$", pred_lower
-    )
-    if ah_match:
-        if not scores_valid:
-            return "PENDING"
-        team_part, handicap_str = ah_match.groups()
-        handicap = float(handicap_str)
-        team_part = team_part.strip()
-
-        # Determine which team the handicap applies to
-        if team_part == "home" or team_part == home_team_lower:
-            return "WIN" if (home_goals + handicap) > away_goals else "LOSS"
-        elif team_part == "away" or team_part == away_team_lower:
-            return "WIN" if (away_goals + handicap) > home_goals else "LOSS"
-
-    # --- 4. Team Clean Sheet / Win to Nil ---
-    # Catches "Vitoria Clean Sheet Yes", "Home Team to Win to Nil"
-    if "clean sheet" in pred_lower:
-        if not scores_valid:
-            return "PENDING"
-        team_part = pred_lower.replace("clean sheet", "").replace("yes", "").strip()
-        if "home" in team_part or (home_team_lower and home_team_lower in team_part):
-            return "WIN" if away_goals == 0 else "LOSS"
-        elif "away" in team_part or (away_team_lower and away_team_lower in team_part):
-            return "WIN" if home_goals == 0 else "LOSS"
-
-    if "win to nil" in pred_lower:
-        if not scores_valid:
-            return "PENDING"
-        team_part = pred_lower.replace("to win to nil", "").strip()
-        if "home" in team_part or (home_team_lower and home_team_lower in team_part):
-            return "WIN" if actual_home_win and away_goals == 0 else "LOSS"
-        elif "away" in team_part or (away_team_lower and away_team_lower in team_part):
-            return "WIN" if actual_away_win and home_goals == 0 else "LOSS"
-
-    # --- 5. Team Total Cards Over/Under ---
-    # Catches "Home Team Total Cards Over 1.5"
-    # team_card_ou_match = re.search(
-    #     r"^(home\s*team|away\s*team)\s*(?:total\s*)?cards\s*(over|under)\s*(\d+(?:\.\d+)?)$",
-    #     pred_lower,
-    # )
-    # if team_card_ou_match:
-    #     team_part, ou_type, line_val_str = team_card_ou_match.groups()
-    #     line_val = float(line_val_str)
-
-    #     target_team_cards = 0
-    #     if team_part == "home team":
-    #         if not home_cards_valid:
-    #             return "PENDING"
-    #         # Using booking points: Yellow=1, Red=2. Adjust if your source uses different rules.
-    #         target_team_cards = (home_yellow_cards or 0) + ((home_red_cards or 0) * 2)
-    #     elif team_part == "away team":
-    #         if not away_cards_valid:
-    #             return "PENDING"
-    #         target_team_cards = (away_yellow_cards or 0) + ((away_red_cards or 0) * 2)
-
-    #     if ou_type == "over":
-    #         return "WIN" if target_team_cards > line_val else "LOSS"
-    #     elif ou_type == "under":
-    #         return "WIN" if target_team_cards < line_val else "LOSS"
-
-    # --- 6. Over/Under CORNERS ---
-    corner_ou_match = re.search(
-        r"\b(o|u|over|under)\s*(\d+(?:\.\d+)?)\s*(?:corners?|c\b)", pred_lower
-    )
-    if corner_ou_match:
-        if not corners_valid:
-            return "PENDING"
-        ou_type, line_val_str = (
-            corner_ou_match.group(1).lower(),
-            corner_ou_match.group(2),
-        )
-        line_val = float(line_val_str)
-        if total_corners == line_val:
-            return "PUSH"
-        if ou_type.startswith("o"):
-            return "WIN" if total_corners > line_val else "LOSS"
-        elif ou_type.startswith("u"):
-            return "WIN" if total_corners < line_val else "LOSS"
-        return "PENDING"  # Should not be reached
-
-    # --- 7. Over/Under YELLOW CARDS ---
-    # This pattern looks for "over/under X.Y cards" but specifically avoids "home team" or "away team".
-    # Accepts "Over 4.5 Yellow Cards", "Under 3.5 Yellow Cards", "O 2.5 Yellow Cards", etc. (with or without "yellow")
-    total_card_ou_match = re.search(
-        r"\b(o|u|over|under)\s*(\d+(?:\.\d+)?)\s*(?:yellow\s*)?cards?\b",  # 'yellow' is optional
-        pred_lower,
-    )
-    # st.caption(
-    #     f"Total card ou match: {total_card_ou_match}, valid: {all_cards_valid} | HY:{home_yellow_cards} is {home_cards_valid}, AY:{away_yellow_cards} is {away_cards_valid}"
-    # )
-    if total_card_ou_match:
-        if not all_cards_valid:
-            return "PENDING"
-        ou_type, line_val_str = (
-            total_card_ou_match.group(1).lower(),
-            total_card_ou_match.group(2),
-        )
-        line_val = float(line_val_str)
-
-        # Calculate total match booking points
-        total_card_points = (
-            (home_yellow_cards or 0)
-            + (away_yellow_cards or 0)
-            + ((home_red_cards or 0) * 2)
-            + ((away_red_cards or 0) * 2)
-        )
-
-        if total_card_points == line_val:
-            return "PUSH"
-        if ou_type.startswith("o") or ou_type == "over":
-            return "WIN" if total_card_points > line_val else "LOSS"
-        elif ou_type.startswith("u") or ou_type == "under":
-            return "WIN" if total_card_points < line_val else "LOSS"
-
-    # --- 8. BTTS (Both Teams To Score) ---
-    is_btts_yes_pred = re.search(
-        r"\b(btts|both\s*teams\s*to\s*score)\s*(yes)?\b|\bgg\b", pred_lower
-    ) and not re.search(r"\b(btts|both\s*teams\s*to\s*score)\s*no\b|\bng\b", pred_lower)
-    is_btts_no_pred = re.search(
-        r"\b(btts|both\s*teams\s*to\s*score)\s*no\b|\bng\b|\bno\s*goal\b", pred_lower
-    )
-    if is_btts_yes_pred:
-        if not scores_valid:
-            return "PENDING"
-        return "WIN" if home_goals > 0 and away_goals > 0 else "LOSS"
-    elif is_btts_no_pred:
-        if not scores_valid:
-            return "PENDING"
-        return "WIN" if not (home_goals > 0 and away_goals > 0) else "LOSS"
-
-    # --- 9. Team-Specific Over/Under Goals (Simplified and Explicit) ---
-    # This section will now look for "home team over/under X.Y" or "away team over/under X.Y"
-    # OR "{Actual Team Name} over/under X.Y"
-    debug_prediction_check = False
-    debug_target_pred_str = "home team over 1.5 goals"
-    # Pattern 4a: "home team over 1.5 goals" or "home team u 0.5"
-    ht_keyword_ou_match = re.search(
-        r"\b(home\s*team)\s+(o|u|over|under)\s*(\d+(?:\.\d+)?)(?:\s*goals?)?",
-        pred_lower,
-    )
-    if ht_keyword_ou_match:
-        if debug_prediction_check and pred_lower == debug_target_pred_str.lower():
-            print(
-                f"Matched: Keyword Home Team O/U - Groups: {ht_keyword_ou_match.groups()}"
-            )
-        if not scores_valid:
-            return "PENDING"
-        # Group 1 is "home team", Group 2 is o/u, Group 3 is number
-        ou_type, line_val_str = (
-            ht_keyword_ou_match.group(2).lower(),
-            ht_keyword_ou_match.group(3),
-        )
-        line_val = float(line_val_str)
-        if home_goals == line_val:
-            return "PUSH"
-        if ou_type.startswith("o"):
-            return "WIN" if home_goals > line_val else "LOSS"
-        elif ou_type.startswith("u"):
-            return "WIN" if home_goals < line_val else "LOSS"
-        return "PENDING"  # Fallback for this block
-
-    # Pattern 9b: "away team over 1.5 goals" or "away team u 0.5"
-    at_keyword_ou_match = re.search(
-        r"\b(away\s*team)\s+(o|u|over|under)\s*(\d+(?:\.\d+)?)(?:\s*goals?)?",
-        pred_lower,
-    )
-    if at_keyword_ou_match:
-        if debug_prediction_check and pred_lower == debug_target_pred_str.lower():
-            print(
-                f"Matched: Keyword Away Team O/U - Groups: {at_keyword_ou_match.groups()}"
-            )
-        if not scores_valid:
-            return "PENDING"
-        ou_type, line_val_str = (
-            at_keyword_ou_match.group(2).lower(),
-            at_keyword_ou_match.group(3),
-        )
-        line_val = float(line_val_str)
-        if away_goals == line_val:
-            return "PUSH"
-        if ou_type.startswith("o"):
-            return "WIN" if away_goals > line_val else "LOSS"
-        elif ou_type.startswith("u"):
-            return "WIN" if away_goals < line_val else "LOSS"
-        return "PENDING"
-
-    # Pattern 9c: "{Actual Home Team Name} over 1.5 goals" (if home_team_name is provided)
-    if home_team_lower:
-        actual_ht_ou_match = re.search(
-            rf"(?:^|\s)({re.escape(home_team_lower)})\s+(o|u|over|under)\s*(\d+(?:\.\d+)?)(?:\s*goals?)?",
-            pred_lower,
-        )
-        if actual_ht_ou_match:
-            if debug_prediction_check and pred_lower == debug_target_pred_str.lower():
-                print(
-                    f"Matched: Actual Home Team ({home_team_lower}) O/U - Groups: {actual_ht_ou_match.groups()}"
-                )
-            if not scores_valid:
-                return "PENDING"
-            # Group 1 is team name, Group 2 is o/u, Group 3 is number
-            ou_type, line_val_str = (
-                actual_ht_ou_match.group(2).lower(),
-                actual_ht_ou_match.group(3),
-            )
-            line_val = float(line_val_str)
-            if home_goals == line_val:
-                return "PUSH"
-            if ou_type.startswith("o"):
-                return "WIN" if home_goals > line_val else "LOSS"
-            elif ou_type.startswith("u"):
-                return "WIN" if home_goals < line_val else "LOSS"
-            return "PENDING"
-
-    # Pattern 9d: "{Actual Away Team Name} over 1.5 goals" (if away_team_name is provided)
-    if away_team_lower:
-        actual_at_ou_match = re.search(
-            rf"(?:^|\s)({re.escape(away_team_lower)})\s+(o|u|over|under)\s*(\d+(?:\.\d+)?)(?:\s*goals?)?",
-            pred_lower,
-        )
-        if actual_at_ou_match:
-            if debug_prediction_check and pred_lower == debug_target_pred_str.lower():
-                print(
-                    f"Matched: Actual Away Team ({away_team_lower}) O/U - Groups: {actual_at_ou_match.groups()}"
-                )
-            if not scores_valid:
-                return "PENDING"
-            ou_type, line_val_str = (
-                actual_at_ou_match.group(2).lower(),
-                actual_at_ou_match.group(3),
-            )
-            line_val = float(line_val_str)
-            if away_goals == line_val:
-                return "PUSH"
-            if ou_type.startswith("o"):
-                return "WIN" if away_goals > line_val else "LOSS"
-            elif ou_type.startswith("u"):
-                return "WIN" if away_goals < line_val else "LOSS"
-            return "PENDING"
-
-    # --- 10. General Over/Under GOALS ---
-    goal_ou_match = re.fullmatch(
-        r"(o|u|over|under)\s*(\d+(?:\.\d+)?)(?:\s*goals?)?", pred_lower
-    )
-    if goal_ou_match:
-        if not scores_valid:
-            return "PENDING"
-        total_actual_goals = home_goals + away_goals
-        ou_type, line_val_str = goal_ou_match.group(1).lower(), goal_ou_match.group(2)
-        line_val = float(line_val_str)
-        if total_actual_goals == line_val:
-            return "PUSH"
-        if ou_type.startswith("o"):
-            return "WIN" if total_actual_goals > line_val else "LOSS"
-        elif ou_type.startswith("u"):
-            return "WIN" if total_actual_goals < line_val else "LOSS"
-        return "PENDING"
-
-    # --- 11. WDL / HAX / Double Chance / Team Name Match Result ---
-    # This is the most complex section due to varied formats.
-    # Scores must be valid to determine win/loss for these markets.
-
-    is_prediction_format_outcome_market = (
-        False  # Heuristic: does it look like an outcome market?
-    )
-    temp_potential_preds = [
-        p.strip().lower() for p in prediction_str.split(",")
-    ]  # Comma separated values like "H, X"
-    for temp_part_pred in temp_potential_preds:
-        # Check for keywords that strongly indicate an outcome market
-        if (
-            re.search(r"\b(double\s*chance|dc)\b", temp_part_pred)
-            or re.fullmatch(r"([hax12])([x12])?", temp_part_pred)
-            or re.fullmatch(r"([hax])\s*\(.+\)", temp_part_pred)
-            or any(
-                kw in temp_part_pred
-                for kw in [
-                    "home or draw",
-                    "away or draw",
-                    "home or away",
-                    "draw or home",
-                    "draw or away",
-                    "away or home",
-                    "home win",
-                    "away win",
-                ]
-            )
-            or temp_part_pred in ["home", "draw", "away", "1", "2", "x"]
-            or (home_team_lower and temp_part_pred == home_team_lower)
-            or (away_team_lower and temp_part_pred == away_team_lower)
-        ):
-            is_prediction_format_outcome_market = True
-            break
-
-    if not scores_valid:
-        return (
-            "PENDING" if is_prediction_format_outcome_market else "PENDING"
-        )  # Default if scores missing
-
-    actual_home_win = home_goals > away_goals
-    actual_away_win = away_goals > home_goals
-    actual_draw = home_goals == away_goals
-
-    # Process each part of a potentially comma-separated prediction (e.g., "H, X" for a WDL bet covering two outcomes)
-    for part_pred_dc in temp_potential_preds:  # Use a different iterator variable name
-        # A. HAX format (e.g., "H(1.5)", "X", "A")
-        hax_match = re.fullmatch(r"([hax])(?:\s*\(.+\))?", part_pred_dc)
-        if hax_match:
-            bet_char = hax_match.group(1)
-            if (
-                (bet_char == "h" and actual_home_win)
-                or (bet_char == "x" and actual_draw)
-                or (bet_char == "a" and actual_away_win)
-            ):
-                return "WIN"
-            # If it's a single HAX prediction and it didn't win, it's a loss.
-            # If part of a combo, we continue to check other parts.
-            if len(temp_potential_preds) == 1:
-                return "LOSS"
-            continue  # To check next part of a combo HAX bet
-
-        # B. Explicit "Double Chance 1X", "DC X2", etc.
-        dc_explicit_match = re.search(
-            r"\b(?:double\s*chance|dc)\s*([1x2]{2})\b", part_pred_dc
-        )
-        if dc_explicit_match:
-            dc_symbols = "".join(
-                sorted(dc_explicit_match.group(1))
-            )  # e.g. "x1" -> "1x"
-            if (
-                (dc_symbols == "1x" and (actual_home_win or actual_draw))
-                or (dc_symbols == "2x" and (actual_away_win or actual_draw))
-                or (dc_symbols == "12" and (actual_home_win or actual_away_win))
-            ):
-                return "WIN"
-            return "LOSS"  # If explicitly "double chance X" and it lost
-
-        # C. Symbolic Double Chance (e.g., "1X", "X2", "12" without "double chance" prefix)
-        # Ensure it's exactly two chars and valid DC symbols.
-        if (
-            len(part_pred_dc) == 2
-            and all(c in "12x" for c in part_pred_dc)
-            and (
-                "x" in part_pred_dc
-                or (part_pred_dc[0].isdigit() and part_pred_dc[1].isdigit())
-            )
-        ):
-            dc_symbols = "".join(sorted(part_pred_dc))
-            if (
-                (dc_symbols == "1x" and (actual_home_win or actual_draw))
-                or (dc_symbols == "2x" and (actual_away_win or actual_draw))
-                or (dc_symbols == "12" and (actual_home_win or actual_away_win))
-            ):
-                return "WIN"
-            # If it was a 2-char DC symbol and didn't win, it's a loss
-            # (unless part of a larger comma-separated string not yet fully evaluated)
-            if len(temp_potential_preds) == 1:
-                return "LOSS"
-            continue
-
-        # D. Textual Double Chance ("Home or Draw", "Team A or Draw")
-        # Home or Draw
-        if (
-            re.search(r"\bhome\b", part_pred_dc)
-            and re.search(r"\bor\s+draw\b", part_pred_dc)
-        ) or (
-            home_team_lower
-            and re.search(re.escape(home_team_lower), part_pred_dc)
-            and re.search(r"\bor\s+draw\b", part_pred_dc)
-        ):
-            return "WIN" if actual_home_win or actual_draw else "LOSS"
-        # Away or Draw
-        if (
-            re.search(r"\baway\b", part_pred_dc)
-            and re.search(r"\bor\s+draw\b", part_pred_dc)
-        ) or (
-            away_team_lower
-            and re.search(re.escape(away_team_lower), part_pred_dc)
-            and re.search(r"\bor\s+draw\b", part_pred_dc)
-        ):
-            return "WIN" if actual_away_win or actual_draw else "LOSS"
-        # Home or Away (No Draw)
-        if (
-            (
-                re.search(r"\bhome\b", part_pred_dc)
-                and re.search(r"\bor\s+away\b", part_pred_dc)
-            )
-            or (
-                home_team_lower
-                and re.search(re.escape(home_team_lower), part_pred_dc)
-                and (
-                    re.search(r"\bor\s+away\b", part_pred_dc)
-                    or (
-                        away_team_lower
-                        and re.search(
-                            r"\bor\s+" + re.escape(away_team_lower), part_pred_dc
-                        )
-                    )
-                )
-            )
-            or (
-                away_team_lower
-                and re.search(re.escape(away_team_lower), part_pred_dc)
-                and (
-                    re.search(r"\bor\s+home\b", part_pred_dc)
-                    or (
-                        home_team_lower
-                        and re.search(
-                            r"\bor\s+" + re.escape(home_team_lower), part_pred_dc
-                        )
-                    )
-                )
-            )
-        ):
-            return "WIN" if actual_home_win or actual_away_win else "LOSS"
-
-        # E. Single WDL Keywords/Numbers/Team Names
-        # Using re.fullmatch for exact matches of these terms
-        if (
-            (re.fullmatch(r"home\s*win", part_pred_dc) and actual_home_win)
-            or (re.fullmatch(r"home", part_pred_dc) and actual_home_win)
-            or (re.fullmatch(r"1", part_pred_dc) and actual_home_win)
-        ):
-            return "WIN"
-
-        if (
-            (re.fullmatch(r"away\s*win", part_pred_dc) and actual_away_win)
-            or (re.fullmatch(r"away", part_pred_dc) and actual_away_win)
-            or (re.fullmatch(r"2", part_pred_dc) and actual_away_win)
-        ):
-            return "WIN"
-
-        if (re.fullmatch(r"draw", part_pred_dc) and actual_draw) or (
-            re.fullmatch(r"x", part_pred_dc) and actual_draw
-        ):
-            return "WIN"
-
-        if (
-            home_team_lower
-            and re.fullmatch(home_team_lower, part_pred_dc)
-            and actual_home_win
-        ):
-            return "WIN"
-        if (
-            away_team_lower
-            and re.fullmatch(away_team_lower, part_pred_dc)
-            and actual_away_win
-        ):
-            return "WIN"
-
-    # If we iterated through all parts of a potential WDL/DC combo (like "H, X")
-    # and none of them resulted in a "WIN" (due to `return "WIN"` above),
-    # AND the format was indeed identified as an outcome market, then it's a LOSS.
-    if is_prediction_format_outcome_market:  # and we haven't returned "WIN"
-        return "LOSS"
-
-    # print(f"Debug: Prediction '{prediction_str}' did not match any known betting pattern for WIN/LOSS/PUSH.")
-    return "PENDING"
-
-
 def colorize_performance(performance):
     colored_performance = ""
     for char in performance:
@@ -2549,32 +1027,14 @@ with message_placeholder.container():
 st.sidebar.title("Filters")
 # --- !!! MODIFIED Weekly File Selection !!! ---
 
-# 1. Find files matching the numeric pattern (e.g., "43.csv")
-#    Using "[0-9]*.csv" ensures we only grab files starting with digits.
-raw_files = glob.glob(os.path.join(WEEKLY_PREDICTIONS_DIR, "[0-9]*.csv"))
+# 1. Weekly files ("43.csv", ...) from the cached week manifest, latest first.
+#    Listing them opens no file; only the selected week is summarised below.
+week_entries = week_manifest(WEEKLY_PREDICTIONS_DIR)
 
-# 2. Extract week number and path, handling potential errors
-week_path_pairs = []
-for f_path in raw_files:
-    basename = os.path.basename(f_path)
-    # Use regex to extract digits before ".csv"
-    match = re.match(r"(\d+)\.csv$", basename)
-    if match:
-        try:
-            week_num = int(match.group(1))
-            week_path_pairs.append((week_num, f_path))
-        except ValueError:
-            # Skip if the extracted part isn't a valid integer
-            st.sidebar.caption(f"Skipping non-integer file: {basename}")
-    # else: File didn't match the pattern "number.csv", silently ignore
+# 2. Create options dictionary {display_name: full_path}
+weekly_file_options = {f"Week {entry['week']}": entry["path"] for entry in week_entries}
 
-# 3. Sort based on week number (descending for latest first)
-week_path_pairs.sort(key=lambda pair: pair[0], reverse=True)
-
-# 4. Create options dictionary {display_name: full_path}
-weekly_file_options = {f"Week {week_num}": path for week_num, path in week_path_pairs}
-
-# 5. Create the selectbox
+# 3. Create the selectbox
 selected_week_display_name = None  # Initialize
 if not weekly_file_options:
     st.sidebar.warning("No weekly match files (e.g., 43.csv) found.")
@@ -2586,6 +1046,15 @@ else:
         key="week_selector_key",  # Assign a key to the selector itself
         on_change=handle_week_change,  # *** Attach the callback ***
     )
+    selected_summary = None
+    if selected_week_display_name:
+        selected_summary = week_summary(weekly_file_options[selected_week_display_name])
+    if selected_summary and selected_summary["first_date"]:
+        league_count = len(selected_summary["leagues"])
+        st.sidebar.caption(
+            f"{selected_summary['first_date']:%d/%m} - {selected_summary['last_date']:%d/%m/%Y}"
+            f" · {selected_summary['rows']} matches · {league_count} leagues"
+        )
 
 # --- End Modified Weekly File Selection ---
 
@@ -2601,7 +1070,8 @@ current_selected_week_key = st.session_state.get(
 
 if current_selected_week_key and current_selected_week_key in weekly_file_options:
     selected_file_path = weekly_file_options[current_selected_week_key]
-    weekly_df_raw = load_weekly_data(selected_file_path)
+    # Only the columns the overview and filters use; see load_match_details
+    weekly_df_raw = load_weekly_data(selected_file_path, columns=OVERVIEW_COLUMNS)
     weekly_df = sort_data(weekly_df_raw)  # Sort the DataFrame by date/time
 
 # if selected_week_display_name:
@@ -3300,6 +1770,12 @@ if selected_match_id:
             selected_match_data = match
             break
     # ... (logic if selected match not found in filtered list) ...
+    if selected_match_data:
+        # Add the odds, referee, H2H and insights columns the overview skipped
+        selected_match_data = {
+            **load_match_details(selected_file_path, selected_match_id),
+            **selected_match_data,
+        }
 
 # --- Display Overview or Details using filtered_matches_list ---
 if not selected_match_data:
@@ -3345,19 +1821,7 @@ if not selected_match_data:
                 # Count WINs for rec_prediction in league_matches_played
                 win_count = 0
                 for match in league_matches_played:
-                    result = check_prediction_success(
-                        match.get("rec_prediction"),
-                        match.get("HomeGoals"),
-                        match.get("AwayGoals"),
-                        match.get("Corners"),
-                        match.get("YellowCards"),
-                        match.get("home_team"),
-                        match.get("away_team"),
-                        match.get("HomeYellowsResults"),
-                        match.get("AwayYellowsResults"),
-                        match.get("HomeRedResults"),
-                        match.get("AwayRedResults"),
-                    )
+                    result = match.get("rec_prediction_grade")
                     # st.caption(result)
                     if result == "WIN":
                         win_count += 1
@@ -3678,19 +2142,7 @@ if not selected_match_data:
                             # Pass necessary stats to the check function
                             # rec_pred_parts = rec_pred.split("(")
                             # rec_pred_only = rec_pred_parts[0].strip()
-                            rec_pred_won = check_prediction_success(
-                                rec_pred,
-                                home_goals,
-                                away_goals,
-                                corners,
-                                cards,
-                                home_team,
-                                away_team,
-                                match.get("HomeYellowsResults", None),
-                                match.get("AwayYellowsResults", None),
-                                match.get("HomeRedResults", 0),
-                                match.get("HomeRedResults", 0),
-                            )
+                            rec_pred_won = match.get("rec_prediction_grade")
                             # st.info(f"Cards: {cards}")
                             if rec_pred and rec_pred != "--":
                                 pred_display = (
@@ -3710,19 +2162,7 @@ if not selected_match_data:
                                     " "
                                 )  # non-breaking space to avoid empty node
 
-                            value_bet_won = check_prediction_success(
-                                value_bet,
-                                home_goals,
-                                away_goals,
-                                corners,
-                                cards,
-                                home_team,
-                                away_team,
-                                match.get("HomeYellowsResults", None),
-                                match.get("AwayYellowsResults", None),
-                                match.get("HomeRedResults", 0),
-                                match.get("HomeRedResults", 0),
-                            )
+                            value_bet_won = match.get("value_bets_grade")
                             if value_bet:
                                 value_display = f"Value Tip: {value_bet}"
                                 if value_bet_won == "WIN":
@@ -3735,19 +2175,7 @@ if not selected_match_data:
                             else:
                                 st.caption(" ")
 
-                            alt_bet_won = check_prediction_success(
-                                alt_pred,
-                                home_goals,
-                                away_goals,
-                                corners,
-                                cards,
-                                home_team,
-                                away_team,
-                                match.get("HomeYellowsResults", None),
-                                match.get("AwayYellowsResults", None),
-                                match.get("HomeRedResults", 0),
-                                match.get("HomeRedResults", 0),
-                            )
+                            alt_bet_won = match.get("pred_alt_grade")
                             if alt_pred:
                                 alt_bet_display = f"Alt. Bet: {alt_pred}"
                                 if alt_bet_won == "WIN":
@@ -3767,19 +2195,7 @@ if not selected_match_data:
                             )
                             outcome_val = f"{outcome_val_raw[0].strip()}{outcome_conf}"
 
-                            outcome_bet_won = check_prediction_success(
-                                outcome_val,
-                                home_goals,
-                                away_goals,
-                                corners,
-                                cards,
-                                home_team,
-                                away_team,
-                                match.get("HomeYellowsResults", None),
-                                match.get("AwayYellowsResults", None),
-                                match.get("HomeRedResults", 0),
-                                match.get("HomeRedResults", 0),
-                            )
+                            outcome_bet_won = match.get("pred_outcome_grade")
 
                             if outcome_val:
                                 outcome_display = f"Match outcome: {outcome_val}"
@@ -4284,19 +2700,7 @@ else:
     rec_pred_parts = rec_pred.split("(")
     rec_pred_only = rec_pred_parts[0].strip()
     rec_pred_conf = f"({rec_pred_parts[-1].strip()})" if len(rec_pred_parts) > 1 else ""
-    rec_pred_won = check_prediction_success(
-        rec_pred_only,
-        home_goals,
-        away_goals,
-        corners,
-        cards,
-        home_team,
-        away_team,
-        match.get("HomeYellowsResults", None),
-        match.get("AwayYellowsResults", None),
-        match.get("HomeRedResults", 0),
-        match.get("HomeRedResults", 0),
-    )
+    rec_pred_won = selected_match_data.get("rec_prediction_grade")
 
     if rec_pred:
         pred_display = f"{rec_pred}({confidence_score})"
@@ -4311,19 +2715,7 @@ else:
     # --- Check and Display Value Tip ---
     # Pass necessary stats to the check function
     value_display = ""
-    value_bet_won = check_prediction_success(
-        value_bet,
-        home_goals,
-        away_goals,
-        corners,
-        cards,
-        home_team,
-        away_team,
-        match.get("HomeYellowsResults", None),
-        match.get("AwayYellowsResults", None),
-        match.get("HomeRedResults", 0),
-        match.get("HomeRedResults", 0),
-    )
+    value_bet_won = selected_match_data.get("value_bets_grade")
     if value_bet:
         value_display = f"{value_bet}"
         if value_bet_won == "WIN":
@@ -4383,19 +2775,7 @@ else:
             )
             outcome_val_raw = selected_match_data.get("pred_outcome", "--").split("(")
             outcome_val = outcome_val_raw[0].strip()
-            outcome_bet_won = check_prediction_success(
-                outcome_val,
-                home_goals,
-                away_goals,
-                corners,
-                cards,
-                home_team,
-                away_team,
-                match.get("HomeYellowsResults", None),
-                match.get("AwayYellowsResults", None),
-                match.get("HomeRedResults", 0),
-                match.get("HomeRedResults", 0),
-            )
+            outcome_bet_won = selected_match_data.get("pred_outcome_grade")
             if outcome_val:
                 outcome_display = None  # f"<span style='font-size: 2em; display: block; margin-bottom: 0.2em;'>{outcome_val}</span>"
                 if outcome_bet_won:
@@ -4418,19 +2798,7 @@ else:
             alt_conf_text = f"{round(alt_conf)}/10" if alt_conf is not None else "--"
             alt_val_raw = selected_match_data.get("pred_alt", "--").split("(")
             alt_val = alt_val_raw[0].strip()
-            alt_bet_won = check_prediction_success(
-                alt_val,
-                home_goals,
-                away_goals,
-                corners,
-                cards,
-                home_team,
-                away_team,
-                match.get("HomeYellowsResults", None),
-                match.get("AwayYellowsResults", None),
-                match.get("HomeRedResults", 0),
-                match.get("HomeRedResults", 0),
-            )
+            alt_bet_won = selected_match_data.get("pred_alt_grade")
             if alt_val:
                 alt_display = None  # f"<span style='font-size: 2em; display: block; margin-bottom: 0.2em;'>{alt_val}</span>"
                 if alt_bet_won:
@@ -4455,19 +2823,7 @@ else:
             )
             goals_val_raw = selected_match_data.get("pred_goals", "--").split("(")
             goals_val = f"{goals_val_raw[0].strip()} goals" if goals_val_raw else None
-            goals_bet_won = check_prediction_success(
-                goals_val,
-                home_goals,
-                away_goals,
-                corners,
-                cards,
-                home_team,
-                away_team,
-                match.get("HomeYellowsResults", None),
-                match.get("AwayYellowsResults", None),
-                match.get("HomeRedResults", 0),
-                match.get("HomeRedResults", 0),
-            )
+            goals_bet_won = selected_match_data.get("pred_goals_grade")
             if goals_val:
                 goals_display = None  # f"<span style='font-size: 2em; display: block; margin-bottom: 0.2em;'>{goals_val}</span>"
                 if goals_bet_won:
@@ -4498,19 +2854,7 @@ else:
             cards_val = (
                 f"{cards_val_raw[0].strip()} Yellow Cards" if cards_val_raw else None
             )
-            cards_bet_won = check_prediction_success(
-                cards_val,
-                home_goals,
-                away_goals,
-                corners,
-                cards,
-                home_team,
-                away_team,
-                match.get("HomeYellowsResults", None),
-                match.get("AwayYellowsResults", None),
-                match.get("HomeRedResults", 0),
-                match.get("HomeRedResults", 0),
-            )
+            cards_bet_won = selected_match_data.get("pred_cards_grade")
             if cards_val:
                 cards_display = None  # f"<span style='font-size: 2em; display: block; margin-bottom: 0.2em;'>{cards_val} ({cards_conf}/10)</span>"
                 if cards_bet_won:
@@ -4539,19 +2883,7 @@ else:
             corners_val = (
                 f"{corners_val_raw[0].strip()} Corners" if corners_val_raw else None
             )
-            corners_bet_won = check_prediction_success(
-                corners_val,
-                home_goals,
-                away_goals,
-                corners,
-                cards,
-                home_team,
-                away_team,
-                match.get("HomeYellowsResults", None),
-                match.get("AwayYellowsResults", None),
-                match.get("HomeRedResults", 0),
-                match.get("HomeRedResults", 0),
-            )
+            corners_bet_won = selected_match_data.get("pred_corners_grade")
             # Check if corner prediction is meaningful before showing
             if corners_val:
                 corners_display = None  # f"<span style='font-size: 2em; display: block; margin-bottom: 0.2em;'>{corners_val} ({corners_conf}/10)</span>"
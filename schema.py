@@ -0,0 +1,617 @@
+"""Column registry for the weekly prediction CSVs.
+
+Every column the dashboard knows about is declared once here with its
+dtype, whether it may be missing and the group it belongs to. data_loader
+compiles the registry into the parser's ``dtype``/``usecols`` arguments, so
+a week comes out of a single typed parse; columns that are not listed are
+still loaded (with inferred types) and reported so they can be added.
+"""
+
+from dataclasses import dataclass
+
+# --- Dtypes ---
+FLOAT = "float64"
+# Integer columns may be written as "5.0" by the exporter; they are parsed
+# as floats and cast to Int64 afterwards.
+INT = "Int64"
+STRING = "string"
+
+# --- Column Groups ---
+MATCH = "match"
+PREDICTIONS = "predictions"
+FORM = "form"
+H2H = "h2h"
+INSIGHTS = "insights"
+RESULTS = "results"
+REFEREE = "referee"
+ODDS = "odds"
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    name: str
+    dtype: str
+    group: str
+    nullable: bool = True
+
+
+def _specs(group, dtype, names, nullable=True) -> list[ColumnSpec]:
+    return [ColumnSpec(name, dtype, group, nullable) for name in names]
+
+
+# Duplicated headers in the export (e.g. Last5HomeAvergeTotalYellowCards) are
+# listed under the ".1" name pandas gives the second occurrence.
+_SPECS = [
+    *_specs(
+        MATCH,
+        STRING,
+        [
+            "date",
+            "country",
+            "league_name",
+            "home_team",
+            "away_team",
+        ],
+        nullable=False,
+    ),
+    *_specs(
+        MATCH,
+        STRING,
+        [
+            "time",
+            "country_logo",
+            "home_team_logo",
+            "home_rank",
+            "away_team_logo",
+            "away_rank",
+        ],
+    ),
+    *_specs(
+        MATCH,
+        INT,
+        [
+            "match_id",
+        ],
+        nullable=False,
+    ),
+    *_specs(
+        MATCH,
+        INT,
+        [
+            "FixtureID",
+            "FixtureID_x",
+            "FixtureID_y",
+        ],
+    ),
+    *_specs(
+        PREDICTIONS,
+        STRING,
+        [
+            "advice",
+            "value_bets",
+            "confidence_score",
+            "pred_outcome",
+            "pred_goals",
+            "pred_corners",
+            "rec_prediction",
+            "pred_cards",
+            "pred_alt",
+        ],
+    ),
+    *_specs(
+        PREDICTIONS,
+        FLOAT,
+        [
+            "exp_val_h",
+            "exp_val_d",
+            "exp_val_a",
+            "pred_outcome_conf",
+            "pred_goals_conf",
+            "pred_corners_conf",
+            "pred_cards_conf",
+            "pred_alt_conf",
+            "model_success_rate",
+        ],
+    ),
+    *_specs(
+        FORM,
+        STRING,
+        [
+            "form_home",
+            "form_away",
+            "all_form_home",
+            "all_form_away",
+            "l5_home_corners_for",
+            "l5_home_corners_against",
+            "l5_away_corners_for",
+            "l5_away_corners_against",
+            "l5_home_cards_for",
+            "l5_home_cards_against",
+            "l5_away_cards_for",
+            "l5_away_cards_against",
+            "l5_home_fouls_for",
+            "l5_home_fouls_against",
+            "l5_away_fouls_for",
+            "l5_away_fouls_against",
+        ],
+    ),
+    *_specs(
+        FORM,
+        FLOAT,
+        [
+            "ppg_h",
+            "ppg_h_all",
+            "ppg_a",
+            "ppg_a_all",
+            "goals_h",
+            "xg_h",
+            "goals_a",
+            "xg_a",
+            "conceded_h",
+            "xga_h",
+            "conceded_a",
+            "xga_a",
+            "1h_o05_h",
+            "1h_o05_a",
+            "2h_o05_h",
+            "2h_o05_a",
+            "team_goals_0_5_h",
+            "team_goals_1_5_h",
+            "team_goals_0_5_a",
+            "team_goals_1_5_a",
+            "match_goals_1_5_a",
+            "match_goals_2_5_h",
+            "match_goals_1_5_h",
+            "match_goals_2_5_a",
+            "clean_sheet_h",
+            "clean_sheet_a",
+            "ht_win_rates_h",
+            "ft_win_rates_h",
+            "ht_win_rates_a",
+            "ft_win_rates_a",
+            "Last5_HomeBothTeamsToScore",
+            "Last5HomeAvergeTotalShots",
+            "Last5HomeAvergeTotalShotsOnGoal",
+            "Last5HomeAvergeTotalFouls",
+            "Last5HomeAvergeTotalcorners",
+            "Last5HomeAvergeTotalYellowCards",
+            "Last5HomeAvergeTotalRedCards",
+            "Last5_AwayBothTeamsToScore",
+            "Last5AwayAvergeTotalShots",
+            "Last5AwayAvergeTotalShotsOnGoal",
+            "Last5AwayAvergeTotalFouls",
+            "Last5AwayAvergeTotalcorners",
+            "Last5AwayAvergeTotalYellowCards",
+            "Last5AwayAvergeTotalRedCards",
+            "l5_home_for_league_avg_shots",
+            "l5_home_for_league_avg_sot",
+            "l5_home_for_league_avg_corners",
+            "l5_home_for_league_avg_fouls",
+            "l5_home_for_league_avg_yellow_cards",
+            "l5_home_for_league_avg_red_cards",
+            "l5_away_for_league_avg_shots",
+            "l5_away_for_league_avg_sot",
+            "l5_away_for_league_avg_corners",
+            "l5_away_for_league_avg_fouls",
+            "l5_away_for_league_avg_yellow_cards",
+            "l5_away_for_league_avg_red_cards",
+            "l5_away_against_league_avg_shots",
+            "l5_away_against_league_avg_sot",
+            "l5_away_against_league_avg_corners",
+            "l5_away_against_league_avg_fouls",
+            "l5_away_against_league_avg_yellow_cards",
+            "l5_away_against_league_avg_red_cards",
+            "l5_home_against_league_avg_shots",
+            "l5_home_against_league_avg_sot",
+            "l5_home_against_league_avg_corners",
+            "l5_home_against_league_avg_fouls",
+            "l5_home_against_league_avg_yellow_cards",
+            "l5_home_against_league_avg_red_cards",
+            "Last5HomeOver7Corners",
+            "Last5HomeOver8Corners",
+            "Last5HomeOver9Corners",
+            "Last5HomeOver10Corners",
+            "Last5HomeAvergeTotalYellowCards.1",
+            "Last5HomeOver1YellowCards",
+            "Last5HomeOver2YellowCards",
+            "Last5HomeOver3YellowCards",
+            "Last5HomeOver4YellowCards",
+            "Last5HomeAvergeTotalRedCards.1",
+            "Last5AwayOver7Corners",
+            "Last5AwayOver8Corners",
+            "Last5AwayOver9Corners",
+            "Last5AwayOver10Corners",
+            "Last5AwayAvergeTotalYellowCards.1",
+            "Last5AwayOver1YellowCards",
+            "Last5AwayOver2YellowCards",
+            "Last5AwayOver3YellowCards",
+            "Last5AwayOver4YellowCards",
+            "Last5AwayAvergeTotalRedCards.1",
+            "l5_league_avg_btts",
+            "l5HomeLeagueCleanSheet",
+            "l5AwayLeagueCleanSheet",
+        ],
+    ),
+    *_specs(
+        H2H,
+        STRING,
+        [
+            "h2h_hva_record",
+            "h2h_all_record",
+            "HeadToHeadHomeFirstHalfGoalsScored",
+            "HeadToHeadAwayFirstHalfGoalsScored",
+            "HeadToHeadHomeSecondHalfGoalsScored",
+            "HeadToHeadAwaySecondHalfGoalsScored",
+        ],
+    ),
+    *_specs(
+        H2H,
+        INT,
+        [
+            "h2h_hva_games",
+            "h2h_all_games",
+        ],
+    ),
+    *_specs(
+        H2H,
+        FLOAT,
+        [
+            "h2h_h_ppg",
+            "h2h_a_ppg",
+            "h2h_h_goals_scored",
+            "h2h_a_goals_scored",
+            "HeadToHeadHomeXG",
+            "HeadToHeadAwayXG",
+            "h2h_hva_o1_5",
+            "h2h_hva_o2_5",
+            "h2h_hva_u2_5",
+            "h2h_hva_u3_5",
+            "HeadToHeadBTTS",
+            "HeadToHeadHomeTotalShots",
+            "HeadToHeadAwayTotalShots",
+            "HeadToHeadHomeShotsOnTarget",
+            "HeadToHeadAwayShotsOnTarget",
+            "HeadToHeadHomeFouls",
+            "HeadToHeadAwayFouls",
+            "HeadToHeadHomeCorners",
+            "HeadToHeadAwayCorners",
+            "HeadToHeadHomeYellowCards",
+            "HeadToHeadAwayYellowCards",
+            "HeadToHeadHomeRedCards",
+            "HeadToHeadAwayRedCards",
+            "HeadToHeadOver7Corners",
+            "HeadToHeadOver8Corners",
+            "HeadToHeadOver9Corners",
+            "HeadToHeadOver10Corners",
+            "HeadToHeadOver1YellowCards",
+            "HeadToHeadOver2YellowCards",
+            "HeadToHeadOver3YellowCards",
+            "HeadToHeadOver4YellowCards",
+        ],
+    ),
+    *_specs(
+        INSIGHTS,
+        STRING,
+        [
+            "insights_home",
+            "insights_away",
+            "insights_total_h",
+            "insights_total_a",
+        ],
+    ),
+    *_specs(
+        RESULTS,
+        STRING,
+        [
+            "FTResult",
+            "HTResult",
+            "ScoredFirst",
+            "HomeBallPossessionResults",
+            "AwayBallPossessionResults",
+        ],
+    ),
+    *_specs(
+        RESULTS,
+        FLOAT,
+        [
+            "HomeGoals",
+            "AwayGoals",
+            "Corners",
+            "YellowCards",
+            "RedCards",
+            "HTRHome",
+            "HTRDraw",
+            "HTRAway",
+            "FTTotalGoalsOver0.5",
+            "FTTotalGoalsOver1.5",
+            "FTTotalGoalsOver2.5",
+            "FTTotalGoalsOver3.5",
+            "FTBTTS",
+            "FHTTotalGoalsOver0.5",
+            "FHTTotalGoalsOver1.5",
+            "FHTTotalGoalsOver2.5",
+            "FHTTotalGoalsOver3.5",
+            "SHTTotalGoalsOver0.5",
+            "SHTTotalGoalsOver1.5",
+            "SHTTotalGoalsOver2.5",
+            "SHTTotalGoalsOver3.5",
+            "HomeWinToNil",
+            "AwayWinToNil",
+            "ScoredFirstTime",
+            "HomeSOTResults",
+            "HomeShotsResults",
+            "HomeFoulsResults",
+            "HomeCornersResults",
+            "HomeOffsidesResults",
+            "HomeYellowsResults",
+            "HomeRedsResults",
+            "HomeGoalKeeperSavesResults",
+            "HomeXGResults",
+            "AwaySOTResults",
+            "AwayShotsResults",
+            "AwayFoulsResults",
+            "AwayCornersResults",
+            "AwayOffsidesResults",
+            "AwayYellowsResults",
+            "AwayRedsResults",
+            "AwayGoalKeeperSavesResults",
+            "AwayXGResults",
+        ],
+    ),
+    *_specs(
+        REFEREE,
+        STRING,
+        [
+            "Referee",
+            "RefLast5HomeTeamCards",
+            "RefLast5AwayTeamCards",
+            "RefSeasonStrictnessLabel",
+            "RefSeasonHomeStrictnessLabel",
+            "RefSeasonAwayStrictnessLabel",
+            "RefLast5StrictnessLabel",
+            "RefLast5HomeLabel",
+            "RefLast5AwayLabel",
+        ],
+    ),
+    *_specs(
+        REFEREE,
+        INT,
+        [
+            "RefSeasonAvgTotalCards",
+            "RefSeasonAvgHomeTeamCards",
+            "RefSeasonAvgAwayTeamCards",
+            "RefLast5AvgTotalCards",
+            "RefLast5AvgHomeTeamCards",
+            "RefLast5AvgAwayTeamCards",
+        ],
+    ),
+    *_specs(
+        REFEREE,
+        FLOAT,
+        [
+            "RefSeasonCardsPerFoul",
+            "RefSeasonCardsPerFoulHome",
+            "RefSeasonCardsPerFoulAway",
+            "RefLast5CardsPerFoul",
+            "RefLast5CardsPerFoulHome",
+            "RefLast5CardsPerFoulAway",
+            "RefSeasonStrictnessIndex",
+            "RefSeasonHomeStrictnessIndex",
+            "RefSeasonAwayStrictnessIndex",
+            "RefLast5StrictnessIndex",
+            "RefLast5HomeStrictnessIndex",
+            "RefLast5AwayStrictnessIndex",
+        ],
+    ),
+    *_specs(
+        ODDS,
+        FLOAT,
+        [
+            "Match Winner_HomeOdds",
+            "Match Winner_DrawOdds",
+            "Match Winner_AwayOdds",
+            "Double Chance_Home/DrawOdds",
+            "Double Chance_Home/AwayOdds",
+            "Double Chance_Draw/AwayOdds",
+            "Home/Away_HomeOdds",
+            "Home/Away_AwayOdds",
+            "Both Teams Score_YesOdds",
+            "Both Teams Score_NoOdds",
+            "Total - Home_Over 0.5Odds",
+            "Total - Home_Under 0.5Odds",
+            "Total - Home_Over 1.5Odds",
+            "Total - Home_Under 1.5Odds",
+            "Total - Home_Over 2.5Odds",
+            "Total - Home_Under 2.5Odds",
+            "Total - Away_Over 0.5Odds",
+            "Total - Away_Under 0.5Odds",
+            "Total - Away_Over 1.5Odds",
+            "Total - Away_Under 1.5Odds",
+            "Total - Away_Over 2.5Odds",
+            "Total - Away_Under 2.5Odds",
+            "Goals Over/Under_Over 0.5Odds",
+            "Goals Over/Under_Under 0.5Odds",
+            "Goals Over/Under_Over 1.5Odds",
+            "Goals Over/Under_Under 1.5Odds",
+            "Goals Over/Under_Over 2.5Odds",
+            "Goals Over/Under_Under 2.5Odds",
+            "Goals Over/Under_Over 3.5Odds",
+            "Goals Over/Under_Under 3.5Odds",
+            "Goals Over/Under_Over 4.5Odds",
+            "Goals Over/Under_Under 4.5Odds",
+            "Goals Over/Under_Over 1.0Odds",
+            "Goals Over/Under_Under 1.0Odds",
+            "Goals Over/Under_Over 2.0Odds",
+            "Goals Over/Under_Under 2.0Odds",
+            "Goals Over/Under_Over 3.0Odds",
+            "Goals Over/Under_Under 3.0Odds",
+            "Goals Over/Under_Over 4.0Odds",
+            "Goals Over/Under_Under 4.0Odds",
+            "Corners Over Under_Over 8.5Odds",
+            "Corners Over Under_Under 8.5Odds",
+            "Corners Over Under_Over 9Odds",
+            "Corners Over Under_Under 9Odds",
+            "Corners Over Under_Over 9.5Odds",
+            "Corners Over Under_Under 9.5Odds",
+            "Corners Over Under_Over 10Odds",
+            "Corners Over Under_Under 10Odds",
+            "Corners Over Under_Over 10.5Odds",
+            "Corners Over Under_Under 10.5Odds",
+            "Corners Over Under_Over 11Odds",
+            "Corners Over Under_Under 11Odds",
+            "Corners Over Under_Over 11.5Odds",
+            "Corners Over Under_Under 11.5Odds",
+            "Cards Over/Under_Over 3.5Odds",
+            "Cards Over/Under_Under 3.5Odds",
+            "Cards Over/Under_Over 4.0Odds",
+            "Cards Over/Under_Under 4.0Odds",
+            "First Half Winner_HomeOdds",
+            "First Half Winner_DrawOdds",
+            "First Half Winner_AwayOdds",
+            "Second Half Winner_HomeOdds",
+            "Second Half Winner_DrawOdds",
+            "Second Half Winner_AwayOdds",
+            "Goals Over/Under First Half_Over 0.5Odds",
+            "Goals Over/Under First Half_Under 0.5Odds",
+            "Goals Over/Under First Half_Over 1.0Odds",
+            "Goals Over/Under First Half_Under 1.0Odds",
+            "Goals Over/Under First Half_Over 1.5Odds",
+            "Goals Over/Under First Half_Under 1.5Odds",
+            "Goals Over/Under First Half_Over 2.0Odds",
+            "Goals Over/Under First Half_Under 2.0Odds",
+            "Double Chance - First Half_Home/DrawOdds",
+            "Double Chance - First Half_Home/AwayOdds",
+            "Double Chance - First Half_Draw/AwayOdds",
+            "Double Chance - Second Half_Home/DrawOdds",
+            "Double Chance - Second Half_Home/AwayOdds",
+            "Double Chance - Second Half_Draw/AwayOdds",
+            "Both Teams Score - First Half_YesOdds",
+            "Both Teams Score - First Half_NoOdds",
+            "Draw No Bet (1st Half)_HomeOdds",
+            "Draw No Bet (1st Half)_AwayOdds",
+            "Draw No Bet (2nd Half)_HomeOdds",
+            "Draw No Bet (2nd Half)_AwayOdds",
+            "Home Team Total Goals(1st Half)_Over 0.5Odds",
+            "Home Team Total Goals(1st Half)_Under 0.5Odds",
+            "Away Team Total Goals(1st Half)_Over 0.5Odds",
+            "Away Team Total Goals(1st Half)_Under 0.5Odds",
+            "Home Team Total Goals(1st Half)_Over 1.5Odds",
+            "Home Team Total Goals(1st Half)_Under 1.5Odds",
+            "Away Team Total Goals(1st Half)_Over 1.5Odds",
+            "Away Team Total Goals(1st Half)_Under 1.5Odds",
+            "Home Team Total Goals(1st Half)_Over 2.5Odds",
+            "Home Team Total Goals(1st Half)_Under 2.5Odds",
+            "Away Team Total Goals(1st Half)_Over 2.5Odds",
+            "Away Team Total Goals(1st Half)_Under 2.5Odds",
+            "Home Team Total Goals(2nd Half)_Over 0.5Odds",
+            "Home Team Total Goals(2nd Half)_Under 0.5Odds",
+            "Away Team Total Goals(2nd Half)_Over 0.5Odds",
+            "Away Team Total Goals(2nd Half)_Under 0.5Odds",
+            "Home Team Total Goals(2nd Half)_Over 1.5Odds",
+            "Home Team Total Goals(2nd Half)_Under 1.5Odds",
+            "Away Team Total Goals(2nd Half)_Over 1.5Odds",
+            "Away Team Total Goals(2nd Half)_Under 1.5Odds",
+            "Home Team Total Goals(2nd Half)_Over 2.5Odds",
+            "Home Team Total Goals(2nd Half)_Under 2.5Odds",
+            "Away Team Total Goals(2nd Half)_Over 2.5Odds",
+            "Away Team Total Goals(2nd Half)_Under 2.5Odds",
+            "Total Corners (1st Half)_Over 4Odds",
+            "Total Corners (1st Half)_Under 4Odds",
+            "Total Corners (1st Half)_Over 5Odds",
+            "Total Corners (1st Half)_Under 5Odds",
+            "Total Corners (1st Half)_Over 4.5Odds",
+            "Total Corners (1st Half)_Under 4.5Odds",
+            "Total Corners (1st Half)_Over 5.5Odds",
+            "Total Corners (1st Half)_Under 5.5Odds",
+        ],
+    ),
+]
+
+COLUMNS = {spec.name: spec for spec in _SPECS}
+
+# High-repetition text columns handed out as pandas categoricals, coded
+# against one dictionary per season (see data_loader.season_categories).
+CATEGORICAL_COLUMNS = (
+    "country",
+    "league_name",
+    "home_team",
+    "away_team",
+    "rec_prediction",
+    "pred_outcome",
+    "FTResult",
+    "Referee",
+    *(name for name in COLUMNS if name.endswith("Label")),
+)
+
+# What the Match Analysis week overview and its filters read. Odds, referee,
+# H2H and insights columns are only needed by the single-match detail view,
+# which loads its row on demand.
+OVERVIEW_COLUMNS = (
+    "match_id",
+    "date",
+    "time",
+    "country",
+    "country_logo",
+    "league_name",
+    "home_team",
+    "away_team",
+    "home_team_logo",
+    "away_team_logo",
+    "home_rank",
+    "away_rank",
+    "rec_prediction",
+    "value_bets",
+    "confidence_score",
+    "advice",
+    "model_success_rate",
+    "pred_outcome",
+    "pred_outcome_conf",
+    "pred_alt",
+    "pred_alt_conf",
+    "all_form_home",
+    "all_form_away",
+    "goals_h",
+    "goals_a",
+    "conceded_h",
+    "conceded_a",
+    "xg_h",
+    "xg_a",
+    "xga_h",
+    "xga_a",
+    "HomeGoals",
+    "AwayGoals",
+    "Corners",
+    "YellowCards",
+    "RedCards",
+    "HomeYellowsResults",
+    "AwayYellowsResults",
+    "HomeRedsResults",
+    "AwayRedsResults",
+    # Computed on load by grading.add_grade_columns
+    "rec_prediction_grade",
+    "value_bets_grade",
+    "pred_outcome_grade",
+    "pred_alt_grade",
+)
+
+
+def columns_in_groups(columns, groups=None) -> list[str]:
+    """Known ``columns`` belonging to ``groups`` (all known columns if None)."""
+    return [
+        col
+        for col in columns
+        if col in COLUMNS and (groups is None or COLUMNS[col].group in groups)
+    ]
+
+
+def unknown_columns(columns) -> list[str]:
+    return [col for col in columns if col not in COLUMNS]
+
+
+def non_nullable_columns(columns) -> list[str]:
+    return [col for col in columns if col in COLUMNS and not COLUMNS[col].nullable]
+
+
+def column_groups(columns) -> list[str]:
+    """Sorted groups with at least one known column among ``columns``."""
+    return sorted({COLUMNS[col].group for col in columns if col in COLUMNS})
@@ -0,0 +1,731 @@
+"""Parser for the Confidence text feed (TEXT_FILE_PATH).
+
+The feed is a sequence of match blocks, each starting at a 📅 marker. Every
+line of a block is classified once by its leading character and prefix
+(``classify_line``), then its fields are pulled out with a single
+precompiled pattern or split. ``iter_feed`` reads a feed file a chunk at a
+time and yields one match per block, so memory does not grow with the
+file; ``parse_feed_parallel`` spreads the blocks of a large feed over a
+process pool. data_loader.load_data_from_text follows a feed through them
+as it grows, with Streamlit messages. ``to_week_record`` reshapes a parsed match into the
+columns of the weekly prediction files (data_loader.convert_text_feed).
+"""
+
+import hashlib
+import multiprocessing
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+BLOCK_MARKER = "📅"
+# Characters read from a feed file at a time by iter_blocks
+READ_CHARS = 1024 * 1024
+# Blocks sent to a worker process at a time by parse_feed_parallel
+PARALLEL_BATCH_BLOCKS = 1000
+
+# --- Line Kinds ---
+DATE = "date"
+LEAGUE = "league"
+TEAMS = "teams"
+EXPECTED_VALUE = "expected_value"
+ADVICE = "advice"
+VALUE_BETS = "value_bets"
+FORM = "form"
+PPG = "ppg"
+GOALS = "goals"
+CONCEDED = "conceded"
+HALVES_OVER = "halves_over"
+TEAM_GOALS = "team_goals"
+MATCH_GOALS = "match_goals"
+CLEAN_SHEETS = "clean_sheets"
+WIN_RATES = "win_rates"
+H2H_HVA_RECORD = "h2h_hva_record"
+H2H_ALL_RECORD = "h2h_all_record"
+H2H_PPG = "h2h_ppg"
+H2H_GOALS = "h2h_goals"
+H2H_OVER_UNDER = "h2h_over_under"
+HOME_INSIGHTS = "home_insights"
+AWAY_INSIGHTS = "away_insights"
+TOTAL_INSIGHTS = "total_insights"
+TEAM_INSIGHTS = "team_insights"
+CONFIDENCE = "confidence"
+PRED_OUTCOME = "pred_outcome"
+PRED_GOALS = "pred_goals"
+PRED_CORNERS = "pred_corners"
+REC_PREDICTION = "rec_prediction"
+TEXT = "text"
+
+# Line prefixes, checked longest first within the same leading character
+_PREFIXES = {
+    "📅": DATE,
+    "✨ *Expected Value*:": EXPECTED_VALUE,
+    "✨ *Advice*:": ADVICE,
+    "🎯": VALUE_BETS,
+    "📊 *H/All Form*:": FORM,
+    "📈 *PPG:": PPG,
+    "⚽ *Goals/g:": GOALS,
+    "⚽ *Conceded/g:": CONCEDED,
+    "🥅 *Halves Over 0.5:": HALVES_OVER,
+    "⚽ *Team Goals:": TEAM_GOALS,
+    "🥅 *Match Goals:": MATCH_GOALS,
+    "🧼": CLEAN_SHEETS,
+    "🏆": WIN_RATES,
+    "📉 *HvA H2H Record*:": H2H_HVA_RECORD,
+    "📉 *All H2H Record*:": H2H_ALL_RECORD,
+    "📈 *H2H PPG:": H2H_PPG,
+    "⚽ *H2H Goals Scored:": H2H_GOALS,
+    "🥅 *H2H HvA Over/Under*:": H2H_OVER_UNDER,
+    "✨ *Home Insights*:": HOME_INSIGHTS,
+    "✨ *Away Insights*:": AWAY_INSIGHTS,
+    "✨ *Total Match Insights*:": TOTAL_INSIGHTS,
+    "⚡*": TEAM_INSIGHTS,
+    "⚡": TEAMS,
+    "🎲": CONFIDENCE,
+    "Match Outcome:": PRED_OUTCOME,
+    "Over/Under Goals:": PRED_GOALS,
+    "Over/Under Corners:": PRED_CORNERS,
+    "Recommended Prediction:": REC_PREDICTION,
+}
+# Flags and emojis the feed puts in front of the country/league line
+_LEAGUE_MARKS = frozenset(
+    "🌍🌎🌏🗺️⚽🏀🏈⚾🥎🎾🏐🏉🎱🔮🎮👾🏆🥇🥈🥉🏅🎖️🏵️🎗️🎀🎁🎂🎃🎄🎅🎆🎇✨🎈🎉🎊🎋🎍🎎🎏🎐🎑🧧🎟️🎫"
+)
+# Every prefix ending in ":" has no other colon, so a line starts with it
+# exactly when the text before the line's first colon equals it: one dict
+# lookup. The rest are an emoji (⚡ and ⚡* differ in the next character).
+_KIND_BY_HEAD = {
+    prefix[:-1]: kind for prefix, kind in _PREFIXES.items() if prefix.endswith(":")
+}
+_KIND_BY_CHAR = {
+    prefix: kind for prefix, kind in _PREFIXES.items() if len(prefix) == 1
+}
+# Lines that end an insight block instead of continuing it
+_PREDICTION_KINDS = frozenset(
+    {CONFIDENCE, PRED_OUTCOME, PRED_GOALS, PRED_CORNERS, REC_PREDICTION}
+)
+# Lines that take part in the insight state; every other kind only fills
+# its own fields and goes straight to its parser
+_SECTION_KINDS = _PREDICTION_KINDS | {
+    LEAGUE,
+    TEAMS,
+    HOME_INSIGHTS,
+    AWAY_INSIGHTS,
+    TOTAL_INSIGHTS,
+    TEAM_INSIGHTS,
+    TEXT,
+}
+
+# --- Patterns ---
+_DATE_TIME = re.compile(r"📅\s*([\d/]+),\s*🕛\s*([\d:]+)")
+_LEAGUE_RANK = re.compile(r"\s*\(\s*\d+\s*\)\s*$")
+_TEAMS = re.compile(r"\*(.*?)(?:\s*\((.*?)\))?\s*v\s*(.*?)(?:\s*\((.*?)\))?\*")
+# Three independent lookaheads: each value is found wherever it sits
+_EXPECTED_VALUES = re.compile(
+    r"(?=(?:.*?H\*:\s*([\d.]+%))?)"
+    r"(?=(?:.*?D\*:\s*([\d.]+%))?)"
+    r"(?=(?:.*?A\*:\s*([\d.]+%))?)"
+)
+_PPG = re.compile(
+    r"H\*:\s*([\d.]+)\s*\|\s*All:\s*([\d.]+)\s*║\s*\*A\*:\s*([\d.]+)\s*\|\s*All:\s*([\d.]+)"
+)
+_GOALS = re.compile(
+    r"H\*:\s*([\d.]+)\s*\(xG:\s*(.*?)\)\s*\|\s*\*A\*:\s*([\d.]+)\s*\(xG:\s*(.*?)\)"
+)
+_CONCEDED = re.compile(
+    r"H\*:\s*([\d.]+)\s*\(xGA:\s*(.*?)\)\s*\|\s*\*A\*:\s*([\d.]+)\s*\(xGA:\s*(.*?)\)"
+)
+_H2H_RECORD = re.compile(r":\s*([\d\-]+)\/(\d+)")
+_TEAM_INSIGHT = re.compile(r"⚡\*(.*?)\s*\(.*?\):")
+_CONFIDENCE_SCORE = re.compile(r"Score:\s*(\d+)")
+_CONFIDENCE_SUFFIX = re.compile(r"\s*\((\d+)/10\)$")
+
+
+def empty_match() -> dict:
+    """Every field a parsed match carries, before any line is read."""
+    return {
+        "date": None,
+        "time": None,
+        "country": None,
+        "league": None,
+        "league_name": None,
+        "home_team": None,
+        "home_rank": "",
+        "away_team": None,
+        "away_rank": "",
+        "exp_val_h": None,
+        "exp_val_d": None,
+        "exp_val_a": None,
+        "advice": None,
+        "value_bets": None,
+        "form_home": None,
+        "form_away": None,
+        "ppg_h": None,
+        "ppg_h_all": None,
+        "ppg_a": None,
+        "ppg_a_all": None,
+        "goals_h": None,
+        "xg_h": None,
+        "goals_a": None,
+        "xg_a": None,
+        "conceded_h": None,
+        "xga_h": None,
+        "conceded_a": None,
+        "xga_a": None,
+        "halves_o05_h": None,
+        "halves_o05_a": None,
+        "team_goals_h": None,
+        "team_goals_a": None,
+        "match_goals_h": None,
+        "match_goals_a": None,
+        "clean_sheet_h": None,
+        "clean_sheet_a": None,
+        "win_rates_h": None,
+        "win_rates_a": None,
+        "h2h_hva_record": None,
+        "h2h_hva_games": None,
+        "h2h_all_record": None,
+        "h2h_all_games": None,
+        "h2h_hva_ppg_str": None,
+        "h2h_hva_goals_str": None,
+        "h2h_hva_ou": None,
+        "insights_home": "",
+        "insights_away": "",
+        "insights_total_h": "",
+        "insights_total_a": "",
+        "confidence_score": None,
+        "pred_outcome": None,
+        "pred_outcome_conf": None,
+        "pred_goals": None,
+        "pred_goals_conf": None,
+        "pred_corners": None,
+        "pred_corners_conf": None,
+        "rec_prediction": None,
+        "match_id": None,
+    }
+
+
+def classify_line(line) -> str:
+    """Kind of a stripped, non-empty feed line; TEXT when nothing matches.
+
+    At most two dict lookups: the text before the first colon, then the
+    leading character. A flag or emoji line no prefix claims is the
+    country/league line.
+    """
+    kind = _KIND_BY_HEAD.get(line.partition(":")[0])
+    if kind is not None:
+        return kind
+    kind = _KIND_BY_CHAR.get(line[0])
+    if kind is not None:
+        if kind == TEAMS and line[1:2] == "*":
+            return TEAM_INSIGHTS
+        return kind
+    if line[0] in _LEAGUE_MARKS:
+        return LEAGUE
+    return TEXT
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _after(line, separator):
+    """Text after the first ``separator``, stripped ("" without one)."""
+    parts = line.split(separator, 1)
+    return parts[1].strip() if len(parts) > 1 else ""
+
+
+def _parse_date(line, match) -> None:
+    m = _DATE_TIME.search(line)
+    if m:
+        match["date"], match["time"] = m.groups()
+
+
+def _parse_league(line, match) -> None:
+    parts = line.split(" ", 1)
+    if len(parts) < 2:
+        return
+    match["league"] = parts[1]
+    country_parts = parts[1].split(",", 1)
+    match["country"] = country_parts[0].strip()
+    if len(country_parts) > 1:
+        match["league_name"] = _LEAGUE_RANK.sub("", country_parts[1]).strip()
+    else:
+        match["league_name"] = match["country"]
+
+
+def _parse_teams(line, match) -> None:
+    m = _TEAMS.search(line)
+    if m:
+        (
+            match["home_team"],
+            match["home_rank"],
+            match["away_team"],
+            match["away_rank"],
+        ) = [g.strip() if g else "" for g in m.groups()]
+
+
+def _parse_expected_value(line, match) -> None:
+    m = _EXPECTED_VALUES.match(line)
+    match["exp_val_h"], match["exp_val_d"], match["exp_val_a"] = m.groups()
+
+
+def _parse_form(line, match) -> None:
+    parts = _after(line, ": ").split("//")
+    match["form_home"] = parts[0].split("║")[0].strip()
+    match["form_away"] = parts[1].split("║")[0].strip() if len(parts) > 1 else ""
+
+
+def _parse_ppg(line, match) -> None:
+    m = _PPG.search(line)
+    if m:
+        (
+            match["ppg_h"],
+            match["ppg_h_all"],
+            match["ppg_a"],
+            match["ppg_a_all"],
+        ) = [_to_float(g) for g in m.groups()]
+
+
+def _stat_pair_parser(pattern, keys):
+    """Parser for "H*: value (xG: x) | *A*: value (xG: x)" lines."""
+
+    def parse(line, match) -> None:
+        m = pattern.search(line)
+        if not m:
+            return
+        home, home_x, away, away_x = m.groups()
+        home_x = home_x.strip()
+        away_x = away_x.strip().rstrip(")")
+        match[keys[0]] = _to_float(home)
+        match[keys[1]] = _to_float(home_x) if home_x else None
+        match[keys[2]] = _to_float(away)
+        match[keys[3]] = _to_float(away_x) if away_x else None
+
+    return parse
+
+
+def _pair_parser(separator, home_key, away_key):
+    """Parser for "...: home <separator> away" lines."""
+
+    def parse(line, match) -> None:
+        parts = _after(line, ": ").split(separator)
+        match[home_key] = parts[0].strip()
+        match[away_key] = parts[1].strip() if len(parts) > 1 else None
+
+    return parse
+
+
+def _parse_clean_sheets(line, match) -> None:
+    parts = _after(line, ": ").split(" | ")
+    cs_h = parts[0].replace("*A*", "").strip()
+    cs_a = parts[1].replace("*A*", "").strip() if len(parts) > 1 else None
+    match["clean_sheet_h"] = cs_h if cs_h != "nan" else None
+    match["clean_sheet_a"] = cs_a if cs_a and cs_a != "nan" else None
+
+
+def _h2h_record_parser(scope):
+    def parse(line, match) -> None:
+        m = _H2H_RECORD.search(line)
+        if m:
+            match[f"h2h_{scope}_record"] = m.group(1)
+            match[f"h2h_{scope}_games"] = _to_int(m.group(2))
+
+    return parse
+
+
+def _text_parser(key, separator):
+    def parse(line, match) -> None:
+        match[key] = _after(line, separator)
+
+    return parse
+
+
+def _parse_confidence(line, match) -> None:
+    m = _CONFIDENCE_SCORE.search(line)
+    if m:
+        match["confidence_score"] = _to_int(m.group(1))
+
+
+def _prediction_parser(key):
+    """Parser for "<market>: <prediction> (n/10)" lines."""
+
+    def parse(line, match) -> None:
+        prediction = line.partition(":")[2]
+        m = _CONFIDENCE_SUFFIX.search(prediction)
+        if m:
+            prediction = prediction[: m.start()]
+            match[f"{key}_conf"] = _to_int(m.group(1))
+        match[key] = prediction.strip()
+
+    return parse
+
+
+# Line kind -> function filling that line's fields into the match dict
+_FIELD_PARSERS = {
+    DATE: _parse_date,
+    LEAGUE: _parse_league,
+    TEAMS: _parse_teams,
+    EXPECTED_VALUE: _parse_expected_value,
+    ADVICE: _text_parser("advice", ":"),
+    VALUE_BETS: _text_parser("value_bets", ":"),
+    FORM: _parse_form,
+    PPG: _parse_ppg,
+    GOALS: _stat_pair_parser(_GOALS, ("goals_h", "xg_h", "goals_a", "xg_a")),
+    CONCEDED: _stat_pair_parser(
+        _CONCEDED, ("conceded_h", "xga_h", "conceded_a", "xga_a")
+    ),
+    HALVES_OVER: _pair_parser(" ║ ", "halves_o05_h", "halves_o05_a"),
+    TEAM_GOALS: _pair_parser(" ║ ", "team_goals_h", "team_goals_a"),
+    MATCH_GOALS: _pair_parser(" ║ ", "match_goals_h", "match_goals_a"),
+    CLEAN_SHEETS: _parse_clean_sheets,
+    WIN_RATES: _pair_parser(" | *A*: ", "win_rates_h", "win_rates_a"),
+    H2H_HVA_RECORD: _h2h_record_parser("hva"),
+    H2H_ALL_RECORD: _h2h_record_parser("all"),
+    H2H_PPG: _text_parser("h2h_hva_ppg_str", ": "),
+    H2H_GOALS: _text_parser("h2h_hva_goals_str", ": "),
+    H2H_OVER_UNDER: _text_parser("h2h_hva_ou", ": "),
+    CONFIDENCE: _parse_confidence,
+    PRED_OUTCOME: _prediction_parser("pred_outcome"),
+    PRED_GOALS: _prediction_parser("pred_goals"),
+    PRED_CORNERS: _prediction_parser("pred_corners"),
+    REC_PREDICTION: _text_parser("rec_prediction", ":"),
+}
+
+
+def parse_block(block, index, errors=None):
+    """Match dict for one 📅 block, or None without a home team and date.
+
+    ``index`` is the block's position in the feed (the first block is 1)
+    and ends its match_id, which keeps ids unique when the same fixture is
+    listed twice. Lines that fail to parse are skipped and described in
+    ``errors`` when a list is given.
+    """
+    block = block.strip()
+    if not block.startswith(BLOCK_MARKER):
+        return None
+    match = {"raw_block": block, **empty_match()}
+    field_parsers = _FIELD_PARSERS
+    kind_by_head = _KIND_BY_HEAD
+    # Insight text runs over several lines until the next section starts
+    insight_key = None
+    insight_lines = []
+
+    def flush_insight():
+        if insight_key:
+            match[insight_key] = "\n".join(insight_lines).strip()
+
+    for line in block.split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+        # Most lines are settled by the head lookup without a call
+        kind = kind_by_head.get(line.partition(":")[0]) or classify_line(line)
+        try:
+            if kind not in _SECTION_KINDS:
+                field_parsers[kind](line, match)
+            elif kind in _PREDICTION_KINDS:
+                flush_insight()
+                insight_key, insight_lines = None, []
+                field_parsers[kind](line, match)
+            # Only the block's first ⚡ and flag lines name the teams/league
+            elif kind == TEAMS and match["home_team"] is None:
+                _parse_teams(line, match)
+            elif kind == LEAGUE and match["league"] is None:
+                _parse_league(line, match)
+            elif kind == HOME_INSIGHTS or kind == AWAY_INSIGHTS:
+                flush_insight()
+                insight_key = (
+                    "insights_home" if kind == HOME_INSIGHTS else "insights_away"
+                )
+                insight_lines = [_after(line, ":")]
+            elif kind == TOTAL_INSIGHTS:
+                flush_insight()
+                insight_key, insight_lines = None, []
+            elif kind == TEAM_INSIGHTS and (m := _TEAM_INSIGHT.match(line)):
+                flush_insight()
+                insight_key = (
+                    "insights_total_h"
+                    if m.group(1).strip() == match["home_team"]
+                    else "insights_total_a"
+                )
+                insight_lines = [_after(line, "):")]
+            elif insight_key:
+                insight_lines.append(line)
+        except Exception as e:
+            if errors is not None:
+                errors.append(f"Error parsing line in block {index}: '{line}' - {e}")
+    flush_insight()
+
+    if not (match["home_team"] and match["date"]):
+        return None
+    match["match_id"] = (
+        f"{match['home_team']}_{match['away_team']}_{match['date']}_{index}"
+    )
+    return match
+
+
+def split_blocks(content) -> list[tuple[int, str]]:
+    """(index, block) for every 📅 block in a feed, numbered from 1."""
+    pieces = content.split(BLOCK_MARKER)
+    return [(i, BLOCK_MARKER + piece) for i, piece in enumerate(pieces[1:], start=1)]
+
+
+def iter_blocks(stream, read_chars=READ_CHARS):
+    """(index, block) for every 📅 block of a text stream, read in chunks.
+
+    Same blocks and indexes as split_blocks on the whole text, but only the
+    block being read is held in memory.
+    """
+    index = 0
+    # Text before the first marker is not a block
+    in_preamble = True
+    pending = []
+    while True:
+        chunk = stream.read(read_chars)
+        if not chunk:
+            break
+        pieces = chunk.split(BLOCK_MARKER)
+        pending.append(pieces[0])
+        for piece in pieces[1:]:
+            if not in_preamble:
+                index += 1
+                yield index, BLOCK_MARKER + "".join(pending)
+            in_preamble = False
+            pending = [piece]
+    if not in_preamble:
+        yield index + 1, BLOCK_MARKER + "".join(pending)
+
+
+def iter_feed(filepath, errors=None, skipped=None):
+    """Parsed matches of a feed file, one at a time, read incrementally.
+
+    Indexes of blocks without a home team or date are appended to
+    ``skipped`` when a list is given.
+    """
+    with open(filepath, "r", encoding="utf-8") as f:
+        for index, block in iter_blocks(f):
+            match = parse_block(block, index, errors)
+            if match is not None:
+                yield match
+            elif skipped is not None:
+                skipped.append(index)
+
+
+def parse_feed(content, errors=None) -> tuple[list[dict], list[int]]:
+    """Parsed matches of a whole feed, plus the indexes of skipped blocks."""
+    matches = []
+    skipped = []
+    for index, block in split_blocks(content):
+        match = parse_block(block, index, errors)
+        if match is None:
+            skipped.append(index)
+        else:
+            matches.append(match)
+    return matches, skipped
+
+
+def _parse_batch(batch) -> tuple[list[dict], list[int], list[str]]:
+    """Worker side of parse_feed_parallel: matches, skipped and errors."""
+    matches = []
+    skipped = []
+    errors = []
+    for index, block in batch:
+        match = parse_block(block, index, errors)
+        if match is None:
+            skipped.append(index)
+        else:
+            matches.append(match)
+    return matches, skipped, errors
+
+
+def _batches(blocks, size):
+    batch = []
+    for item in blocks:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def parse_feed_parallel(
+    filepath, max_workers, errors=None, skipped=None, batch_blocks=None
+) -> list[dict]:
+    """Parsed matches of a feed file, with blocks parsed on a process pool.
+
+    The reader numbers blocks before they are sent out, so match_ids are
+    the same as a serial parse, and batches are merged in feed order. Only
+    a few batches per worker are in flight at once, which keeps memory
+    bounded by the pool size rather than the feed. Workers are spawned
+    rather than forked: the Streamlit server that calls this runs threads.
+    """
+    batch_blocks = batch_blocks or PARALLEL_BATCH_BLOCKS
+    matches = []
+
+    def collect(future):
+        batch_matches, batch_skipped, batch_errors = future.result()
+        matches.extend(batch_matches)
+        if skipped is not None:
+            skipped.extend(batch_skipped)
+        if errors is not None:
+            errors.extend(batch_errors)
+
+    with (
+        open(filepath, "r", encoding="utf-8") as f,
+        ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor,
+    ):
+        in_flight = deque()
+        for batch in _batches(iter_blocks(f), batch_blocks):
+            if len(in_flight) >= 2 * max_workers:
+                collect(in_flight.popleft())
+            in_flight.append(executor.submit(_parse_batch, batch))
+        while in_flight:
+            collect(in_flight.popleft())
+    return matches
+
+
+# --- Weekly Schema ---
+# Text fields holding "<label> <n>%" pairs -> {label: weekly column}; "{s}"
+# is the side, h or a
+_PERCENT_COLUMNS = {
+    "halves_o05_{s}": {"1H": "1h_o05_{s}", "2H": "2h_o05_{s}"},
+    "team_goals_{s}": {"O0.5": "team_goals_0_5_{s}", "O1.5": "team_goals_1_5_{s}"},
+    "match_goals_{s}": {"O1.5": "match_goals_1_5_{s}", "O2.5": "match_goals_2_5_{s}"},
+    "win_rates_{s}": {"HT": "ht_win_rates_{s}", "FT": "ft_win_rates_{s}"},
+}
+_H2H_OU_COLUMNS = {
+    "O1.5": "h2h_hva_o1_5",
+    "O2.5": "h2h_hva_o2_5",
+    "U2.5": "h2h_hva_u2_5",
+    "U3.5": "h2h_hva_u3_5",
+}
+# Fields whose name and meaning are the same in both sources
+_SHARED_FIELDS = (
+    "date",
+    "time",
+    "country",
+    "league_name",
+    "home_team",
+    "away_team",
+    "advice",
+    "value_bets",
+    "form_home",
+    "form_away",
+    "ppg_h",
+    "ppg_h_all",
+    "ppg_a",
+    "ppg_a_all",
+    "goals_h",
+    "xg_h",
+    "goals_a",
+    "xg_a",
+    "conceded_h",
+    "xga_h",
+    "conceded_a",
+    "xga_a",
+    "h2h_hva_games",
+    "h2h_all_games",
+    "insights_home",
+    "insights_away",
+    "insights_total_h",
+    "insights_total_a",
+    "pred_outcome",
+    "pred_outcome_conf",
+    "pred_goals",
+    "pred_goals_conf",
+    "pred_corners",
+    "pred_corners_conf",
+    "rec_prediction",
+)
+_PERCENT_TOKEN = re.compile(r"([A-Za-z0-9.]+)\s+(-?[\d.]+)%")
+
+
+def _fraction(value):
+    """"45.5%" -> 0.455, the scale the weekly files use; None otherwise."""
+    if not value or not value.endswith("%"):
+        return None
+    number = _to_float(value[:-1])
+    return number / 100 if number is not None else None
+
+
+def _labelled_fractions(value) -> dict:
+    return {
+        label: float(number) / 100
+        for label, number in _PERCENT_TOKEN.findall(value or "")
+    }
+
+
+def _ordinal(rank) -> str:
+    """"3" -> "3rd", as the weekly files write ranks; other text unchanged."""
+    if not rank or not rank.isdigit():
+        return rank or ""
+    number = int(rank)
+    if 10 <= number % 100 <= 20:
+        return f"{rank}th"
+    return rank + {1: "st", 2: "nd", 3: "rd"}.get(number % 10, "th")
+
+
+def _side_pair(value) -> tuple:
+    """Home and away numbers of an "x ║ y" text field."""
+    parts = (value or "").split("║")
+    if len(parts) != 2:
+        return None, None
+    return _to_float(parts[0].strip()), _to_float(parts[1].strip())
+
+
+def week_match_id(match) -> int:
+    """Integer match_id for a text match, stable across runs and processes.
+
+    The weekly files key matches by an integer fixture id, which the feed
+    does not carry; this hashes the feed's own "<home>_<away>_<date>_<i>"
+    id into 48 bits instead, small enough to survive a float64 column.
+    """
+    digest = hashlib.blake2b(match["match_id"].encode("utf-8"), digest_size=6)
+    return int.from_bytes(digest.digest(), "big")
+
+
+def to_week_record(match) -> dict:
+    """A parsed match as a row of the weekly prediction files.
+
+    Keys are weekly column names (schema.COLUMNS); percentages become
+    fractions and "a ║ b" pairs their _h/_a columns, as in the exports.
+    Fields the feed does not have (logos, odds, results, ...) are left out.
+    """
+    record = {field: match[field] for field in _SHARED_FIELDS}
+    record["match_id"] = week_match_id(match)
+    record["home_rank"] = _ordinal(match["home_rank"])
+    record["away_rank"] = _ordinal(match["away_rank"])
+    for side in ("h", "d", "a"):
+        record[f"exp_val_{side}"] = _fraction(match[f"exp_val_{side}"])
+    for side in ("h", "a"):
+        record[f"clean_sheet_{side}"] = _fraction(match[f"clean_sheet_{side}"])
+        for field, columns in _PERCENT_COLUMNS.items():
+            values = _labelled_fractions(match[field.format(s=side)])
+            for label, column in columns.items():
+                record[column.format(s=side)] = values.get(label)
+    values = _labelled_fractions(match["h2h_hva_ou"])
+    for label, column in _H2H_OU_COLUMNS.items():
+        record[column] = values.get(label)
+    for scope in ("hva", "all"):
+        h2h_record = match[f"h2h_{scope}_record"]
+        record[f"h2h_{scope}_record"] = f"({h2h_record})" if h2h_record else None
+    record["h2h_h_ppg"], record["h2h_a_ppg"] = _side_pair(match["h2h_hva_ppg_str"])
+    record["h2h_h_goals_scored"], record["h2h_a_goals_scored"] = _side_pair(
+        match["h2h_hva_goals_str"]
+    )
+    score = match["confidence_score"]
+    record["confidence_score"] = str(score) if score is not None else None
+    return record